@@ -0,0 +1,48 @@
+from typing import ClassVar, Final
+
+import pytest
+from django.core.cache import cache
+from pytest_codspeed import BenchmarkFixture
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRRequestFactory
+from dmr.throttling import Rate, SyncThrottle
+from dmr.throttling.algorithms import (
+    BaseThrottleAlgorithm,
+    GenericCellRate,
+    LeakyBucket,
+    SimpleRate,
+)
+
+# Big enough to never be rejected during benchmarks:
+_MAX_REQUESTS: Final = 1_000_000_000
+
+
+@pytest.mark.parametrize(
+    'algorithm',
+    [SimpleRate(), LeakyBucket(), GenericCellRate()],
+)
+def test_throttling_algorithm(
+    benchmark: BenchmarkFixture,
+    dmr_rf: DMRRequestFactory,
+    *,
+    algorithm: BaseThrottleAlgorithm,
+) -> None:
+    """Test throttling checks with different algorithms."""
+    cache.clear()
+
+    class _Controller(Controller[PydanticSerializer]):
+        throttling: ClassVar[list[SyncThrottle]] = [
+            SyncThrottle(_MAX_REQUESTS, Rate.day, algorithm=algorithm),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    view = _Controller.as_view()
+    request = dmr_rf.get('/whatever/')
+
+    @benchmark
+    def factory() -> None:
+        view(request)
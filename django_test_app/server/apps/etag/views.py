@@ -1,17 +1,16 @@
 from datetime import UTC, datetime
 from http import HTTPStatus
 from types import MappingProxyType
-from typing import Any, Final, final
+from typing import Final, final
 
 import pydantic
-from django.http import HttpRequest, HttpResponse
-from django.views.decorators.http import condition
 
-from dmr import Controller, HeaderSpec, Path, ResponseSpec
-from dmr.decorators import wrap_middleware
+from dmr import Controller, Path
+from dmr.conditional import ConditionalGet
 from dmr.errors import ErrorType
 from dmr.plugins.pydantic import PydanticSerializer
 from dmr.response import APIError
+from dmr.serializer import BaseSerializer
 
 
 @final
@@ -52,33 +51,17 @@ def _build_etag(user: _UserModel) -> str:
     return f'"user-{user.user_id}-{updated_at}"'
 
 
-def _etag(request: HttpRequest, user_id: int = 0, **kwargs: Any) -> str | None:
-    user = _USERS.get(user_id)
+def _etag(controller: Controller[BaseSerializer]) -> str | None:
+    user = _USERS.get(controller.kwargs['user_id'])
     return _build_etag(user) if user else None
 
 
-@wrap_middleware(
-    condition(etag_func=_etag),
-    ResponseSpec(return_type=_ResponseModel, status_code=HTTPStatus.OK),
-    ResponseSpec(
-        return_type=None,
-        status_code=HTTPStatus.NOT_MODIFIED,
-        headers={'ETag': HeaderSpec()},
-    ),
-)
-def _condition_middleware(response: HttpResponse) -> HttpResponse:
-    """Adds Content-Type for 304 responses to satisfy strict validation."""
-    if response.status_code == HTTPStatus.NOT_MODIFIED:
-        response.headers['Content-Type'] = 'application/json'
-    return response
-
-
 @final
-@_condition_middleware
 class ConditionalETagController(Controller[PydanticSerializer]):
-    responses = _condition_middleware.responses
+    # Cheap `ETag` function is evaluated before the endpoint is called:
+    conditional = ConditionalGet(etag=_etag)
 
-    def get(self, parsed_path: Path[_PathModel]) -> HttpResponse:
+    def get(self, parsed_path: Path[_PathModel]) -> _ResponseModel:
         user = _USERS.get(parsed_path.user_id)
         if user is None:
             raise APIError(
@@ -88,11 +71,9 @@ class ConditionalETagController(Controller[PydanticSerializer]):
                 ),
                 status_code=HTTPStatus.NOT_FOUND,
             )
-        return self.to_response(
-            _ResponseModel(
-                message=user.message,
-                updated_at=user.updated_at.isoformat(),
-            ),
+        return _ResponseModel(
+            message=user.message,
+            updated_at=user.updated_at.isoformat(),
         )
 
 
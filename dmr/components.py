@@ -227,6 +227,22 @@ class ComponentParser(ResponseSpecProvider):
         """
         return {}
 
+    def context_model(
+        self,
+        model: Any,
+        model_meta: tuple[Any, ...],
+    ) -> Any:
+        """
+        Provide a model to validate the context data with.
+
+        By default, context data is validated with the component's model.
+        Components that validate their data themselves
+        might return :data:`typing.Any` here.
+
+        Runs in import time.
+        """
+        return model
+
     def validate(
         self,
         controller_cls: type['Controller[BaseSerializer]'],
@@ -0,0 +1,472 @@
+import abc
+import contextlib
+import dataclasses
+import gzip
+import zlib
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from http import HTTPStatus
+from typing import TYPE_CHECKING, ClassVar, Final, Protocol, cast
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from typing_extensions import override
+
+from dmr.envs import MAX_CACHE_SIZE
+from dmr.headers import HeaderSpec
+from dmr.metadata import ResponseSpec
+
+if TYPE_CHECKING:
+    from dmr.controller import Controller
+    from dmr.serializer import BaseSerializer
+
+# Makes `zlib` to write `gzip` header and trailer:
+_GZIP_WBITS: Final = zlib.MAX_WBITS | 16  # noqa: WPS432
+
+_EMPTY_STATUSES: Final = frozenset((
+    HTTPStatus.NO_CONTENT,
+    HTTPStatus.NOT_MODIFIED,
+))
+
+
+class _BrotliCompressor(Protocol):
+    def process(self, chunk: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _CompressedStream(Protocol):
+    compressor: 'StreamCompressor | None'
+
+
+class StreamCompressor:
+    """
+    Per-connection compressor for streaming responses.
+
+    Each event is compressed and flushed right away,
+    so clients can decode events as soon as they arrive.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('_compress', '_finish', '_flush')
+
+    def __init__(
+        self,
+        *,
+        compress: Callable[[bytes], bytes],
+        flush: Callable[[], bytes],
+        finish: Callable[[], bytes],
+    ) -> None:
+        """Create the stream compressor from the compression object parts."""
+        self._compress = compress
+        self._flush = flush
+        self._finish = finish
+
+    def compress_event(self, chunk: bytes) -> bytes:
+        """Compress a single event and flush it at the event boundary."""
+        return self._compress(chunk) + self._flush()
+
+    def finish(self) -> bytes:
+        """Finish the compressed stream."""
+        return self._finish()
+
+
+class ContentEncoder(abc.ABC):
+    """
+    Base class for all content encoders.
+
+    Attributes:
+        encoding: ``Content-Encoding`` name of this encoder.
+        level: Default compression level for this encoder.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('level',)
+
+    encoding: ClassVar[str]
+
+    def __init__(self, level: int) -> None:
+        """Create the encoder with the default compression level."""
+        self.level = level
+
+    @abc.abstractmethod
+    def compress(self, body: bytes, *, level: int) -> bytes:
+        """Compress the full response body."""
+
+    @abc.abstractmethod
+    def stream_compressor(self, *, level: int) -> StreamCompressor:
+        """Create new compressor for the streaming response."""
+
+
+class GzipEncoder(ContentEncoder):
+    """``gzip`` content encoder."""
+
+    __slots__ = ()
+
+    encoding = 'gzip'
+
+    def __init__(self, level: int = 6) -> None:
+        """Use the same default level as ``gzip`` command line tool."""
+        super().__init__(level)
+
+    @override
+    def compress(self, body: bytes, *, level: int) -> bytes:
+        """Compress with zero ``mtime``, so the same body gives same bytes."""
+        return gzip.compress(body, compresslevel=level, mtime=0)
+
+    @override
+    def stream_compressor(self, *, level: int) -> StreamCompressor:
+        """Create ``zlib`` compressor that writes ``gzip`` header."""
+        return _zlib_stream_compressor(level, wbits=_GZIP_WBITS)
+
+
+class DeflateEncoder(ContentEncoder):
+    """``deflate`` content encoder."""
+
+    __slots__ = ()
+
+    encoding = 'deflate'
+
+    def __init__(self, level: int = 6) -> None:
+        """Use the same default level as ``zlib`` does."""
+        super().__init__(level)
+
+    @override
+    def compress(self, body: bytes, *, level: int) -> bytes:
+        """Compress into ``zlib`` format, as ``deflate`` coding requires."""
+        return zlib.compress(body, level)
+
+    @override
+    def stream_compressor(self, *, level: int) -> StreamCompressor:
+        """Create ``zlib`` compressor with the default window size."""
+        return _zlib_stream_compressor(level, wbits=zlib.MAX_WBITS)
+
+
+class BrotliEncoder(ContentEncoder):
+    """
+    ``br`` content encoder.
+
+    Requires ``brotli`` package to be installed.
+    """
+
+    __slots__ = ()
+
+    encoding = 'br'
+
+    def __init__(self, level: int = 4) -> None:
+        """
+        Fail early with :exc:`ImportError`, when ``brotli`` is not installed.
+
+        Default quality of ``4`` is fast enough for dynamic responses.
+        """
+        # `brotli` ships no type information, hence the ignores:
+        import brotli  # noqa: F401, PLC0415  # pyright: ignore[reportUnusedImport, reportMissingTypeStubs]
+
+        super().__init__(level)
+
+    @override
+    def compress(self, body: bytes, *, level: int) -> bytes:
+        """Compress with ``brotli`` *level* used as its quality."""
+        import brotli  # noqa: PLC0415  # pyright: ignore[reportMissingTypeStubs]
+
+        return cast(
+            'bytes',
+            brotli.compress(body, quality=level),  # pyright: ignore[reportUnknownMemberType]
+        )
+
+    @override
+    def stream_compressor(self, *, level: int) -> StreamCompressor:
+        """Create ``brotli`` compressor, which can flush after each event."""
+        import brotli  # noqa: PLC0415  # pyright: ignore[reportMissingTypeStubs]
+
+        compressor = cast(
+            '_BrotliCompressor',
+            brotli.Compressor(quality=level),  # pyright: ignore[reportUnknownMemberType]
+        )
+        return StreamCompressor(
+            compress=compressor.process,
+            flush=compressor.flush,
+            finish=compressor.finish,
+        )
+
+
+class ZstdEncoder(ContentEncoder):
+    """
+    ``zstd`` content encoder.
+
+    Requires ``zstandard`` package to be installed.
+    """
+
+    __slots__ = ()
+
+    encoding = 'zstd'
+
+    def __init__(self, level: int = 3) -> None:
+        """
+        Fail early with :exc:`ImportError`, when ``zstandard`` is missing.
+
+        Default level of ``3`` is the same as ``zstd`` library uses.
+        """
+        import zstandard  # noqa: F401, PLC0415  # pyright: ignore[reportUnusedImport]
+
+        super().__init__(level)
+
+    @override
+    def compress(self, body: bytes, *, level: int) -> bytes:
+        """Compress into a single ``zstd`` frame."""
+        import zstandard  # noqa: PLC0415
+
+        return zstandard.ZstdCompressor(level=level).compress(body)
+
+    @override
+    def stream_compressor(self, *, level: int) -> StreamCompressor:
+        """Create ``zstd`` compressor, which flushes blocks of each event."""
+        import zstandard  # noqa: PLC0415
+
+        compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        return StreamCompressor(
+            compress=compressor.compress,
+            flush=lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            finish=compressor.flush,
+        )
+
+
+def default_encoders() -> tuple[ContentEncoder, ...]:
+    """
+    Return all available encoders in the order of server's preference.
+
+    ``br`` and ``zstd`` are only used when their packages are installed.
+    """
+    encoders: list[ContentEncoder] = []
+    for encoder_type in (BrotliEncoder, ZstdEncoder):
+        with contextlib.suppress(ImportError):
+            encoders.append(encoder_type())
+    return (*encoders, GzipEncoder(), DeflateEncoder())
+
+
+class Compression:  # noqa: WPS214
+    """
+    Response compression negotiated by ``Accept-Encoding`` header.
+
+    Compresses responses after they were validated,
+    so validation always runs on the uncompressed data.
+    Regular responses are compressed as a whole.
+    Streaming responses use a per-connection compressor,
+    which is flushed after each event.
+
+    Attributes:
+        encoders: Content encoders in the order of server's preference.
+            By default, uses all available encoders: ``br`` and ``zstd``
+            when their packages are installed, ``gzip`` and ``deflate``.
+        min_size: Minimal body size in bytes to be compressed.
+            Smaller bodies are not worth compressing.
+            Does not apply to streaming responses.
+        renderer_levels: Mapping of renderer's content type
+            to its compression level. Use ``None`` as a level
+            to disable compression for this renderer.
+            Other renderers use encoder's default level.
+        streaming: Should streaming responses be compressed?
+
+    .. code:: python
+
+        >>> from dmr import Controller
+        >>> from dmr.compression import Compression
+        >>> from dmr.plugins.pydantic import PydanticSerializer
+
+        >>> class ExportController(Controller[PydanticSerializer]):
+        ...     compression = Compression(
+        ...         min_size=1024,
+        ...         renderer_levels={'application/json': 5},
+        ...     )
+        ...
+        ...     def get(self) -> list[str]:
+        ...         return ['first', 'second']
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('encoders', 'min_size', 'renderer_levels', 'streaming')
+
+    def __init__(
+        self,
+        *,
+        encoders: Sequence[ContentEncoder] | None = None,
+        min_size: int = 500,
+        renderer_levels: Mapping[str, int | None] | None = None,
+        streaming: bool = True,
+    ) -> None:
+        """Create response compression configuration."""
+        self.encoders = (
+            default_encoders() if encoders is None else tuple(encoders)
+        )
+        self.min_size = min_size
+        self.renderer_levels = renderer_levels or {}
+        self.streaming = streaming
+
+    def modify_response_spec(self, response: ResponseSpec) -> ResponseSpec:
+        """Adds ``Content-Encoding`` and ``Vary`` headers to the spec."""
+        if response.status_code in _EMPTY_STATUSES:
+            return response
+        if response.streaming and not self.streaming:
+            return response
+        return dataclasses.replace(
+            response,
+            headers={
+                'Content-Encoding': HeaderSpec(
+                    description='Response body compression',
+                    required=False,
+                ),
+                'Vary': HeaderSpec(required=False),
+                **(response.headers or {}),
+            },
+        )
+
+    def negotiate(self, request: HttpRequest) -> ContentEncoder | None:
+        """Find the best encoder for the ``Accept-Encoding`` header."""
+        accept_encoding = request.headers.get('Accept-Encoding')
+        if not accept_encoding:
+            return None
+        encoding = _negotiate_encoding(
+            accept_encoding,
+            tuple(encoder.encoding for encoder in self.encoders),
+        )
+        if encoding is None:
+            return None
+        return next(
+            encoder for encoder in self.encoders if encoder.encoding == encoding
+        )
+
+    def process_response(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        response: HttpResponseBase,
+    ) -> HttpResponseBase:
+        """Compress the response after it was validated."""
+        if response.status_code in _EMPTY_STATUSES or response.has_header(
+            'Content-Encoding',
+        ):
+            return response
+        if isinstance(response, HttpResponse):
+            return self._compress_response(controller, response)
+        if response.streaming and self.streaming:
+            return self._compress_stream(controller, response)
+        return response
+
+    def _compress_response(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        response: HttpResponse,
+    ) -> HttpResponse:
+        if len(response.content) < self.min_size:
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoder = self.negotiate(controller.request)
+        level = self._level(encoder, response['Content-Type'])
+        if encoder is None or level is None:
+            return response
+
+        compressed = encoder.compress(response.content, level=level)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        if response.has_header('Content-Length'):
+            response.headers['Content-Length'] = str(len(compressed))
+        self._set_encoding(response, encoder)
+        return response
+
+    def _compress_stream(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        response: HttpResponseBase,
+    ) -> HttpResponseBase:
+        # Only our own `StreamingResponse` supports per-event compression:
+        if not hasattr(response, 'compressor'):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoder = self.negotiate(controller.request)
+        level = self._level(encoder, response['Content-Type'])
+        if encoder is None or level is None:
+            return response
+
+        cast(
+            '_CompressedStream',
+            response,
+        ).compressor = encoder.stream_compressor(level=level)
+        self._set_encoding(response, encoder)
+        return response
+
+    def _level(
+        self,
+        encoder: ContentEncoder | None,
+        content_type: str,
+    ) -> int | None:
+        if encoder is None:
+            return None
+        media_type = content_type.partition(';')[0].strip()
+        return self.renderer_levels.get(media_type, encoder.level)
+
+    def _set_encoding(
+        self,
+        response: HttpResponseBase,
+        encoder: ContentEncoder,
+    ) -> None:
+        response.headers['Content-Encoding'] = encoder.encoding
+        # Compressed body is not byte-to-byte equal to the original one:
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = f'W/{etag}'
+
+
+def _zlib_stream_compressor(level: int, *, wbits: int) -> StreamCompressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+    return StreamCompressor(
+        compress=compressor.compress,
+        flush=lambda: compressor.flush(zlib.Z_SYNC_FLUSH),
+        finish=compressor.flush,
+    )
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _negotiate_encoding(
+    accept_encoding: str,
+    encodings: tuple[str, ...],
+) -> str | None:
+    # Headers are usually the same for all clients, so we cache the result.
+    qualities = _parse_accept_encoding(accept_encoding)
+    default_quality = qualities.get('*', 0)
+    # `max` returns the first best encoding, which respects server's order:
+    best_encoding = max(
+        encodings,
+        key=lambda encoding: qualities.get(encoding, default_quality),
+        default=None,
+    )
+    if best_encoding is None or not qualities.get(
+        best_encoding,
+        default_quality,
+    ):
+        return None
+    return best_encoding
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    qualities: dict[str, float] = {}
+    for coding_spec in accept_encoding.split(','):
+        coding, _, quality_param = coding_spec.partition(';')
+        coding = coding.strip().lower()
+        if coding:
+            qualities[coding] = _parse_quality(quality_param)
+    return qualities
+
+
+def _parse_quality(quality_param: str) -> float:
+    quality_param = quality_param.strip().lower()
+    if not quality_param.startswith('q='):
+        return 1
+    try:
+        return float(quality_param.removeprefix('q='))
+    except ValueError:
+        return 0
@@ -0,0 +1,326 @@
+import dataclasses
+import inspect
+import zlib
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from http import HTTPMethod, HTTPStatus
+from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeAlias
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from typing_extensions import override
+
+from dmr.headers import HeaderSpec
+from dmr.metadata import EndpointMetadata, ResponseSpec, ResponseSpecProvider
+from dmr.response import NotModified
+
+if TYPE_CHECKING:
+    from dmr.controller import Controller
+    from dmr.serializer import BaseSerializer
+
+#: Function to compute cheap ``ETag`` before the endpoint is called.
+ETagFunc: TypeAlias = Callable[
+    ['Controller[BaseSerializer]'],
+    'str | Awaitable[str | None] | None',
+]
+
+#: Function to compute cheap ``Last-Modified`` before the endpoint is called.
+LastModifiedFunc: TypeAlias = Callable[
+    ['Controller[BaseSerializer]'],
+    'datetime | Awaitable[datetime | None] | None',
+]
+
+_ETAG: Final = 'ETag'
+_LAST_MODIFIED: Final = 'Last-Modified'
+
+
+class ConditionalGet(ResponseSpecProvider):  # noqa: WPS214
+    """
+    Built-in support for conditional ``GET`` requests.
+
+    Sets ``ETag`` and ``Last-Modified`` headers on successful responses
+    and returns empty ``304 Not Modified`` responses,
+    when ``If-None-Match`` or ``If-Modified-Since`` request headers match.
+
+    When *etag* or *last_modified* functions are passed,
+    they are evaluated before the endpoint is called. When validators match,
+    we don't call the endpoint at all, which saves all the work
+    of querying and rendering the response.
+    Such functions must be cheap: for example, they can only select
+    ``updated_at`` column from the database.
+
+    When *etag* function is not passed, we compute ``ETag``
+    as a fast non-cryptographic hash of the rendered response body.
+    This does not save the endpoint's work, but saves the network traffic.
+
+    Only applies to ``GET`` and ``HEAD`` endpoints.
+
+    Attributes:
+        etag: Optional function to compute ``ETag``
+            from the controller before the endpoint is called.
+            Can be async for async endpoints.
+        last_modified: Optional function to compute ``Last-Modified``
+            from the controller before the endpoint is called.
+            Can be async for async endpoints.
+        hash_body: Should we compute ``ETag`` from the rendered body,
+            when *etag* function is not passed or returns ``None``?
+        weak: Should computed ``ETag`` values be weak?
+
+    .. code:: python
+
+        >>> from dmr import Controller
+        >>> from dmr.conditional import ConditionalGet
+        >>> from dmr.plugins.pydantic import PydanticSerializer
+
+        >>> class ArticleController(Controller[PydanticSerializer]):
+        ...     conditional = ConditionalGet()
+        ...
+        ...     def get(self) -> list[str]:
+        ...         return ['first', 'second']
+
+    .. versionadded:: 0.15.0
+
+    .. seealso::
+
+        https://developer.mozilla.org/en-US/docs/Web/HTTP/Guides/Conditional_requests
+
+    """
+
+    __slots__ = ('etag', 'hash_body', 'last_modified', 'weak')
+
+    #: HTTP methods that support conditional requests.
+    supported_methods: ClassVar[frozenset[str]] = frozenset((
+        HTTPMethod.GET.value.lower(),
+        HTTPMethod.HEAD.value.lower(),
+    ))
+
+    def __init__(
+        self,
+        *,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
+        hash_body: bool = True,
+        weak: bool = False,
+    ) -> None:
+        """Create conditional requests support."""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.hash_body = hash_body
+        self.weak = weak
+
+    def __call__(self, controller: 'Controller[BaseSerializer]') -> None:
+        """
+        Evaluate cheap validators before the endpoint is called.
+
+        Raises:
+            NotModified: when validators match.
+
+        """
+        etag = None if self.etag is None else self.etag(controller)
+        last_modified = (
+            None
+            if self.last_modified is None
+            else self.last_modified(controller)
+        )
+        self._check_validators(
+            controller,
+            etag,  # type: ignore[arg-type]
+            last_modified,  # type: ignore[arg-type]
+        )
+
+    async def acall(self, controller: 'Controller[BaseSerializer]') -> None:
+        """
+        Evaluate cheap validators before the async endpoint is called.
+
+        Raises:
+            NotModified: when validators match.
+
+        """
+        etag = await _maybe_await(
+            None if self.etag is None else self.etag(controller),
+        )
+        last_modified = await _maybe_await(
+            None
+            if self.last_modified is None
+            else self.last_modified(controller),
+        )
+        self._check_validators(controller, etag, last_modified)
+
+    @property
+    def is_async(self) -> bool:
+        """Are any of the validator functions async?"""
+        return any(
+            inspect.iscoroutinefunction(validator_func)
+            for validator_func in (self.etag, self.last_modified)
+        )
+
+    @override
+    def provide_response_specs(
+        self,
+        metadata: EndpointMetadata,
+        controller_cls: type['Controller[BaseSerializer]'],
+        existing_responses: Mapping[HTTPStatus, ResponseSpec],
+    ) -> list[ResponseSpec]:
+        """Provides ``304`` response."""
+        return self._add_new_response(
+            ResponseSpec(
+                None,
+                status_code=HTTPStatus.NOT_MODIFIED,
+                headers=self.headers_spec(),
+                description='Raised when conditional request validators match',
+            ),
+            existing_responses,
+        )
+
+    def headers_spec(self) -> dict[str, HeaderSpec]:
+        """Headers that can be set by this conditional instance."""
+        headers_spec: dict[str, HeaderSpec] = {}
+        if self.etag is not None or self.hash_body:
+            headers_spec[_ETAG] = HeaderSpec(
+                description='Identifier for a specific version of a resource',
+                required=False,
+            )
+        if self.last_modified is not None:
+            headers_spec[_LAST_MODIFIED] = HeaderSpec(
+                description='Date and time when the resource was modified',
+                required=False,
+            )
+        return headers_spec
+
+    def modify_response_spec(self, response: ResponseSpec) -> ResponseSpec:
+        """Adds validator headers to the successful response spec."""
+        if response.status_code != HTTPStatus.OK or response.streaming:
+            return response
+        return dataclasses.replace(
+            response,
+            headers={**self.headers_spec(), **(response.headers or {})},
+        )
+
+    def process_response(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        response: HttpResponseBase,
+    ) -> HttpResponseBase:
+        """
+        Add validator headers to the response after it was validated.
+
+        Returns ``304`` response instead,
+        when validators computed from the response body match.
+        """
+        if response.status_code != HTTPStatus.OK or not isinstance(
+            response,
+            HttpResponse,
+        ):
+            return response
+
+        headers: dict[str, str] = getattr(
+            controller.request,
+            '__dmr_conditional__',
+            {},
+        )
+        for header_name, header_value in headers.items():
+            response.headers.setdefault(header_name, header_value)
+        if self.hash_body and _ETAG not in response.headers:
+            response.headers[_ETAG] = self.compute_etag(response.content)
+
+        validators = {
+            validator: response.headers[validator]
+            for validator in (_ETAG, _LAST_MODIFIED)
+            if validator in response.headers
+        }
+        if self.is_not_modified(controller.request, validators):
+            return controller.to_response(
+                None,
+                status_code=HTTPStatus.NOT_MODIFIED,
+                headers=validators,
+            )
+        return response
+
+    def compute_etag(self, body: bytes) -> str:
+        """
+        Compute ``ETag`` from the rendered response body.
+
+        We use fast non-cryptographic ``crc32`` hash with the body length.
+        Override this method to use a different hash.
+        """
+        length = format(len(body), 'x')
+        checksum = format(zlib.crc32(body), '08x')
+        etag = f'"{length}-{checksum}"'
+        return f'W/{etag}' if self.weak else etag
+
+    def is_not_modified(
+        self,
+        request: HttpRequest,
+        validators: Mapping[str, str],
+    ) -> bool:
+        """
+        Check request conditional headers against the response validators.
+
+        ``If-Modified-Since`` is only checked
+        when ``If-None-Match`` is not present.
+        """
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            etag = validators.get(_ETAG)
+            if etag is None:
+                return False
+            return _etag_matches(etag, parse_etags(if_none_match))
+
+        return _not_modified_since(
+            validators.get(_LAST_MODIFIED),
+            request.headers.get('If-Modified-Since'),
+        )
+
+    def _check_validators(
+        self,
+        controller: 'Controller[BaseSerializer]',
+        etag: str | None,
+        last_modified: datetime | None,
+    ) -> None:
+        headers: dict[str, str] = {}
+        if etag is not None:
+            headers[_ETAG] = _quote_etag(etag)
+        if last_modified is not None:
+            headers[_LAST_MODIFIED] = http_date(last_modified.timestamp())
+        # We save computed validators to reuse them in the response:
+        controller.request.__dmr_conditional__ = headers  # type: ignore[attr-defined]
+        if headers and self.is_not_modified(controller.request, headers):
+            raise NotModified(headers=headers)
+
+
+async def _maybe_await(maybe_awaitable: Any) -> Any:
+    if inspect.isawaitable(maybe_awaitable):
+        return await maybe_awaitable
+    return maybe_awaitable
+
+
+def _quote_etag(etag: str) -> str:
+    if etag.startswith(('"', 'W/"')) and etag.endswith('"'):
+        return etag
+    return f'"{etag}"'
+
+
+def _etag_matches(etag: str, if_none_match: list[str]) -> bool:
+    # `If-None-Match` uses weak comparison:
+    # https://datatracker.ietf.org/doc/html/rfc9110#section-13.1.2
+    if '*' in if_none_match:
+        return True
+    etag = etag.removeprefix('W/')
+    return any(
+        candidate.removeprefix('W/') == etag for candidate in if_none_match
+    )
+
+
+def _not_modified_since(
+    last_modified: str | None,
+    if_modified_since: str | None,
+) -> bool:
+    if last_modified is None or if_modified_since is None:
+        return False
+    modified_since = parse_http_date_safe(if_modified_since)
+    last_modified_at = parse_http_date_safe(last_modified)
+    return (
+        modified_since is not None
+        and last_modified_at is not None
+        and last_modified_at <= modified_since
+    )
@@ -11,6 +11,8 @@ from django.views.decorators.csrf import csrf_exempt
 from typing_extensions import Sentinel, deprecated, override
 
 from dmr import throttling as dmr_throttling
+from dmr.compression import Compression
+from dmr.conditional import ConditionalGet
 from dmr.cookies import NewCookie
 from dmr.endpoint import Endpoint
 from dmr.errors import ErrorModel, ErrorType, format_error
@@ -105,6 +107,12 @@ class Controller(View, Generic[_SerializerT_co]):  # noqa: WPS214
             Set it to ``None`` to disable throttling of this controller.
         throttling_allow_unsafe_cache: Should this controller allow
             unsafe throttle Django cache backends?
+        conditional: Conditional ``GET`` requests support
+            for ``GET`` and ``HEAD`` endpoints of this controller.
+            See :class:`dmr.conditional.ConditionalGet`.
+        compression: Response compression for this controller.
+            See :class:`dmr.compression.Compression`.
+            Set it to ``None`` to disable compression of this controller.
         error_model: Schema type that represents
             and validates common error responses.
         is_abstract: Whether or not this controller is abstract.
@@ -160,6 +168,8 @@ class Controller(View, Generic[_SerializerT_co]):  # noqa: WPS214
         | None
     ] = ()
     throttling_allow_unsafe_cache: ClassVar[bool | Sentinel | None] = EMPTY
+    conditional: ClassVar[ConditionalGet | None] = None
+    compression: ClassVar[Compression | Sentinel | None] = EMPTY
     error_model: ClassVar[Any] = ErrorModel
     is_abstract: ClassVar[bool] = True
     is_async: ClassVar[bool | None] = None  # `None` means that nothing's found
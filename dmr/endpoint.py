@@ -10,6 +10,8 @@ from django.http import HttpResponse, HttpResponseBase
 from django.urls import URLPattern
 from typing_extensions import ParamSpec, Sentinel, TypeVar
 
+from dmr.compression import Compression
+from dmr.conditional import ConditionalGet
 from dmr.cookies import CookieSpec, NewCookie
 from dmr.errors import AsyncErrorHandler, SyncErrorHandler
 from dmr.exceptions import (
@@ -39,7 +41,7 @@ from dmr.openapi.objects import (
 )
 from dmr.parsers import Parser
 from dmr.renderers import Renderer
-from dmr.response import APIError, RedirectTo
+from dmr.response import APIError, NotModified, RedirectTo
 from dmr.security.base import AsyncAuth, SyncAuth
 from dmr.serializer import BaseSerializer
 from dmr.settings import HttpSpec, Settings, resolve_setting
@@ -363,7 +365,7 @@ class Endpoint:  # noqa: WPS214
 
                 # Return response:
                 func_result = await func(controller, **context)
-            except (APIError, RedirectTo) as exc:
+            except (APIError, RedirectTo, NotModified) as exc:
                 func_result = controller.to_error(
                     exc.raw_data,
                     status_code=exc.status_code,
@@ -399,7 +401,7 @@ class Endpoint:  # noqa: WPS214
 
                 # Return response:
                 func_result = func(controller, **context)
-            except (APIError, RedirectTo) as exc:
+            except (APIError, RedirectTo, NotModified) as exc:
                 func_result = controller.to_error(
                     exc.raw_data,
                     status_code=exc.status_code,
@@ -424,16 +426,18 @@ class Endpoint:  # noqa: WPS214
         self._run_auth(controller)
         # Second round of throttling:
         self._run_throttle_after(controller)
+        # Conditional requests:
+        if self.metadata.conditional is not None:
+            self.metadata.conditional(controller)
 
     def _run_throttle_before(
         self,
         controller: 'Controller[BaseSerializer]',
     ) -> None:
-        if self.metadata.throttling_before_auth is None:
+        if self.metadata.throttle_groups_before_auth is None:
             return
-        for throttle in self.metadata.throttling_before_auth:
-            assert isinstance(throttle, SyncThrottle)  # noqa: S101
-            throttle(self, controller, self._sync_lock)
+        for throttle_group in self.metadata.throttle_groups_before_auth:
+            throttle_group(self, controller, self._sync_lock)
 
     def _run_auth(self, controller: 'Controller[BaseSerializer]') -> None:
         if self.metadata.auth is None:
@@ -450,11 +454,10 @@ class Endpoint:  # noqa: WPS214
         self,
         controller: 'Controller[BaseSerializer]',
     ) -> None:
-        if self.metadata.throttling_after_auth is None:
+        if self.metadata.throttle_groups_after_auth is None:
             return
-        for throttle in self.metadata.throttling_after_auth:
-            assert isinstance(throttle, SyncThrottle)  # noqa: S101
-            throttle(self, controller, self._sync_lock)
+        for throttle_group in self.metadata.throttle_groups_after_auth:
+            throttle_group(self, controller, self._sync_lock)
 
     # Async checks:
 
@@ -470,17 +473,24 @@ class Endpoint:  # noqa: WPS214
         await self._run_async_auth(controller)
         # Second round of throttling:
         await self._run_async_throttle_after(controller)
+        # Conditional requests:
+        if self.metadata.conditional is not None:
+            await self.metadata.conditional.acall(controller)
 
     async def _run_async_throttle_before(
         self,
         controller: 'Controller[BaseSerializer]',
     ) -> None:
-        if self.metadata.throttling_before_auth is None:
+        if self.metadata.throttle_groups_before_auth is None:
             return
-        for throttle in self.metadata.throttling_before_auth:
-            assert isinstance(throttle, AsyncThrottle)  # noqa: S101
-            # We have to check them in sync one by one :(
-            await throttle(self, controller, self._async_lock)  # noqa: WPS476
+        for throttle_group in self.metadata.throttle_groups_before_auth:
+            # Groups are checked one by one, throttles in a group are
+            # checked together:
+            await throttle_group.acall(  # noqa: WPS476
+                self,
+                controller,
+                self._async_lock,
+            )
 
     async def _run_async_auth(
         self,
@@ -500,12 +510,16 @@ class Endpoint:  # noqa: WPS214
         self,
         controller: 'Controller[BaseSerializer]',
     ) -> None:
-        if self.metadata.throttling_after_auth is None:
+        if self.metadata.throttle_groups_after_auth is None:
             return
-        for throttle in self.metadata.throttling_after_auth:
-            assert isinstance(throttle, AsyncThrottle)  # noqa: S101
-            # We have to check them in sync one by one :(
-            await throttle(self, controller, self._async_lock)  # noqa: WPS476
+        for throttle_group in self.metadata.throttle_groups_after_auth:
+            # Groups are checked one by one, throttles in a group are
+            # checked together:
+            await throttle_group.acall(  # noqa: WPS476
+                self,
+                controller,
+                self._async_lock,
+            )
 
     # Utils:
 
@@ -521,7 +535,7 @@ class Endpoint:  # noqa: WPS214
         just validates it before returning.
         """
         try:
-            return self._validate_response(controller, raw_data)
+            response = self._validate_response(controller, raw_data)
         except (  # noqa: WPS239
             ResponseSchemaError,
             ValidationError,
@@ -537,6 +551,14 @@ class Endpoint:  # noqa: WPS214
                 controller.format_error(exc),
                 status_code=exc.status_code,
             )
+        if self.metadata.conditional is not None:
+            response = self.metadata.conditional.process_response(
+                controller,
+                response,
+            )
+        if self.metadata.compression is None:
+            return response
+        return self.metadata.compression.process_response(controller, response)
 
     def _validate_response(
         self,
@@ -611,6 +633,8 @@ def validate(  # noqa: WPS234
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -643,6 +667,8 @@ def validate(
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -675,6 +701,8 @@ def validate(
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -706,6 +734,8 @@ def validate(  # noqa: WPS211  # pyright: ignore[reportInconsistentOverload]
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -799,6 +829,13 @@ def validate(  # noqa: WPS211  # pyright: ignore[reportInconsistentOverload]
             Set it to ``None`` to disable throttling of this endpoint.
         throttling_allow_unsafe_cache: Should this controller allow
             unsafe throttle Django cache backends?
+        conditional: Conditional ``GET`` requests support
+            for this endpoint. See :class:`dmr.conditional.ConditionalGet`.
+            Set it to ``None`` to disable conditional requests
+            of this endpoint.
+        compression: Response compression for this endpoint.
+            See :class:`dmr.compression.Compression`.
+            Set it to ``None`` to disable compression of this endpoint.
         summary: A short summary of what the operation does.
         description: A verbose explanation of the operation behavior.
         tags: A list of tags for API documentation control.
@@ -838,6 +875,8 @@ def validate(  # noqa: WPS211  # pyright: ignore[reportInconsistentOverload]
             auth=auth,
             throttling=throttling,
             throttling_allow_unsafe_cache=throttling_allow_unsafe_cache,
+            conditional=conditional,
+            compression=compression,
             summary=summary,
             description=description,
             tags=tags,
@@ -871,6 +910,8 @@ def modify(
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -903,6 +944,8 @@ def modify(
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -936,6 +979,8 @@ def modify(
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -968,6 +1013,8 @@ def modify(  # noqa: WPS211
     auth: Sequence[AsyncAuth] | Sequence[SyncAuth] | None = (),
     throttling: _ThrottlingDef = (),
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY,
+    conditional: ConditionalGet | Sentinel | None = EMPTY,
+    compression: Compression | Sentinel | None = EMPTY,
     summary: str | None = None,
     description: str | None = None,
     tags: list[str] | None = None,
@@ -1045,6 +1092,13 @@ def modify(  # noqa: WPS211
             Set it to ``None`` to disable throttling of this endpoint.
         throttling_allow_unsafe_cache: Should this endpoint allow
             unsafe throttle Django cache backends?
+        conditional: Conditional ``GET`` requests support
+            for this endpoint. See :class:`dmr.conditional.ConditionalGet`.
+            Set it to ``None`` to disable conditional requests
+            of this endpoint.
+        compression: Response compression for this endpoint.
+            See :class:`dmr.compression.Compression`.
+            Set it to ``None`` to disable compression of this endpoint.
         summary: A short summary of what the operation does.
         description: A verbose explanation of the operation behavior.
         tags: A list of tags for API documentation control.
@@ -1090,6 +1144,8 @@ def modify(  # noqa: WPS211
             auth=auth,
             throttling=throttling,
             throttling_allow_unsafe_cache=throttling_allow_unsafe_cache,
+            conditional=conditional,
+            compression=compression,
             summary=summary,
             description=description,
             tags=tags,
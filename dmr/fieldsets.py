@@ -0,0 +1,331 @@
+import operator
+import types
+from collections.abc import Mapping
+from functools import lru_cache, reduce
+from typing import (  # noqa: WPS235
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Generic,
+    TypeAlias,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from typing_extensions import TypedDict, override
+
+from dmr.components import ComponentParser
+from dmr.envs import MAX_CACHE_SIZE
+from dmr.exceptions import EndpointMetadataError, RequestSerializationError
+from dmr.metadata import EndpointMetadata
+from dmr.openapi.objects import (
+    OpenAPIType,
+    Parameter,
+    Reference,
+    RequestBody,
+    Schema,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from dmr.controller import Controller
+    from dmr.endpoint import Endpoint
+    from dmr.openapi.core.context import OpenAPIContext
+    from dmr.serializer import BaseSerializer
+
+_ModelT = TypeVar('_ModelT')
+_QuerySetT = TypeVar('_QuerySetT', bound='QuerySet[Any, Any]')
+
+
+class Fieldset(Generic[_ModelT]):
+    """
+    Fields of the response model requested by the client.
+
+    Is passed to the endpoint as ``parsed_fields`` parameter,
+    when :data:`Fields` component is used.
+
+    Attributes:
+        names: Requested field names in the response model's order.
+            Contains all model's fields when nothing was requested.
+        model: Response model these fields belong to.
+        is_sparse: Were only some of the fields requested?
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('is_sparse', 'model', 'names')
+
+    def __init__(
+        self,
+        names: tuple[str, ...],
+        *,
+        model: Any,
+        is_sparse: bool,
+    ) -> None:
+        """Create the fieldset."""
+        self.names = names
+        self.model = model
+        self.is_sparse = is_sparse
+
+    def __contains__(self, field_name: object) -> bool:
+        """Was this field requested?"""
+        return field_name in self.names
+
+    def only(self, queryset: _QuerySetT) -> _QuerySetT:
+        """
+        Load only requested fields from the database.
+
+        Does nothing when all fields are requested.
+        Response field names must be the same as model field names.
+        """
+        if not self.is_sparse:
+            return queryset
+        return queryset.only(*self.names)
+
+    def values(  # noqa: WPS110
+        self,
+        queryset: 'QuerySet[Any, Any]',
+    ) -> 'QuerySet[Any, Any]':
+        """
+        Select only requested fields as dicts, without model instances.
+
+        Response field names must be the same as model field names.
+        Typed as :data:`typing.Any` items,
+        because these dicts are returned in place of the response model.
+        """
+        return queryset.values(*self.names)
+
+    def pick(self, instance: Any) -> Any:
+        """
+        Pick only requested fields from a mapping or an object into a dict.
+
+        Typed as :data:`typing.Any`,
+        because this dict is returned in place of the response model.
+        """
+        if isinstance(instance, Mapping):
+            mapping = cast('Mapping[str, Any]', instance)
+            return {name: mapping[name] for name in self.names}
+        return {name: getattr(instance, name) for name in self.names}
+
+    def project(self, return_type: Any) -> Any:
+        """
+        Replace the response model in *return_type* with requested fields.
+
+        Works when *return_type* is the response model
+        or has it as a type argument, like ``list[Model]``.
+        The response model is replaced with a typed dict
+        of the requested fields, which is cached per fieldset.
+        Returns *return_type* as is for full fieldsets
+        and for types without the response model.
+        """
+        if not self.is_sparse:
+            return return_type
+        return _replace_model(
+            return_type,
+            self.model,
+            _projected_model(self.model, self.names),
+        )
+
+
+class FieldsComponent(ComponentParser):
+    """
+    Parses sparse fieldsets of the response model from the query.
+
+    For example:
+
+    .. code:: python
+
+        >>> import pydantic
+        >>> from django.contrib.auth.models import User
+        >>> from dmr import Controller
+        >>> from dmr.fieldsets import Fields
+        >>> from dmr.plugins.pydantic import PydanticSerializer
+
+        >>> class UserModel(pydantic.BaseModel):
+        ...     id: int
+        ...     username: str
+        ...     email: str
+
+        >>> class UserListController(Controller[PydanticSerializer]):
+        ...     def get(
+        ...         self,
+        ...         parsed_fields: Fields[UserModel],
+        ...     ) -> list[UserModel]:
+        ...         return list(parsed_fields.values(User.objects.all()))
+
+    Will parse a request like ``?fields=id,username``
+    into :class:`Fieldset` with ``('id', 'username')`` names.
+    Unknown field names are rejected with ``400`` response.
+    All fields are selected when ``fields`` is not passed.
+
+    When only some fields are requested, responses that are described
+    with the response model, like ``list[Model]``, are validated
+    against the projected model with only these fields,
+    see :meth:`Fieldset.project`. Only the requested fields are rendered,
+    other keys of the returned dicts are dropped.
+    Endpoint can load only the requested fields from the database,
+    and return them as dicts without building full model instances,
+    see :meth:`Fieldset.values` and :meth:`Fieldset.pick`.
+
+    Field names are the response model's attribute names, not aliases.
+    Parameter for ``Fields`` component must be named ``parsed_fields``.
+
+    Attributes:
+        param_name: Name of the query parameter with comma separated fields.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('param_name',)
+    context_name: ClassVar[str] = 'parsed_fields'
+
+    def __init__(self, param_name: str = 'fields') -> None:
+        """Provide the query parameter name."""
+        self.param_name = param_name
+
+    @override
+    def context_model(
+        self,
+        model: Any,
+        model_meta: tuple[Any, ...],
+    ) -> Any:
+        """
+        Validate the response model's fields in import time.
+
+        Requested fields are validated by this component itself.
+        """
+        field_names(_response_model(model))
+        return Any
+
+    @override
+    def provide_context_data(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        *,
+        field_model: Any,
+    ) -> Fieldset[Any]:
+        model = _response_model(field_model)
+        all_names = field_names(model)
+        requested = {
+            field_name.strip()
+            for query_value in controller.request.GET.getlist(self.param_name)
+            for field_name in query_value.split(',')
+        }
+        requested.discard('')
+        if not requested:
+            return Fieldset(all_names, model=model, is_sparse=False)
+
+        unknown = requested.difference(all_names)
+        if unknown:
+            raise RequestSerializationError(
+                f'Unknown fields {sorted(unknown)!r} requested, '
+                f'allowed: {list(all_names)!r}',
+            )
+        fieldset: Fieldset[Any] = Fieldset(
+            tuple(name for name in all_names if name in requested),
+            model=model,
+            is_sparse=len(requested) < len(all_names),
+        )
+        if fieldset.is_sparse:
+            # Response validation uses it to project the response body:
+            controller.request.__dmr_fieldset__ = fieldset  # type: ignore[attr-defined]
+        return fieldset
+
+    @override
+    def get_schema(
+        self,
+        model: Any,
+        model_meta: tuple[Any, ...],
+        metadata: EndpointMetadata,
+        serializer: type['BaseSerializer'],
+        context: 'OpenAPIContext',
+    ) -> list[Parameter | Reference] | RequestBody:
+        return [
+            Parameter(
+                name=self.param_name,
+                param_in='query',
+                description='Comma separated response fields to return',
+                style='form',
+                explode=False,
+                schema=Schema(
+                    type=OpenAPIType.ARRAY,
+                    items=Schema(
+                        type=OpenAPIType.STRING,
+                        enum=list(field_names(_response_model(model))),
+                    ),
+                    unique_items=True,
+                ),
+            ),
+        ]
+
+
+Fields: TypeAlias = Annotated[Fieldset[_ModelT], FieldsComponent()]
+"""Annotated alias for parsing sparse fieldsets."""
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def field_names(model: Any) -> tuple[str, ...]:
+    """
+    Return public field names of the model.
+
+    Works with any annotated model type: pydantic models, msgspec structs,
+    dataclasses, typed dicts, etc.
+
+    Raises:
+        EndpointMetadataError: When the model has no fields.
+
+    .. versionadded:: 0.15.0
+    """
+    names = tuple(
+        field_name
+        for field_name, annotation in get_type_hints(model).items()
+        if not field_name.startswith('_')
+        and get_origin(annotation) is not ClassVar
+    )
+    if not names:
+        raise EndpointMetadataError(
+            f'Sparse fieldsets require a model with fields, got {model!r}',
+        )
+    return names
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _projected_model(model: Any, names: tuple[str, ...]) -> Any:
+    # Fields keep their annotations from the model, all of them are required:
+    type_hints = get_type_hints(model, include_extras=True)
+    # Type checkers only support typed dicts with literal fields:
+    return cast('Any', TypedDict)(
+        f'{model.__name__}Fieldset',
+        {field_name: type_hints[field_name] for field_name in names},
+    )
+
+
+def _response_model(fieldset_type: Any) -> Any:
+    type_args = get_args(fieldset_type)
+    if not type_args or isinstance(type_args[0], TypeVar):
+        raise EndpointMetadataError(
+            f'Sparse fieldsets require a concrete model, got {fieldset_type!r}',
+        )
+    return type_args[0]
+
+
+def _replace_model(type_hint: Any, model: Any, projected: Any) -> Any:
+    if type_hint is model:
+        return projected
+    type_args = get_args(type_hint)
+    new_args = tuple(
+        _replace_model(type_arg, model, projected) for type_arg in type_args
+    )
+    if all(map(operator.is_, new_args, type_args)):
+        return type_hint
+    origin: Any = get_origin(type_hint)
+    if origin is types.UnionType:
+        # `X | Y` unions can't be subscripted:
+        return reduce(operator.or_, new_args)  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
+    return origin[new_args]
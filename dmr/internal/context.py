@@ -115,7 +115,10 @@ class SerializerContext:
         content_type_overrides: _ContentTypeOverrides = defaultdict(dict)
 
         for component, model_type, model_meta in self.component_parsers:
-            type_map[component.context_name] = model_type
+            type_map[component.context_name] = component.context_model(
+                model_type,
+                model_meta,
+            )
             specs[component] = model_type
             for content_type, model in component.conditional_types(
                 model_type,
@@ -1,7 +1,8 @@
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Final, final
+from typing import TYPE_CHECKING, Any, Final, final
 
-from django.http import HttpRequest
+from django.core.signals import setting_changed
+from django.http import HttpRequest, HttpResponse
 from django.middleware.csrf import CsrfViewMiddleware
 from django.utils.translation import gettext_lazy as _
 
@@ -11,6 +12,16 @@ if TYPE_CHECKING:
 
 _CSRF_FAILED_MSG: Final = _('CSRF Failed: {reason}')
 
+# Methods that are defined as "safe" by RFC 9110, Django does the same:
+_SAFE_METHODS: Final = frozenset(('GET', 'HEAD', 'OPTIONS', 'TRACE'))
+
+# Django builds these from `CSRF_TRUSTED_ORIGINS` as cached properties:
+_TRUSTED_ORIGINS_PROPERTIES: Final = (
+    'allowed_origin_subdomains',
+    'allowed_origins_exact',
+    'csrf_trusted_origins_hosts',
+)
+
 
 @final
 class _EnsureCsrfToken(CsrfViewMiddleware):
@@ -18,18 +29,47 @@ class _EnsureCsrfToken(CsrfViewMiddleware):
     CSRF check middleware that returns the rejection reason.
 
     Used for checking CSRF tokens manually.
+    It does not store any request state, so a single instance is shared
+    by all requests and trusted origins are only parsed once.
     """
 
+    def __init__(self) -> None:
+        # It is never called, we only use the checks:
+        super().__init__(lambda _: HttpResponse())
+
+    def failure_reason(self, request: HttpRequest) -> str | None:
+        """Return the rejection reason, or ``None`` if the check passed."""
+        # `CsrfViewMiddleware` might have already prepared this request:
+        if 'CSRF_COOKIE' not in request.META:
+            self.process_request(request)
+        if request.method in _SAFE_METHODS:
+            return None
+        return self.process_view(request, None, (), {})  # type: ignore[arg-type, return-value]
+
+    def reset_trusted_origins(self) -> None:
+        """Drop parsed trusted origins, they will be parsed again."""
+        for property_name in _TRUSTED_ORIGINS_PROPERTIES:
+            self.__dict__.pop(property_name, None)
+
     def _reject(self, request: HttpRequest, reason: str) -> str:
         # Return the failure reason instead of an ``HttpResponse``.
         return reason
 
 
+_csrf_check: Final = _EnsureCsrfToken()
+
+
+def _reset_csrf_check(*, setting: str, **kwargs: Any) -> None:
+    if setting == 'CSRF_TRUSTED_ORIGINS':
+        _csrf_check.reset_trusted_origins()
+
+
+setting_changed.connect(_reset_csrf_check)
+
+
 def _get_csrf_failure_reason(request: HttpRequest) -> str | None:
-    """Perform CSRF validation using ``_EnsureCsrfToken``."""
-    check = _EnsureCsrfToken(lambda _: None)  # type: ignore[arg-type]
-    check.process_request(request)
-    return check.process_view(request, None, (), {})  # type: ignore[arg-type, return-value]
+    """Perform CSRF validation using the shared ``_EnsureCsrfToken``."""
+    return _csrf_check.failure_reason(request)
 
 
 def ensure_csrf(controller: 'Controller[BaseSerializer]') -> None:
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from contextlib import aclosing, closing, nullcontext
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -61,3 +61,10 @@ def maybe_aclosing(
         if hasattr(streaming_content, 'aclose')
         else nullcontext()
     )
+
+
+def maybe_closing(
+    iterable: Iterable[Any],
+) -> closing[Any] | nullcontext[Any]:
+    """Close the sync iterator if it supports closing."""
+    return closing(iterable) if hasattr(iterable, 'close') else nullcontext()
@@ -0,0 +1,81 @@
+import threading
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar, final
+
+_KeyT = TypeVar('_KeyT')
+_ValueT = TypeVar('_ValueT')
+
+
+@final
+class TTLCache(Generic[_KeyT, _ValueT]):
+    """
+    Bounded in-process cache where each item has its own expiration time.
+
+    Expiration times are unix timestamps, like the ones in tokens.
+    When the cache is full, expired items are dropped first,
+    and then the oldest ones.
+    Instances are shared between threads, so all access is locked.
+    """
+
+    __slots__ = ('_entries', '_lock', 'maxsize')
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache that holds up to *maxsize* items."""
+        self.maxsize = maxsize
+        self._entries: dict[_KeyT, tuple[_ValueT, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _KeyT) -> _ValueT | None:
+        """Return the cached value, if it is present and not expired."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            cached_value, expires_at = cached
+            if expires_at <= time.time():
+                self._entries.pop(key, None)
+                return None
+            return cached_value
+
+    def set(
+        self,
+        key: _KeyT,
+        cached_value: _ValueT,
+        *,
+        expires_at: float,
+    ) -> None:
+        """Cache *cached_value* until *expires_at* unix timestamp."""
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._prune()
+            self._entries[key] = (cached_value, expires_at)
+
+    def pop(self, key: _KeyT) -> None:
+        """Drop the cached value, if it is present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[_ValueT], bool]) -> None:
+        """Drop all cached values that match the *predicate*."""
+        with self._lock:
+            self._entries = {
+                key: cached
+                for key, cached in self._entries.items()
+                if not predicate(cached[0])
+            }
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def _prune(self) -> None:
+        now = time.time()
+        for key, (_cached_value, expires_at) in list(self._entries.items()):
+            if expires_at <= now:
+                self._entries.pop(key)
+        while self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
@@ -17,6 +17,8 @@ from typing import (  # noqa: WPS235
 
 if TYPE_CHECKING:
     from dmr.components import ComponentParser
+    from dmr.compression import Compression
+    from dmr.conditional import ConditionalGet
     from dmr.controller import Controller
     from dmr.cookies import CookieSpec, NewCookie
     from dmr.errors import AsyncErrorHandler, SyncErrorHandler
@@ -36,6 +38,7 @@ if TYPE_CHECKING:
     from dmr.serializer import BaseSerializer
     from dmr.settings import HttpSpec
     from dmr.throttling import AsyncThrottle, SyncThrottle
+    from dmr.throttling.base import ThrottleGroup
 
 ComponentParserSpec: TypeAlias = tuple['ComponentParser', Any, tuple[Any, ...]]
 
@@ -385,8 +388,15 @@ class EndpointMetadata:
             to be used before auth checks.
         throttling_after_auth: Sequence of throttle instances
             to be used after auth checks.
+        throttle_groups_before_auth: Groups of ``throttling_before_auth``,
+            which share backends and are checked together.
+        throttle_groups_after_auth: Groups of ``throttling_after_auth``,
+            which share backends and are checked together.
         throttling_allow_unsafe_cache: Should this endpoint allow
             unsafe throttle Django cache backends?
+        conditional: Conditional requests support for this endpoint.
+            Only set for ``GET`` and ``HEAD`` endpoints.
+        compression: Response compression for this endpoint.
         no_validate_http_spec: Set of checks that user wants
             to disable for validation in this endpoint.
         allowed_http_methods: Set of extra HTTP methods
@@ -450,6 +460,8 @@ class EndpointMetadata:
     # Second line of throttling:
     throttling_after_auth: tuple['SyncThrottle | AsyncThrottle', ...] | None
     throttling_allow_unsafe_cache: bool | None
+    conditional: 'ConditionalGet | None'
+    compression: 'Compression | None'
 
     no_validate_http_spec: frozenset['HttpSpec']
     allowed_http_methods: frozenset[str]
@@ -472,6 +484,12 @@ class EndpointMetadata:
     throttling: tuple['SyncThrottle | AsyncThrottle', ...] | None = (
         dataclasses.field(init=False)
     )
+    throttle_groups_before_auth: tuple['ThrottleGroup', ...] | None = (
+        dataclasses.field(init=False)
+    )
+    throttle_groups_after_auth: tuple['ThrottleGroup', ...] | None = (
+        dataclasses.field(init=False)
+    )
 
     def __post_init__(self) -> None:
         """Set pre-computed fields."""
@@ -485,6 +503,19 @@ class EndpointMetadata:
             )
             or None,
         )
+        # Throttles with the same backend are checked in one round-trip:
+        from dmr.throttling.base import ThrottleGroup  # noqa: PLC0415
+
+        object.__setattr__(
+            self,
+            'throttle_groups_before_auth',
+            ThrottleGroup.build(self.throttling_before_auth),
+        )
+        object.__setattr__(
+            self,
+            'throttle_groups_after_auth',
+            ThrottleGroup.build(self.throttling_after_auth),
+        )
 
     def collect_response_specs(
         self,
@@ -557,6 +588,7 @@ class EndpointMetadata:
             *(self.auth or []),
             *(self.throttling_before_auth or []),
             *(self.throttling_after_auth or []),
+            *([] if self.conditional is None else [self.conditional]),
         ]
 
 
@@ -1,9 +1,23 @@
 import dataclasses
-from collections.abc import Sequence
-from typing import Generic, TypeVar
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any, Final, Generic, NotRequired, TypeVar, cast
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from typing_extensions import TypedDict
+
+from dmr.exceptions import RequestSerializationError
 
 _ModelT = TypeVar('_ModelT')
 
+#: Default salt for signing pagination cursors.
+_CURSOR_SALT: Final = 'dmr.pagination.cursor'
+
+_DESCENDING: Final = '-'
+
 
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class Page(Generic[_ModelT]):
@@ -34,3 +48,274 @@ class Paginated(Generic[_ModelT]):
     num_pages: int
     per_page: int
     page: Page[_ModelT]
+
+
+class CursorQuery(TypedDict):
+    """
+    Query parameters for cursor pagination.
+
+    Can be used as a base class for other query models.
+
+    .. versionadded:: 0.15.0
+    """
+
+    cursor: NotRequired[str]
+
+
+@dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
+class CursorPage(Generic[_ModelT]):
+    """
+    Page model for the keyset / cursor pagination.
+
+    Unlike :class:`Paginated` it does not have any counts,
+    because cursor pagination never runs ``COUNT(*)`` queries.
+    Cursors are opaque signed strings, which must be passed back
+    as ``cursor`` query parameter to get the next or the previous page.
+    ``None`` means that there's no such page.
+
+    .. versionadded:: 0.15.0
+    """
+
+    per_page: int
+    next_cursor: str | None
+    previous_cursor: str | None
+    object_list: Sequence[_ModelT]
+
+
+class CursorPaginator(Generic[_ModelT]):
+    """
+    Keyset pagination for ordered querysets.
+
+    Instead of ``OFFSET`` we filter rows after the last seen row
+    by values of the *ordering* fields, so every page takes constant time,
+    if there's an index for the *ordering* fields.
+
+    *ordering* must be unique for all rows, so the last field is usually
+    a primary key. Fields used for ordering must not be nullable.
+    Relations are ordered by their model's ordering, not by primary keys,
+    so use ``author_id`` or ``author__pk`` instead of ``author``.
+    When *ordering* is not passed, it is taken from the queryset.
+
+    .. code:: python
+
+        >>> from django.contrib.auth.models import User
+        >>> from dmr.pagination import CursorPaginator
+
+        >>> paginator = CursorPaginator(
+        ...     User.objects.all(),
+        ...     per_page=20,
+        ...     ordering=('-date_joined', '-pk'),
+        ... )
+
+    Then call :meth:`page` or :meth:`apage` with the cursor from the query.
+    Invalid cursors raise :exc:`dmr.exceptions.RequestSerializationError`,
+    which is converted to ``400`` response.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('_ordering', '_queryset', '_salt', 'per_page')
+
+    def __init__(
+        self,
+        queryset: 'models.QuerySet[Any, _ModelT]',
+        *,
+        per_page: int,
+        ordering: Sequence[str] | None = None,
+        salt: str = _CURSOR_SALT,
+    ) -> None:
+        """Create the paginator."""
+        self._ordering = tuple(
+            _resolve_ordering(queryset) if ordering is None else ordering,
+        )
+        for field in self._ordering:
+            _check_ordering_field(queryset.model, field)
+        self._queryset = queryset.order_by(*self._ordering)
+        # Cursors for different orderings must not be mixed together:
+        self._salt = ':'.join((salt, *self._ordering))
+        self.per_page = per_page
+
+    def page(self, cursor: str | None) -> CursorPage[_ModelT]:
+        """Fetch a single page of objects starting from the *cursor*."""
+        is_reversed, queryset = self._page_queryset(cursor)
+        return self._build_page(
+            list(queryset),
+            is_reversed=is_reversed,
+            has_cursor=cursor is not None,
+        )
+
+    async def apage(self, cursor: str | None) -> CursorPage[_ModelT]:
+        """Fetch a single page of objects starting from the *cursor*."""
+        is_reversed, queryset = self._page_queryset(cursor)
+        return self._build_page(
+            [instance async for instance in queryset],
+            is_reversed=is_reversed,
+            has_cursor=cursor is not None,
+        )
+
+    def encode_cursor(
+        self,
+        instance: _ModelT,
+        *,
+        is_reversed: bool = False,
+    ) -> str:
+        """
+        Create opaque signed cursor pointing to the *instance*.
+
+        Reversed cursors point to the objects before the *instance*.
+        """
+        return signing.dumps(
+            {
+                'r': is_reversed,
+                'k': [
+                    _field_value(instance, field.lstrip(_DESCENDING))
+                    for field in self._ordering
+                ],
+            },
+            salt=self._salt,
+            serializer=_CursorSerializer,
+            compress=True,
+        )
+
+    def decode_cursor(self, cursor: str) -> tuple[bool, list[Any]]:
+        """
+        Decode and verify the opaque signed *cursor*.
+
+        Returns whether this cursor is reversed and its keyset values.
+        """
+        try:
+            payload = signing.loads(
+                cursor,
+                salt=self._salt,
+                serializer=_CursorSerializer,
+            )
+        except signing.BadSignature:
+            raise RequestSerializationError('Invalid cursor') from None
+        keys: list[Any] = payload.get('k')
+        if not isinstance(payload.get('r'), bool) or (
+            not isinstance(payload.get('k'), list)
+            or len(keys) != len(self._ordering)
+        ):
+            raise RequestSerializationError('Invalid cursor')
+        return payload['r'], keys
+
+    def _page_queryset(
+        self,
+        cursor: str | None,
+    ) -> tuple[bool, 'models.QuerySet[Any, _ModelT]']:
+        if cursor is None:
+            return False, self._queryset[: self.per_page + 1]
+        is_reversed, keys = self.decode_cursor(cursor)
+        queryset = self._queryset.filter(
+            _keyset_filter(self._ordering, keys, is_reversed=is_reversed),
+        )
+        if is_reversed:
+            queryset = queryset.reverse()
+        # We fetch one extra object to know if there are more objects:
+        return is_reversed, queryset[: self.per_page + 1]
+
+    def _build_page(
+        self,
+        object_list: list[_ModelT],
+        *,
+        is_reversed: bool,
+        has_cursor: bool,
+    ) -> CursorPage[_ModelT]:
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if is_reversed:
+            object_list.reverse()
+        # When we came from some cursor, there's a page in the other direction:
+        has_next = has_cursor if is_reversed else has_more
+        has_previous = has_more if is_reversed else has_cursor
+        return CursorPage(
+            per_page=self.per_page,
+            next_cursor=(
+                self.encode_cursor(object_list[-1])
+                if has_next and object_list
+                else None
+            ),
+            previous_cursor=(
+                self.encode_cursor(object_list[0], is_reversed=True)
+                if has_previous and object_list
+                else None
+            ),
+            object_list=object_list,
+        )
+
+
+class _CursorSerializer:
+    __slots__ = ()
+
+    def dumps(self, obj: Any) -> bytes:  # noqa: WPS110
+        return json.dumps(
+            obj,
+            separators=(',', ':'),
+            cls=DjangoJSONEncoder,
+        ).encode('latin-1')
+
+    def loads(self, data: bytes) -> Any:  # noqa: WPS110
+        try:
+            return json.loads(data.decode('latin-1'))
+        except ValueError:
+            raise signing.BadSignature from None
+
+
+def _resolve_ordering(queryset: 'models.QuerySet[Any, Any]') -> Sequence[str]:
+    ordering = queryset.query.order_by or queryset.model._meta.ordering  # noqa: SLF001
+    if not ordering or not all(isinstance(field, str) for field in ordering):
+        raise ValueError(
+            'Cursor pagination requires queryset ordered by field names, '
+            'pass `ordering` explicitly',
+        )
+    return ordering  # type: ignore[return-value]
+
+
+def _check_ordering_field(model: type[models.Model], field: str) -> None:
+    for part in field.lstrip(_DESCENDING).split('__'):
+        try:
+            model_field = model._meta.get_field(part)  # noqa: SLF001
+        except FieldDoesNotExist:
+            return  # `pk`, lookups, and unknown fields
+        # `author_id` is a raw value, while `author` is a relation:
+        if not model_field.is_relation or part != model_field.name:
+            return
+        model = model_field.related_model  # type: ignore[assignment]
+    raise ValueError(
+        f'Cursor pagination cannot order by {field!r} relation, '
+        'use its `_id` or `__pk` field instead',
+    )
+
+
+def _field_value(instance: Any, field: str) -> Any:
+    if isinstance(instance, Mapping):
+        return cast('Mapping[str, Any]', instance)[field]
+    attribute = instance
+    for part in field.split('__'):
+        attribute = getattr(attribute, part)
+    return attribute
+
+
+def _keyset_filter(
+    ordering: Sequence[str],
+    keys: Sequence[Any],
+    *,
+    is_reversed: bool,
+) -> models.Q:
+    # (a > 1) OR (a = 1 AND b > 2) OR (a = 1 AND b = 2 AND c > 3)
+    keyset_filter = models.Q()
+    equal_filter = models.Q()
+    for field, key in zip(ordering, keys, strict=True):
+        keyset_filter |= equal_filter & _field_lookup(
+            field,
+            key,
+            is_reversed=is_reversed,
+        )
+        equal_filter &= models.Q(**{field.lstrip(_DESCENDING): key})
+    return keyset_filter
+
+
+def _field_lookup(field: str, key: Any, *, is_reversed: bool) -> models.Q:
+    is_descending = field.startswith(_DESCENDING)
+    lookup = 'gt' if is_descending == is_reversed else 'lt'
+    return models.Q(**{f'{field.lstrip(_DESCENDING)}__{lookup}': key})
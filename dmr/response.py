@@ -182,6 +182,26 @@ class RedirectTo(Exception):  # noqa: N818
         self.raw_data = None  # empty response body by default
 
 
+class NotModified(Exception):  # noqa: N818
+    """
+    Special class to return empty ``304 Not Modified`` responses.
+
+    It is modeled as an exception, because it is raised
+    by :class:`dmr.conditional.ConditionalGet` before the endpoint is called.
+    It can also be raised from ``@modify`` styled endpoints directly.
+
+    .. versionadded:: 0.15.0
+    """
+
+    status_code: ClassVar[HTTPStatus] = HTTPStatus.NOT_MODIFIED
+
+    def __init__(self, *, headers: Mapping[str, str] | None = None) -> None:
+        """Create not modified response from parts."""
+        super().__init__()
+        self.headers = headers
+        self.raw_data = None  # 304 responses can't have a body
+
+
 @overload
 def build_response(
     serializer: type['BaseSerializer'],
@@ -1,17 +1,18 @@
 from abc import abstractmethod
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from http import HTTPStatus
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
 from django.conf import settings
 from django.contrib.auth import aauthenticate, alogin, authenticate, login
 from django.views.decorators.debug import sensitive_post_parameters
-from typing_extensions import TypedDict
+from typing_extensions import TypedDict, override
 
 from dmr import Body, Controller, CookieSpec, ResponseSpec, modify
 from dmr.decorators import endpoint_decorator
 from dmr.errors import ErrorModel
 from dmr.exceptions import NotAuthenticatedError
+from dmr.security.login_executor import LoginExecutor
 from dmr.serializer import BaseSerializer
 
 _RequestModelT = TypeVar('_RequestModelT', bound=Mapping[str, Any])
@@ -118,18 +119,37 @@ class DjangoSessionAsyncController(
     """
     Async controller to get django session cookie.
 
+    Attributes:
+        login_executor: Optional dedicated executor to verify credentials,
+            see :class:`~dmr.security.login_executor.LoginExecutor`.
+            Adds ``429`` response for rejected logins, when set.
+
     See also:
         https://docs.djangoproject.com/en/stable/topics/auth/
 
+    .. versionchanged:: 0.15.0
+        Added *login_executor* attribute.
+
     """
 
-    responses = (
+    login_executor: ClassVar[LoginExecutor | None] = None
+
+    responses: ClassVar[Sequence[ResponseSpec]] = (
         ResponseSpec(
             return_type=ErrorModel,
             status_code=HTTPStatus.UNAUTHORIZED,
         ),
     )
 
+    @override
+    def __init_subclass__(cls) -> None:
+        if cls.login_executor is not None:
+            cls.responses = cls.login_executor.add_response_spec(
+                cls.responses,
+                cls.error_model,
+            )
+        super().__init_subclass__()
+
     @endpoint_decorator(sensitive_post_parameters())
     @modify(
         status_code=HTTPStatus.OK,
@@ -153,10 +173,14 @@ class DjangoSessionAsyncController(
 
     async def login(self, parsed_body: _RequestModelT) -> _ResponseT:
         """Perform the sync login routine for user."""
-        user = await aauthenticate(
-            self.request,
-            **(await self.convert_auth_payload(parsed_body)),
-        )
+        credentials = await self.convert_auth_payload(parsed_body)
+        if self.login_executor is None:
+            user = await aauthenticate(self.request, **credentials)
+        else:
+            user = await self.login_executor.aauthenticate(
+                self.request,
+                **credentials,
+            )
         if user is None:
             raise NotAuthenticatedError
         await alogin(self.request, user)
@@ -1,31 +1,90 @@
+import copy
+import time
 from abc import abstractmethod
 from base64 import b64decode, b64encode
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Final, Self, TypeAlias, cast
 from urllib.parse import unquote
 
+from django.http import HttpRequest
+from django.utils.crypto import salted_hmac
 from typing_extensions import override
 
+from dmr.internal.ttl_cache import TTLCache
 from dmr.openapi.objects import Reference, SecurityRequirement, SecurityScheme
 from dmr.security.base import AsyncAuth, SyncAuth
 
 if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
     from dmr.controller import Controller
     from dmr.endpoint import Endpoint
     from dmr.serializer import BaseSerializer
 
+#: Default number of verified credentials to keep in process memory.
+DEFAULT_CREDENTIALS_CACHE_SIZE: Final = 1000
+
+_CREDENTIALS_SALT: Final = 'dmr.security.http'
+
+# Verified credentials are stored as: keyed hash -> (username, auth, user).
+_CredentialsCache: TypeAlias = TTLCache[
+    bytes,
+    tuple[str, '_HttpBasicAuth', 'AbstractBaseUser | None'],
+]
 
-class _HttpBasicAuth:
-    __slots__ = ('header', 'security_scheme_name')
+
+class _HttpBasicAuth:  # noqa: WPS214
+    __slots__ = (
+        '_credentials_cache',
+        'credentials_cache_ttl',
+        'header',
+        'security_scheme_name',
+    )
 
     def __init__(
         self,
         *,
         security_scheme_name: str = 'http_basic',
         header: str = 'Authorization',
+        credentials_cache_ttl: float | None = None,
+        credentials_cache_size: int = DEFAULT_CREDENTIALS_CACHE_SIZE,
     ) -> None:
-        """Apply possible customizations."""
+        """
+        Apply possible customizations.
+
+        Pass *credentials_cache_ttl* to skip ``authenticate``
+        for credentials that were verified less than this many seconds ago,
+        ``on_cached_auth`` is called for them instead.
+        Up to *credentials_cache_size* verified credentials
+        are kept in process memory, only as keyed hashes.
+
+        .. versionchanged:: 0.15.0
+            Added *credentials_cache_ttl* and *credentials_cache_size*.
+        """
         self.security_scheme_name = security_scheme_name
         self.header = header
+        self.credentials_cache_ttl = credentials_cache_ttl
+        self._credentials_cache: _CredentialsCache | None = (
+            None
+            if credentials_cache_ttl is None
+            else TTLCache(credentials_cache_size)
+        )
+
+    def invalidate_credentials(self, username: str | None = None) -> None:
+        """
+        Drop cached credentials of *username*, or all of them.
+
+        Call it when a password is changed or a user is deactivated.
+
+        .. versionadded:: 0.15.0
+        """
+        if self._credentials_cache is None:
+            return
+        if username is None:
+            self._credentials_cache.clear()
+        else:
+            self._credentials_cache.pop_where(
+                lambda cached: cached[0] == username,
+            )
 
     @property
     def security_schemes(self) -> dict[str, SecurityScheme | Reference]:
@@ -75,6 +134,43 @@ class _HttpBasicAuth:
             return None
         return unquote(username), unquote(password)
 
+    def _cached_auth(
+        self,
+        username: str,
+        password: str,
+    ) -> tuple[bytes | None, tuple[Self, 'AbstractBaseUser | None'] | None]:
+        if self._credentials_cache is None:
+            return None, None
+        # We never store the credentials, only their keyed hash:
+        cache_key = salted_hmac(
+            _CREDENTIALS_SALT,
+            f'{username}:{password}',
+            algorithm='sha256',
+        ).digest()
+        cached = self._credentials_cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        return cache_key, (cast(Self, cached[1]), cached[2])
+
+    def _cache_auth(
+        self,
+        cache_key: bytes | None,
+        username: str,
+        authed: Self | None,
+        user: 'AbstractBaseUser | None',
+    ) -> None:
+        if (
+            cache_key is not None
+            and authed is not None
+            and self._credentials_cache is not None
+            and self.credentials_cache_ttl is not None
+        ):
+            self._credentials_cache.set(
+                cache_key,
+                (username, authed, user),
+                expires_at=time.time() + self.credentials_cache_ttl,
+            )
+
     def _uses_standard_http_basic_auth(self) -> bool:
         """Whether the auth contract matches OpenAPI HTTP basic auth."""
         return self.header == 'Authorization'
@@ -123,7 +219,24 @@ class HttpBasicSyncAuth(_HttpBasicAuth, SyncAuth):
         login_data = self._get_username_and_password(controller)
         if login_data is None:
             return None
-        return self.authenticate(endpoint, controller, *login_data)
+        cache_key, cached = self._cached_auth(*login_data)
+        if cached is not None:
+            self.on_cached_auth(
+                endpoint,
+                controller,
+                login_data[0],
+                user=cached[1],
+            )
+            return cached[0]
+        previous_user = getattr(controller.request, 'user', None)
+        authed = self.authenticate(endpoint, controller, *login_data)
+        self._cache_auth(
+            cache_key,
+            login_data[0],
+            authed,
+            _resolved_user(controller.request, previous_user),
+        )
+        return authed
 
     @abstractmethod
     def authenticate(
@@ -136,6 +249,28 @@ class HttpBasicSyncAuth(_HttpBasicAuth, SyncAuth):
         """Override this method to provide an actual user/password check."""
         raise NotImplementedError
 
+    def on_cached_auth(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        username: str,
+        *,
+        user: 'AbstractBaseUser | None',
+    ) -> None:
+        """
+        Called instead of ``authenticate`` for cached credentials.
+
+        ``authenticate`` is skipped for credentials cached
+        with *credentials_cache_ttl*, so its side effects are skipped too.
+        By default, sets a copy of the *user* to ``controller.request.user``,
+        when ``authenticate`` has set it for these credentials.
+        Override this method to re-apply other side effects for *username*.
+
+        .. versionadded:: 0.15.0
+        """
+        if user is not None:
+            _set_request_user(controller.request, copy.copy(user))
+
 
 class HttpBasicAsyncAuth(_HttpBasicAuth, AsyncAuth):
     """
@@ -171,7 +306,24 @@ class HttpBasicAsyncAuth(_HttpBasicAuth, AsyncAuth):
         login_data = self._get_username_and_password(controller)
         if login_data is None:
             return None
-        return await self.authenticate(endpoint, controller, *login_data)
+        cache_key, cached = self._cached_auth(*login_data)
+        if cached is not None:
+            await self.on_cached_auth(
+                endpoint,
+                controller,
+                login_data[0],
+                user=cached[1],
+            )
+            return cached[0]
+        previous_user = getattr(controller.request, 'user', None)
+        authed = await self.authenticate(endpoint, controller, *login_data)
+        self._cache_auth(
+            cache_key,
+            login_data[0],
+            authed,
+            _resolved_user(controller.request, previous_user),
+        )
+        return authed
 
     @abstractmethod
     async def authenticate(
@@ -184,6 +336,43 @@ class HttpBasicAsyncAuth(_HttpBasicAuth, AsyncAuth):
         """Override this method to provide an actual user/password check."""
         raise NotImplementedError
 
+    async def on_cached_auth(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        username: str,
+        *,
+        user: 'AbstractBaseUser | None',
+    ) -> None:
+        """
+        Called instead of ``authenticate`` for cached credentials.
+
+        ``authenticate`` is skipped for credentials cached
+        with *credentials_cache_ttl*, so its side effects are skipped too.
+        By default, sets a copy of the *user* to ``controller.request.user``,
+        when ``authenticate`` has set it for these credentials.
+        Override this method to re-apply other side effects for *username*.
+
+        .. versionadded:: 0.15.0
+        """
+        if user is not None:
+            _set_request_user(controller.request, copy.copy(user))
+
+
+def _resolved_user(request: HttpRequest, previous_user: Any) -> Any:
+    # Only users set by `authenticate` are set again for cached credentials:
+    user = getattr(request, 'user', None)
+    return None if user is previous_user else user
+
+
+def _set_request_user(request: HttpRequest, user: 'AbstractBaseUser') -> None:
+    request.user = user
+
+    async def auser() -> 'AbstractBaseUser':  # noqa: WPS430
+        return user
+
+    request.auser = auser
+
 
 def basic_auth(username: str, password: str, *, prefix: str = 'Basic ') -> str:
     """
@@ -3,18 +3,39 @@
 # https://github.com/litestar-org/litestar/blob/main/litestar/security/jwt/auth.py
 # https://github.com/litestar-org/litestar/blob/main/LICENSE
 
+import asyncio
+import functools
+import hashlib
 from abc import abstractmethod
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Final, Literal, Self, TypeAlias, overload
+from collections.abc import Awaitable, Callable, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Literal,
+    Self,
+    TypeAlias,
+    cast,
+    final,
+    overload,
+)
 
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from asgiref.sync import async_to_sync
+from django.core.exceptions import (
+    ObjectDoesNotExist,
+    SynchronousOnlyOperation,
+    ValidationError,
+)
 from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
 from typing_extensions import override
 
 from dmr.exceptions import NotAuthenticatedError
+from dmr.internal.ttl_cache import TTLCache
 from dmr.openapi.objects import Reference, SecurityRequirement, SecurityScheme
 from dmr.security.base import AsyncAuth, SyncAuth
+from dmr.security.jwt.keys import JWTKey, JWTKeySet
 from dmr.security.jwt.token import JWToken
+from dmr.security.user_cache import UserCache
 
 if TYPE_CHECKING:
     from django.contrib.auth.base_user import AbstractBaseUser
@@ -49,16 +70,19 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
     """
 
     __slots__ = (
+        '_token_cache',
         'accepted_audiences',
         'accepted_issuers',
         'algorithm',
         'enforce_minimum_key_length',
+        'lazy_user',
         'leeway',
         'require_claims',
         'secret',
         'security_scheme_name',
         'strict_audience',
         'token_cls',
+        'user_cache',
         'user_id_field',
         'verify_expiry',
         'verify_issued_at',
@@ -73,7 +97,7 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
         user_id_field: str = 'pk',
         algorithm: str = 'HS256',
         security_scheme_name: str = 'jwt',
-        secret: str | None = None,
+        secret: 'JWTKey | JWTKeySet | None' = None,
         token_cls: type[JWToken] = JWToken,
         leeway: int = 0,  # seconds
         accepted_audiences: str | Sequence[str] | None = None,
@@ -86,6 +110,9 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
         verify_subject: bool = True,
         strict_audience: bool = False,
         enforce_minimum_key_length: bool = True,
+        token_cache_size: int | None = None,
+        user_cache: UserCache | None = None,
+        lazy_user: bool = False,
     ) -> None:
         """
         Apply possible customizations.
@@ -97,18 +124,37 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
           or any other unique user key.
         - *secret* can be changed, by default we use ``settings.SECRET_KEY``,
           but if you need some other secret for signing tokens - it is possible.
+          It can also be a key object, like a public key for ``RS256``,
+          or :class:`~dmr.security.jwt.keys.JWTKeySet`
+          with several keys selected by ``kid`` token header.
         - *token_cls* can use :class:`dmr.security.jwt.token.JWToken`
           subclasses with different behavior.
+        - *token_cache_size* enables an in-process cache of up to this many
+          verified tokens, so the same encoded token is not verified
+          again until it expires. Disabled by default.
+        - *user_cache* keeps users fetched by their *user_id_field*,
+          see :class:`~dmr.security.user_cache.UserCache`.
+          Disabled by default.
+        - *lazy_user* makes ``request.user`` fetch the user
+          only when it is accessed. The user is checked to be active then.
+          Useful when most endpoints only need the token claims.
+          Async code must fetch it with ``await request.auser()`` first.
 
         See :meth:`dmr.security.jwt.token.JWToken.decode`
         for the docs for all jwt parameters explanation.
+
+        .. versionchanged:: 0.15.0
+            Added *token_cache_size*, *user_cache*,
+            and *lazy_user* parameters.
+            *secret* can be a key object or a key set.
+
         """
         from django.conf import settings  # noqa: PLC0415
 
         self.user_id_field = user_id_field
         self.algorithm = algorithm
         self.security_scheme_name = security_scheme_name
-        self.secret: str = secret or settings.SECRET_KEY
+        self.secret: JWTKey | JWTKeySet = secret or settings.SECRET_KEY
         self.token_cls = token_cls
         self.leeway = leeway
         self.accepted_audiences = accepted_audiences
@@ -121,6 +167,13 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
         self.verify_subject = verify_subject
         self.strict_audience = strict_audience
         self.enforce_minimum_key_length = enforce_minimum_key_length
+        self.user_cache = user_cache
+        if user_cache is not None:
+            user_cache.add_lookup_field(user_id_field)
+        self.lazy_user = lazy_user
+        self._token_cache: TTLCache[bytes, JWToken] | None = (
+            None if token_cache_size is None else TTLCache(token_cache_size)
+        )
 
     @property
     def security_requirement(self) -> SecurityRequirement:
@@ -152,7 +205,41 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
         raise NotImplementedError
 
     def decode_token(self, encoded_token: str) -> JWToken:
-        """Decodes token object from the encoded string."""
+        """
+        Decodes token object from the encoded string.
+
+        When *token_cache_size* is set, verified tokens are cached
+        by the hash of the encoded string until they expire.
+        All other auth checks, like the blocklist ones, still run every time.
+        """
+        if self._token_cache is None:
+            return self._decode_token(encoded_token)
+
+        cache_key = hashlib.sha256(encoded_token.encode()).digest()
+        token = self._token_cache.get(cache_key)
+        if token is None:
+            token = self._decode_token(encoded_token)
+            self._token_cache.set(
+                cache_key,
+                token,
+                expires_at=token.exp.timestamp() - self.leeway,
+            )
+        return token
+
+    def claim_from_token(self, token: JWToken) -> str:
+        """
+        Return claim value from the token object.
+
+        Override this method if you want to change how
+        claim is extracted from token.
+        For example, if you create ``email`` claim,
+        it will be stored in ``.extras``.
+
+        So, you would need to use: ``token.extras['email']``.
+        """
+        return token.sub
+
+    def _decode_token(self, encoded_token: str) -> JWToken:
         return self.token_cls.decode(
             encoded_token=encoded_token,
             secret=self.secret,
@@ -170,19 +257,6 @@ class _BaseJWTAuth:  # noqa: WPS214, WPS230
             enforce_minimum_key_length=self.enforce_minimum_key_length,
         )
 
-    def claim_from_token(self, token: JWToken) -> str:
-        """
-        Return claim value from the token object.
-
-        Override this method if you want to change how
-        claim is extracted from token.
-        For example, if you create ``email`` claim,
-        it will be stored in ``.extras``.
-
-        So, you would need to use: ``token.extras['email']``.
-        """
-        return token.sub
-
 
 class _HeaderJWTAuth:
     """Reads jwt tokens from a request header."""
@@ -274,7 +348,11 @@ class BaseJWTSyncAuth(_BaseJWTAuth, SyncAuth):
         token: JWToken,
     ) -> 'AbstractBaseUser':
         """Run all auth pipeline."""
-        user = self.get_user(token)
+        user = (
+            _lazy_user(functools.partial(self._get_active_user, token))
+            if self.lazy_user
+            else self.get_user(token)
+        )
         self.check_auth(user, token)
         self.set_request_attrs(request, user, token)
         return user
@@ -285,16 +363,26 @@ class BaseJWTSyncAuth(_BaseJWTAuth, SyncAuth):
         # without calling `.setup()`:
         from django.contrib.auth import get_user_model  # noqa: PLC0415
 
+        lookup_value = self.claim_from_token(token)
+        if self.user_cache is not None:
+            cached_user = self.user_cache.get(self.user_id_field, lookup_value)
+            if cached_user is not None:
+                return cached_user
+
         try:
-            return get_user_model().objects.get(**{
-                self.user_id_field: self.claim_from_token(token),
+            user = get_user_model().objects.get(**{
+                self.user_id_field: lookup_value,
             })
         except USER_LOOKUP_ERRORS:
             raise NotAuthenticatedError from None
+        if self.user_cache is not None:
+            self.user_cache.set(self.user_id_field, lookup_value, user)
+        return user
 
     def check_auth(self, user: 'AbstractBaseUser', token: JWToken) -> None:
         """Run extra auth checks, raise if something is wrong."""
-        if not user.is_active:
+        # Lazy users are checked when they are fetched:
+        if not self.lazy_user and not user.is_active:
             raise NotAuthenticatedError
 
     def set_request_attrs(
@@ -306,6 +394,12 @@ class BaseJWTSyncAuth(_BaseJWTAuth, SyncAuth):
         """Set current user as authed for this request."""
         set_request_attrs(request, user, token=token)
 
+    def _get_active_user(self, token: JWToken) -> 'AbstractBaseUser':
+        user = self.get_user(token)
+        if not user.is_active:
+            raise NotAuthenticatedError
+        return user
+
 
 class BaseJWTAsyncAuth(_BaseJWTAuth, AsyncAuth):
     """
@@ -337,9 +431,20 @@ class BaseJWTAsyncAuth(_BaseJWTAuth, AsyncAuth):
         token: JWToken,
     ) -> 'AbstractBaseUser':
         """Run all auth pipeline."""
-        user = await self.get_user(token)
+        if not self.lazy_user:
+            user = await self.get_user(token)
+            await self.check_auth(user, token)
+            await self.set_request_attrs(request, user, token)
+            return user
+
+        loader = _AsyncUserLoader(
+            functools.partial(self._get_active_user, token),
+        )
+        user = _lazy_user(loader.user)
         await self.check_auth(user, token)
         await self.set_request_attrs(request, user, token)
+        # Async code must use `await request.auser()` to fetch lazy users:
+        request.auser = loader.auser
         return user
 
     async def get_user(self, token: JWToken) -> 'AbstractBaseUser':
@@ -348,12 +453,24 @@ class BaseJWTAsyncAuth(_BaseJWTAuth, AsyncAuth):
         # without calling `.setup()`:
         from django.contrib.auth import get_user_model  # noqa: PLC0415
 
+        lookup_value = self.claim_from_token(token)
+        if self.user_cache is not None:
+            cached_user = await self.user_cache.aget(
+                self.user_id_field,
+                lookup_value,
+            )
+            if cached_user is not None:
+                return cached_user
+
         try:
-            return await get_user_model().objects.aget(**{
-                self.user_id_field: self.claim_from_token(token),
+            user = await get_user_model().objects.aget(**{
+                self.user_id_field: lookup_value,
             })
         except USER_LOOKUP_ERRORS:
             raise NotAuthenticatedError from None
+        if self.user_cache is not None:
+            await self.user_cache.aset(self.user_id_field, lookup_value, user)
+        return user
 
     async def check_auth(
         self,
@@ -361,7 +478,8 @@ class BaseJWTAsyncAuth(_BaseJWTAuth, AsyncAuth):
         token: JWToken,
     ) -> None:
         """Run extra auth checks, raise if something is wrong."""
-        if not user.is_active:
+        # Lazy users are checked when they are fetched:
+        if not self.lazy_user and not user.is_active:
             raise NotAuthenticatedError
 
     async def set_request_attrs(
@@ -373,6 +491,12 @@ class BaseJWTAsyncAuth(_BaseJWTAuth, AsyncAuth):
         """Set current user as authed for this request."""
         set_request_attrs(request, user, token=token)
 
+    async def _get_active_user(self, token: JWToken) -> 'AbstractBaseUser':
+        user = await self.get_user(token)
+        if not user.is_active:
+            raise NotAuthenticatedError
+        return user
+
 
 class HeaderJWTSyncAuth(_HeaderJWTAuth, BaseJWTSyncAuth):
     """
@@ -397,7 +521,7 @@ class HeaderJWTSyncAuth(_HeaderJWTAuth, BaseJWTSyncAuth):
         user_id_field: str = 'pk',
         algorithm: str = 'HS256',
         security_scheme_name: str = 'jwt',
-        secret: str | None = None,
+        secret: 'JWTKey | JWTKeySet | None' = None,
         token_cls: type[JWToken] = JWToken,
         leeway: int = 0,  # seconds
         accepted_audiences: str | Sequence[str] | None = None,
@@ -410,6 +534,9 @@ class HeaderJWTSyncAuth(_HeaderJWTAuth, BaseJWTSyncAuth):
         verify_subject: bool = True,
         strict_audience: bool = False,
         enforce_minimum_key_length: bool = True,
+        token_cache_size: int | None = None,
+        user_cache: UserCache | None = None,
+        lazy_user: bool = False,
     ) -> None:
         """
         Apply possible customizations.
@@ -435,6 +562,9 @@ class HeaderJWTSyncAuth(_HeaderJWTAuth, BaseJWTSyncAuth):
             verify_subject=verify_subject,
             strict_audience=strict_audience,
             enforce_minimum_key_length=enforce_minimum_key_length,
+            token_cache_size=token_cache_size,
+            user_cache=user_cache,
+            lazy_user=lazy_user,
         )
         self.auth_header = auth_header
         self.auth_scheme = auth_scheme
@@ -463,7 +593,7 @@ class HeaderJWTAsyncAuth(_HeaderJWTAuth, BaseJWTAsyncAuth):
         user_id_field: str = 'pk',
         algorithm: str = 'HS256',
         security_scheme_name: str = 'jwt',
-        secret: str | None = None,
+        secret: 'JWTKey | JWTKeySet | None' = None,
         token_cls: type[JWToken] = JWToken,
         leeway: int = 0,  # seconds
         accepted_audiences: str | Sequence[str] | None = None,
@@ -476,6 +606,9 @@ class HeaderJWTAsyncAuth(_HeaderJWTAuth, BaseJWTAsyncAuth):
         verify_subject: bool = True,
         strict_audience: bool = False,
         enforce_minimum_key_length: bool = True,
+        token_cache_size: int | None = None,
+        user_cache: UserCache | None = None,
+        lazy_user: bool = False,
     ) -> None:
         """
         Apply possible customizations.
@@ -501,6 +634,9 @@ class HeaderJWTAsyncAuth(_HeaderJWTAuth, BaseJWTAsyncAuth):
             verify_subject=verify_subject,
             strict_audience=strict_audience,
             enforce_minimum_key_length=enforce_minimum_key_length,
+            token_cache_size=token_cache_size,
+            user_cache=user_cache,
+            lazy_user=lazy_user,
         )
         self.auth_header = auth_header
         self.auth_scheme = auth_scheme
@@ -561,3 +697,42 @@ def set_request_attrs(
 
     if token is not None:
         request.__dmr_jwt__ = token  # type: ignore[attr-defined]
+
+
+@final
+class _AsyncUserLoader:
+    """Fetches the lazy user of async auth only once per request."""
+
+    __slots__ = ('_load_user', '_user')
+
+    def __init__(
+        self,
+        load_user: Callable[[], Awaitable['AbstractBaseUser']],
+    ) -> None:
+        self._load_user = load_user
+        self._user: AbstractBaseUser | None = None
+
+    async def auser(self) -> 'AbstractBaseUser':
+        if self._user is None:
+            self._user = await self._load_user()
+        return self._user
+
+    def user(self) -> 'AbstractBaseUser':
+        if self._user is not None:
+            return self._user
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # We are in a sync thread, like the one of `sync_to_async`:
+            return async_to_sync(self.auser)()
+        raise SynchronousOnlyOperation(
+            'Lazy jwt user is not fetched yet, '
+            'use `await request.auser()` in async code',
+        )
+
+
+def _lazy_user(
+    load_user: Callable[[], 'AbstractBaseUser'],
+) -> 'AbstractBaseUser':
+    # Lazy object proxies all attributes, it behaves just like a user:
+    return cast('AbstractBaseUser', SimpleLazyObject(load_user))
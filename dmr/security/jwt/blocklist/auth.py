@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, ClassVar, Protocol
 
 from dmr.exceptions import NotAuthenticatedError
+from dmr.security.jwt.blocklist.cache import BlocklistCache
 from dmr.security.jwt.token import JWToken
 
 if TYPE_CHECKING:
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class _JWTAuth(Protocol):
+    blocklist_cache: ClassVar[BlocklistCache | None]
+
     def blocklist_model(self) -> type['BlocklistedJWToken']: ...
 
 
@@ -34,6 +37,10 @@ class _JWTAsyncAuth(_JWTAuth, Protocol):
 
 
 class _BaseBlocklistMixin:
+    #: Optional in-process set of blocklisted tokens,
+    #: checked before the database.
+    blocklist_cache: ClassVar[BlocklistCache | None] = None
+
     def blocklist_model(self) -> type['BlocklistedJWToken']:
         """Returns the model to be used."""
         from dmr.security.jwt.blocklist.models import (  # noqa: PLC0415
@@ -53,7 +60,13 @@ class JWTokenBlocklistSyncMixin(_BaseBlocklistMixin):
     ) -> None:
         """Check if the token is in the black list, if so raise the error."""
         super().check_auth(user, token)  # type: ignore[safe-super]
-        if self.blocklist_model().objects.filter(jti=token.jti).exists():
+        model = self.blocklist_model()
+        if (
+            self.blocklist_cache is not None
+            and not self.blocklist_cache.may_contain(model, token.jti)
+        ):
+            return
+        if model.objects.filter(jti=token.jti).exists():
             raise NotAuthenticatedError
 
     def blocklist(
@@ -61,13 +74,16 @@ class JWTokenBlocklistSyncMixin(_BaseBlocklistMixin):
         token: JWToken,
     ) -> tuple['BlocklistedJWToken', bool]:
         """Add token to the blocklist."""
-        return self.blocklist_model().objects.get_or_create(
+        blocklisted = self.blocklist_model().objects.get_or_create(
             jti=token.jti,
             defaults={
                 'user': self.get_user(token),
                 'expires_at': token.exp,
             },
         )
+        if self.blocklist_cache is not None:
+            self.blocklist_cache.add(token.jti, token.exp)
+        return blocklisted
 
 
 class JWTokenBlocklistAsyncMixin(_BaseBlocklistMixin):
@@ -80,7 +96,13 @@ class JWTokenBlocklistAsyncMixin(_BaseBlocklistMixin):
     ) -> None:
         """Check if the token is in the black list, if so raise the error."""
         await super().check_auth(user, token)  # type: ignore[safe-super]
-        if await self.blocklist_model().objects.filter(jti=token.jti).aexists():
+        model = self.blocklist_model()
+        if (
+            self.blocklist_cache is not None
+            and not await self.blocklist_cache.amay_contain(model, token.jti)
+        ):
+            return
+        if await model.objects.filter(jti=token.jti).aexists():
             raise NotAuthenticatedError
 
     async def blocklist(
@@ -89,10 +111,13 @@ class JWTokenBlocklistAsyncMixin(_BaseBlocklistMixin):
     ) -> tuple['BlocklistedJWToken', bool]:
         """Add token to the blocklist."""
         user = await self.get_user(token)
-        return await self.blocklist_model().objects.aget_or_create(
+        blocklisted = await self.blocklist_model().objects.aget_or_create(
             jti=token.jti,
             defaults={
                 'user': user,
                 'expires_at': token.exp,
             },
         )
+        if self.blocklist_cache is not None:
+            self.blocklist_cache.add(token.jti, token.exp)
+        return blocklisted
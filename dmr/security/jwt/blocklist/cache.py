@@ -0,0 +1,161 @@
+import datetime as dt
+import threading
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Final, TypeAlias, final
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from dmr.security.jwt.blocklist.models import BlocklistedJWToken
+
+#: Default number of seconds between blocklist refreshes.
+DEFAULT_REFRESH_INTERVAL: Final = 5
+
+# Rows from concurrent transactions can be committed with `created_at`
+# a bit older than the latest seen one, so we always re-read this window:
+_WATERMARK_OVERLAP: Final = dt.timedelta(seconds=5)
+
+_BlocklistRow: TypeAlias = tuple[str, dt.datetime, dt.datetime]
+
+
+@final
+class BlocklistCache:  # noqa: WPS214
+    """
+    In-process set of blocklisted token ids, used before the database.
+
+    Almost no tokens are ever blocklisted, so querying the database
+    on every request is wasteful. This set is refreshed incrementally
+    from the blocklist table, by the creation time of its rows,
+    at most once in *refresh_interval* seconds.
+    Tokens blocklisted by the same process are added right away.
+
+    When the set does not contain the token id, the database is skipped.
+    Otherwise, the database is still checked, since tokens
+    can be removed from the blocklist.
+    Tokens blocklisted by other processes can be accepted
+    for up to *refresh_interval* seconds.
+    Expired tokens are dropped from the set, they can't auth anyway.
+
+    The set is only trusted when it was loaded successfully
+    in the last *refresh_interval* seconds. Before the first load,
+    while an overdue refresh is running, or when it fails,
+    all tokens are checked in the database.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = (
+        '_expires_at',
+        '_lock',
+        '_refresh_started_at',
+        '_refreshed_at',
+        '_watermark',
+        'refresh_interval',
+    )
+
+    def __init__(
+        self,
+        *,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        """Create an empty set, it is loaded on the first check."""
+        self.refresh_interval = refresh_interval
+        self._expires_at: dict[str, float] = {}
+        self._watermark: dt.datetime | None = None
+        self._refreshed_at: float | None = None
+        self._refresh_started_at: float | None = None
+        self._lock = threading.Lock()
+
+    def add(self, jti: str | None, expires_at: dt.datetime) -> None:
+        """Add just blocklisted token id to the set."""
+        if jti is not None:
+            with self._lock:
+                self._expires_at[jti] = expires_at.timestamp()
+
+    def may_contain(
+        self,
+        model: type['BlocklistedJWToken'],
+        jti: str | None,
+    ) -> bool:
+        """Refresh the set if needed and check the token id."""
+        queryset = self._refresh_queryset(model)
+        if queryset is not None:
+            try:
+                self._update(list(queryset))
+            except Exception:
+                # The database check runs, when the set can't be refreshed:
+                return True
+            finally:
+                self._refresh_started_at = None
+        return self._contains(jti)
+
+    async def amay_contain(
+        self,
+        model: type['BlocklistedJWToken'],
+        jti: str | None,
+    ) -> bool:
+        """Async refresh the set if needed and check the token id."""
+        queryset = self._refresh_queryset(model)
+        if queryset is not None:
+            try:
+                self._update([row async for row in queryset])
+            except Exception:
+                # The database check runs, when the set can't be refreshed:
+                return True
+            finally:
+                self._refresh_started_at = None
+        return self._contains(jti)
+
+    def _contains(self, jti: str | None) -> bool:
+        if not self._is_fresh(time.time()):
+            return True
+        if jti is None:
+            return False
+        expires_at = self._expires_at.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def _refresh_queryset(
+        self,
+        model: type['BlocklistedJWToken'],
+    ) -> 'QuerySet[BlocklistedJWToken, _BlocklistRow] | None':
+        with self._lock:
+            now = time.time()
+            if self._is_fresh(now) or self._refresh_started_at is not None:
+                return None
+            # Other requests don't wait for this refresh to finish,
+            # they are checked in the database until it succeeds:
+            self._refresh_started_at = now
+            watermark = self._watermark
+
+        queryset = model.objects.filter(
+            expires_at__gt=dt.datetime.now(dt.UTC),
+        )
+        if watermark is not None:
+            queryset = queryset.filter(
+                created_at__gte=watermark - _WATERMARK_OVERLAP,
+            )
+        return queryset.values_list('jti', 'expires_at', 'created_at')
+
+    def _is_fresh(self, now: float) -> bool:
+        return (
+            self._refreshed_at is not None
+            and now - self._refreshed_at < self.refresh_interval
+        )
+
+    def _update(self, rows: Iterable[_BlocklistRow]) -> None:
+        with self._lock:
+            for jti, expires_at, created_at in rows:
+                self._expires_at[jti] = expires_at.timestamp()
+                if self._watermark is None or created_at > self._watermark:
+                    self._watermark = created_at
+            self._prune()
+            self._refreshed_at = self._refresh_started_at
+
+    def _prune(self) -> None:
+        now = time.time()
+        self._expires_at = {
+            cached_jti: cached_expires_at
+            for cached_jti, cached_expires_at in self._expires_at.items()
+            if cached_expires_at > now
+        }
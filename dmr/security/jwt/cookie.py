@@ -10,7 +10,9 @@ from dmr.internal.csrf import ensure_csrf
 from dmr.metadata import EndpointMetadata, ResponseSpec, ResponseSpecProvider
 from dmr.openapi.objects import Reference, SecurityScheme
 from dmr.security.jwt.auth import BaseJWTAsyncAuth, BaseJWTSyncAuth
+from dmr.security.jwt.keys import JWTKey, JWTKeySet
 from dmr.security.jwt.token import JWToken
+from dmr.security.user_cache import UserCache
 
 if TYPE_CHECKING:
     from dmr.controller import Controller
@@ -130,7 +132,7 @@ class CookieJWTSyncAuth(_BaseCookieJWTAuth, BaseJWTSyncAuth):
         user_id_field: str = 'pk',
         algorithm: str = 'HS256',
         security_scheme_name: str = 'jwt',
-        secret: str | None = None,
+        secret: 'JWTKey | JWTKeySet | None' = None,
         token_cls: type[JWToken] = JWToken,
         leeway: int = 0,  # seconds
         accepted_audiences: str | Sequence[str] | None = None,
@@ -143,6 +145,9 @@ class CookieJWTSyncAuth(_BaseCookieJWTAuth, BaseJWTSyncAuth):
         verify_subject: bool = True,
         strict_audience: bool = False,
         enforce_minimum_key_length: bool = True,
+        token_cache_size: int | None = None,
+        user_cache: UserCache | None = None,
+        lazy_user: bool = False,
     ) -> None:
         """
         Apply possible customizations.
@@ -168,6 +173,9 @@ class CookieJWTSyncAuth(_BaseCookieJWTAuth, BaseJWTSyncAuth):
             verify_subject=verify_subject,
             strict_audience=strict_audience,
             enforce_minimum_key_length=enforce_minimum_key_length,
+            token_cache_size=token_cache_size,
+            user_cache=user_cache,
+            lazy_user=lazy_user,
         )
         self.cookie_name = cookie_name
 
@@ -213,7 +221,7 @@ class CookieJWTAsyncAuth(_BaseCookieJWTAuth, BaseJWTAsyncAuth):
         user_id_field: str = 'pk',
         algorithm: str = 'HS256',
         security_scheme_name: str = 'jwt',
-        secret: str | None = None,
+        secret: 'JWTKey | JWTKeySet | None' = None,
         token_cls: type[JWToken] = JWToken,
         leeway: int = 0,  # seconds
         accepted_audiences: str | Sequence[str] | None = None,
@@ -226,6 +234,9 @@ class CookieJWTAsyncAuth(_BaseCookieJWTAuth, BaseJWTAsyncAuth):
         verify_subject: bool = True,
         strict_audience: bool = False,
         enforce_minimum_key_length: bool = True,
+        token_cache_size: int | None = None,
+        user_cache: UserCache | None = None,
+        lazy_user: bool = False,
     ) -> None:
         """
         Apply possible customizations.
@@ -251,6 +262,9 @@ class CookieJWTAsyncAuth(_BaseCookieJWTAuth, BaseJWTAsyncAuth):
             verify_subject=verify_subject,
             strict_audience=strict_audience,
             enforce_minimum_key_length=enforce_minimum_key_length,
+            token_cache_size=token_cache_size,
+            user_cache=user_cache,
+            lazy_user=lazy_user,
         )
         self.cookie_name = cookie_name
 
@@ -0,0 +1,96 @@
+import dataclasses
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Self, TypeAlias, final
+
+import jwt
+
+from dmr.envs import MAX_CACHE_SIZE
+from dmr.exceptions import NotAuthenticatedError
+
+if TYPE_CHECKING:
+    from jwt.algorithms import AllowedPrivateKeys, AllowedPublicKeys
+
+#: Any key that can be used to sign or to verify jwt tokens.
+JWTKey: TypeAlias = (
+    'str | bytes | jwt.PyJWK | AllowedPrivateKeys | AllowedPublicKeys'
+)
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True)
+class JWTKeySet:
+    """
+    Several verification keys, selected by the ``kid`` token header.
+
+    Useful for rotating keys without downtime:
+    new tokens are signed with the new key,
+    while tokens signed with the old one are still accepted.
+    Tokens without ``kid`` header or with unknown ``kid`` are rejected.
+
+    .. code:: python
+
+        >>> from dmr.security.jwt.keys import JWTKeySet
+
+        >>> key_set = JWTKeySet({'2026-01': 'first', '2026-02': 'second'})
+        >>> sorted(key_set.keys)
+        ['2026-01', '2026-02']
+
+    .. versionadded:: 0.15.0
+    """
+
+    keys: Mapping[str, JWTKey]
+
+    def get_key(self, encoded_token: str) -> JWTKey:
+        """Return the verification key for the token's ``kid`` header."""
+        try:
+            key_id = jwt.get_unverified_header(encoded_token).get('kid')
+        except jwt.exceptions.InvalidTokenError:
+            raise NotAuthenticatedError from None
+        key = self.keys.get(key_id) if isinstance(key_id, str) else None
+        if key is None:
+            raise NotAuthenticatedError
+        return key
+
+    @classmethod
+    def from_files(
+        cls,
+        key_files: Mapping[str, 'str | os.PathLike[str]'],
+        *,
+        algorithm: str,
+    ) -> Self:
+        """
+        Load and parse keys from local files by their ``kid``, only once.
+
+        Use it in import time, for example, in auth or controller definitions.
+        """
+        return cls({
+            key_id: prepare_key(Path(key_file).read_bytes(), algorithm)
+            for key_id, key_file in key_files.items()
+        })
+
+
+def prepare_key(key: JWTKey, algorithm: str) -> JWTKey:
+    """
+    Parse raw key for the *algorithm* into a key object.
+
+    PyJWT parses raw keys on every call, which is slow for asymmetric
+    algorithms, since PEM keys have to be loaded.
+    Parsed raw keys are cached, while key objects are returned as is.
+
+    .. versionadded:: 0.15.0
+    """
+    if isinstance(key, str | bytes):
+        return _prepare_raw_key(key, algorithm)
+    return key
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def _prepare_raw_key(key: str | bytes, algorithm: str) -> JWTKey:
+    try:
+        return jwt.get_algorithm_by_name(algorithm).prepare_key(key)  # type: ignore[no-any-return]
+    except (NotImplementedError, jwt.exceptions.PyJWTError, ValueError):
+        # Let `pyjwt` report invalid algorithms and keys as usual:
+        return key
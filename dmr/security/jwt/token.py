@@ -36,6 +36,7 @@ import jwt
 from jwt.types import Options
 
 from dmr.exceptions import InternalServerError, NotAuthenticatedError
+from dmr.security.jwt.keys import JWTKey, JWTKeySet, prepare_key
 
 
 @dataclass(frozen=True, slots=True)
@@ -105,7 +106,7 @@ class JWToken:
 
     def encode(
         self,
-        secret: str | bytes,
+        secret: JWTKey,
         algorithm: str,
         headers: dict[str, Any] | None = None,
     ) -> str:
@@ -113,7 +114,8 @@ class JWToken:
         Encode the token instance into a string.
 
         Args:
-            secret: The secret with which the JWT is encoded.
+            secret: The secret or the private key object
+                with which the JWT is encoded.
             algorithm: The algorithm used to encode the JWT.
             headers: Optional headers to include
                 in the JWT (e.g., {"kid": "..."}).
@@ -123,6 +125,10 @@ class JWToken:
 
         Raises:
             InternalServerError: If encoding fails.
+
+        .. versionchanged:: 0.15.0
+            Raw keys are parsed once and cached, key objects are supported.
+
         """
         try:
             return jwt.encode(
@@ -131,7 +137,7 @@ class JWToken:
                     for field_name, field_value in asdict(self).items()
                     if field_value is not None
                 },
-                key=secret,
+                key=prepare_key(secret, algorithm),  # type: ignore[arg-type]
                 algorithm=algorithm,
                 headers=headers,
             )
@@ -142,7 +148,7 @@ class JWToken:
     def decode_payload(  # noqa: WPS211
         cls,
         encoded_token: str,
-        secret: str,
+        secret: JWTKey,
         algorithms: list[str],
         *,
         leeway: int,
@@ -151,9 +157,11 @@ class JWToken:
         options: Options | None,
     ) -> dict[str, Any]:
         """Decode and verify the JWT and return its payload."""
+        if len(algorithms) == 1:
+            secret = prepare_key(secret, algorithms[0])
         return jwt.decode(
             encoded_token,
-            key=secret,
+            key=secret,  # type: ignore[arg-type]
             algorithms=algorithms,
             issuer=issuer,
             audience=audience,
@@ -165,7 +173,7 @@ class JWToken:
     def decode(  # noqa: WPS211
         cls,
         encoded_token: str,
-        secret: str,
+        secret: 'JWTKey | JWTKeySet',
         algorithm: str,
         *,
         leeway: int = 0,  # seconds
@@ -185,7 +193,10 @@ class JWToken:
 
         Args:
             encoded_token: A base64 string containing an encoded JWT.
-            secret: The secret with which the JWT is encoded.
+            secret: The secret or the public key object
+                with which the JWT is verified.
+                Pass :class:`~dmr.security.jwt.keys.JWTKeySet`
+                to select the key by ``kid`` token header.
             algorithm: The algorithm used to encode the JWT.
             leeway: Number of potential seconds as a clock error
                 for expired tokens.
@@ -218,6 +229,10 @@ class JWToken:
         See also:
             https://pyjwt.readthedocs.io/en/stable/api.html#jwt.types.Options
 
+        .. versionchanged:: 0.15.0
+            Raw keys are parsed once and cached, key objects
+            and :class:`~dmr.security.jwt.keys.JWTKeySet` are supported.
+
         """
         options = cls._build_options(
             audience=accepted_audiences,
@@ -235,7 +250,11 @@ class JWToken:
         try:
             payload = cls.decode_payload(
                 encoded_token=encoded_token,
-                secret=secret,
+                secret=(
+                    secret.get_key(encoded_token)
+                    if isinstance(secret, JWTKeySet)
+                    else secret
+                ),
                 algorithms=[algorithm],
                 audience=accepted_audiences,
                 issuer=accepted_issuers,
@@ -10,14 +10,16 @@ from django.contrib.auth import aauthenticate, authenticate
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.http import HttpRequest
 from django.views.decorators.debug import sensitive_post_parameters
-from typing_extensions import TypedDict
+from typing_extensions import TypedDict, override
 
 from dmr import Body, Controller, ResponseSpec, modify
 from dmr.decorators import endpoint_decorator
 from dmr.errors import ErrorModel
 from dmr.exceptions import NotAuthenticatedError
 from dmr.security.jwt.auth import USER_LOOKUP_ERRORS, set_request_attrs
+from dmr.security.jwt.keys import JWTKey, JWTKeySet
 from dmr.security.jwt.token import JWToken
+from dmr.security.login_executor import LoginExecutor
 from dmr.serializer import BaseSerializer
 
 _ObtainTokensT = TypeVar('_ObtainTokensT', bound=Mapping[str, Any])
@@ -57,7 +59,9 @@ class _BaseTokenSettings:
     jwt_issuer: ClassVar[str | None] = None
     jwt_algorithm: ClassVar[str] = 'HS256'
     jwt_expiration: ClassVar[dt.timedelta] = dt.timedelta(days=1)
-    jwt_secret: ClassVar[str | None] = None
+    jwt_secret: ClassVar['JWTKey | None'] = None
+    jwt_key_id: ClassVar[str | None] = None
+    jwt_verification_key: ClassVar['JWTKey | JWTKeySet | None'] = None
     jwt_token_cls: ClassVar[type[JWToken]] = JWToken
 
 
@@ -82,7 +86,7 @@ class _BaseTokenController(
         issuer: str | None = None,
         audiences: str | Sequence[str] | None = None,
         jwt_id: str | None = None,
-        secret: str | None = None,
+        secret: 'JWTKey | None' = None,
         algorithm: str | None = None,
         token_headers: dict[str, Any] | None = None,
     ) -> str:
@@ -97,13 +101,22 @@ class _BaseTokenController(
         ).encode(
             secret=secret or self.jwt_secret or settings.SECRET_KEY,
             algorithm=algorithm or self.jwt_algorithm,
-            headers=token_headers,
+            headers=(
+                {'kid': self.jwt_key_id, **(token_headers or {})}
+                if self.jwt_key_id
+                else token_headers
+            ),
         )
 
     def make_jwt_id(self) -> str | None:
         """Create unique token's jwt id."""
         return uuid.uuid4().hex
 
+    def _jwt_verification_key(self) -> 'JWTKey | JWTKeySet':
+        return (
+            self.jwt_verification_key or self.jwt_secret or settings.SECRET_KEY
+        )
+
 
 class ObtainTokensSyncController(
     _BaseTokenController[_SerializerT],
@@ -118,8 +131,12 @@ class ObtainTokensSyncController(
         jwt_algorithm: Default algorithm to use for token signing.
         jwt_expiration: Default access token expiration timedelta.
         jwt_refresh_expiration: Default refresh token expiration timedelta.
-        jwt_secret: Alternative token secret for signing.
+        jwt_secret: Alternative token secret or private key for signing.
             By default uses ``secret.SECRET_KEY``
+        jwt_key_id: Optional ``kid`` header of signed tokens.
+        jwt_verification_key: Alternative secret, public key, or
+            :class:`~dmr.security.jwt.keys.JWTKeySet` for verifying tokens.
+            By default uses ``jwt_secret``
         jwt_token_cls: Possible custom JWT token class.
 
     See also:
@@ -194,23 +211,44 @@ class ObtainTokensAsyncController(
         jwt_algorithm: Default algorithm to use for token signing.
         jwt_expiration: Default token expiration timedelta.
         jwt_refresh_expiration: Default refresh token expiration timedelta.
-        jwt_secret: Alternative token secret for signing.
+        jwt_secret: Alternative token secret or private key for signing.
             By default uses ``secret.SECRET_KEY``
+        jwt_key_id: Optional ``kid`` header of signed tokens.
+        jwt_verification_key: Alternative secret, public key, or
+            :class:`~dmr.security.jwt.keys.JWTKeySet` for verifying tokens.
+            By default uses ``jwt_secret``
         jwt_token_cls: Possible custom JWT token class.
+        login_executor: Optional dedicated executor to verify credentials,
+            see :class:`~dmr.security.login_executor.LoginExecutor`.
+            Adds ``429`` response for rejected logins, when set.
 
     See also:
         https://pyjwt.readthedocs.io/en/stable
         for all the JWT terms and options explanation.
 
+    .. versionchanged:: 0.15.0
+        Added *login_executor* attribute.
+
     """
 
-    responses = (
+    login_executor: ClassVar[LoginExecutor | None] = None
+
+    responses: ClassVar[Sequence[ResponseSpec]] = (
         ResponseSpec(
             return_type=ErrorModel,
             status_code=HTTPStatus.UNAUTHORIZED,
         ),
     )
 
+    @override
+    def __init_subclass__(cls) -> None:
+        if cls.login_executor is not None:
+            cls.responses = cls.login_executor.add_response_spec(
+                cls.responses,
+                cls.error_model,
+            )
+        super().__init_subclass__()
+
     @endpoint_decorator(sensitive_post_parameters())
     @modify(status_code=HTTPStatus.OK)
     async def post(self, parsed_body: Body[_ObtainTokensT]) -> _TokensResponseT:
@@ -219,10 +257,14 @@ class ObtainTokensAsyncController(
 
     async def login(self, parsed_body: _ObtainTokensT) -> _TokensResponseT:
         """Perform the async login routine for user."""
-        user = await aauthenticate(
-            self.request,
-            **(await self.convert_auth_payload(parsed_body)),
-        )
+        credentials = await self.convert_auth_payload(parsed_body)
+        if self.login_executor is None:
+            user = await aauthenticate(self.request, **credentials)
+        else:
+            user = await self.login_executor.aauthenticate(
+                self.request,
+                **credentials,
+            )
         if user is None:
             raise NotAuthenticatedError
         await self.set_request_attrs(self.request, user)
@@ -269,7 +311,7 @@ class _BaseRefreshTokenController(_BaseTokenController[_SerializerT]):
     def _decode_and_validate_refresh_token(self, encoded_token: str) -> JWToken:
         token = self.jwt_token_cls.decode(
             encoded_token=encoded_token,
-            secret=self.jwt_secret or settings.SECRET_KEY,
+            secret=self._jwt_verification_key(),
             algorithm=self.jwt_algorithm,
             accepted_audiences=self.jwt_audiences,
             accepted_issuers=self.jwt_issuer,
@@ -297,8 +339,12 @@ class RefreshTokenSyncController(
         jwt_algorithm: Default algorithm to use for token signing.
         jwt_expiration: Default token expiration timedelta.
         jwt_refresh_expiration: Default refresh token expiration timedelta.
-        jwt_secret: Alternative token secret for signing.
+        jwt_secret: Alternative token secret or private key for signing.
             By default uses ``secret.SECRET_KEY``
+        jwt_key_id: Optional ``kid`` header of signed tokens.
+        jwt_verification_key: Alternative secret, public key, or
+            :class:`~dmr.security.jwt.keys.JWTKeySet` for verifying tokens.
+            By default uses ``jwt_secret``
         jwt_token_cls: Possible custom JWT token class.
 
     """
@@ -375,8 +421,12 @@ class RefreshTokenAsyncController(
         jwt_algorithm: Default algorithm to use for token signing.
         jwt_expiration: Default token expiration timedelta.
         jwt_refresh_expiration: Default refresh token expiration timedelta.
-        jwt_secret: Alternative token secret for signing.
+        jwt_secret: Alternative token secret or private key for signing.
             By default uses ``secret.SECRET_KEY``
+        jwt_key_id: Optional ``kid`` header of signed tokens.
+        jwt_verification_key: Alternative secret, public key, or
+            :class:`~dmr.security.jwt.keys.JWTKeySet` for verifying tokens.
+            By default uses ``jwt_secret``
         jwt_token_cls: Possible custom JWT token class.
 
     """
@@ -453,7 +503,7 @@ class _BaseVerifyTokenController(_BaseTokenController[_SerializerT]):
     def _decode_and_validate_access_token(self, encoded_token: str) -> JWToken:
         token = self.jwt_token_cls.decode(
             encoded_token=encoded_token,
-            secret=self.jwt_secret or settings.SECRET_KEY,
+            secret=self._jwt_verification_key(),
             algorithm=self.jwt_algorithm,
             accepted_audiences=self.jwt_audiences,
             accepted_issuers=self.jwt_issuer,
@@ -484,8 +534,12 @@ class VerifyTokenSyncController(
         jwt_algorithm: Default algorithm to use for token signing.
         jwt_expiration: Default token expiration timedelta.
         jwt_refresh_expiration: Default refresh token expiration timedelta.
-        jwt_secret: Alternative token secret for signing.
+        jwt_secret: Alternative token secret or private key for signing.
             By default uses ``secret.SECRET_KEY``
+        jwt_key_id: Optional ``kid`` header of signed tokens.
+        jwt_verification_key: Alternative secret, public key, or
+            :class:`~dmr.security.jwt.keys.JWTKeySet` for verifying tokens.
+            By default uses ``jwt_secret``
         jwt_token_cls: Possible custom JWT token class.
 
     """
@@ -554,8 +608,12 @@ class VerifyTokenAsyncController(
         jwt_algorithm: Default algorithm to use for token signing.
         jwt_expiration: Default token expiration timedelta.
         jwt_refresh_expiration: Default refresh token expiration timedelta.
-        jwt_secret: Alternative token secret for signing.
+        jwt_secret: Alternative token secret or private key for signing.
             By default uses ``secret.SECRET_KEY``
+        jwt_key_id: Optional ``kid`` header of signed tokens.
+        jwt_verification_key: Alternative secret, public key, or
+            :class:`~dmr.security.jwt.keys.JWTKeySet` for verifying tokens.
+            By default uses ``jwt_secret``
         jwt_token_cls: Possible custom JWT token class.
 
     """
@@ -0,0 +1,187 @@
+import asyncio
+import contextvars
+import dataclasses
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Final, final
+
+from django.contrib.auth import authenticate
+from django.db import close_old_connections
+from django.http import HttpRequest
+
+from dmr.exceptions import TooManyRequestsError
+from dmr.headers import HeaderSpec
+from dmr.metadata import ResponseSpec
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+#: Default number of threads that verify credentials at the same time.
+DEFAULT_MAX_WORKERS: Final = 4
+
+#: Default number of logins that can wait for a free thread.
+DEFAULT_MAX_QUEUE: Final = 32
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True)
+class LoginExecutorStats:
+    """
+    Current state of :class:`LoginExecutor`.
+
+    Attributes:
+        running: Logins that are verifying credentials right now.
+        queued: Logins that are waiting for a free thread.
+        rejected: Total logins rejected since the executor was created.
+
+    .. versionadded:: 0.15.0
+    """
+
+    running: int
+    queued: int
+    rejected: int
+
+
+@final
+class LoginExecutor:
+    """
+    Dedicated bounded thread pool to verify credentials in async logins.
+
+    Django's ``aauthenticate`` runs password hashing, which takes
+    hundreds of milliseconds of CPU, on the executor
+    shared with all other ``sync_to_async`` calls.
+    A burst of logins would slow down everything else.
+
+    This executor runs at most *max_workers* logins at the same time,
+    and at most *max_queue* logins can wait for a free thread.
+    Other logins are rejected with
+    :exc:`~dmr.exceptions.TooManyRequestsError` right away.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = (
+        '_executor',
+        '_lock',
+        '_queued',
+        '_rejected',
+        '_running',
+        'max_queue',
+        'max_workers',
+        'retry_after',
+    )
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        retry_after: int = 1,
+    ) -> None:
+        """
+        Create the executor, threads are started on demand.
+
+        Parameters:
+            max_workers: Number of threads to verify credentials.
+            max_queue: Number of logins that can wait for a free thread.
+            retry_after: Value of ``Retry-After`` header for rejected logins.
+
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers,
+            thread_name_prefix='dmr-login',
+        )
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._rejected = 0
+
+    async def aauthenticate(
+        self,
+        request: HttpRequest,
+        **credentials: Any,
+    ) -> 'AbstractBaseUser | None':
+        """Run :func:`django.contrib.auth.authenticate` in this executor."""
+        with self._lock:
+            if (
+                self._running + self._queued
+                >= self.max_workers + self.max_queue
+            ):
+                self._rejected += 1
+                raise TooManyRequestsError(
+                    headers={'Retry-After': str(self.retry_after)},
+                )
+            self._queued += 1
+
+        future = self._executor.submit(
+            contextvars.copy_context().run,
+            self._authenticate,
+            request,
+            credentials,
+        )
+        future.add_done_callback(self._cancelled)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> LoginExecutorStats:
+        """Return current concurrency and queue depth, for metrics."""
+        with self._lock:
+            return LoginExecutorStats(
+                running=self._running,
+                queued=self._queued,
+                rejected=self._rejected,
+            )
+
+    def add_response_spec(
+        self,
+        responses: Sequence[ResponseSpec],
+        error_model: Any,
+    ) -> Sequence[ResponseSpec]:
+        """
+        Add the spec of rejected logins to the controller's *responses*.
+
+        Does nothing, when *responses* already have ``429`` response.
+        """
+        status_code = TooManyRequestsError.status_code
+        if any(response.status_code == status_code for response in responses):
+            return responses
+        return (
+            *responses,
+            ResponseSpec(
+                error_model,
+                status_code=status_code,
+                headers={
+                    'Retry-After': HeaderSpec(
+                        description=(
+                            'Indicates how long the user agent should wait '
+                            'before making a follow-up request'
+                        ),
+                    ),
+                },
+                description='Raised when there are too many logins at once',
+            ),
+        )
+
+    def _authenticate(
+        self,
+        request: HttpRequest,
+        credentials: Mapping[str, Any],
+    ) -> 'AbstractBaseUser | None':
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:  # noqa: WPS501
+            return authenticate(request, **credentials)
+        finally:
+            # Threads of this executor don't get `request_finished` signal:
+            close_old_connections()
+            with self._lock:
+                self._running -= 1
+
+    def _cancelled(self, future: 'Future[Any]') -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
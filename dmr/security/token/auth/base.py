@@ -1,6 +1,7 @@
 import abc
+import datetime as dt
 import importlib
-from typing import TYPE_CHECKING, Any, Generic, Self
+from typing import TYPE_CHECKING, Any, Generic, Self, cast
 
 from django.http import HttpRequest
 from typing_extensions import TypeVar, override
@@ -8,16 +9,20 @@ from typing_extensions import TypeVar, override
 from dmr.exceptions import NotAuthenticatedError
 from dmr.openapi.objects import SecurityRequirement
 from dmr.security.base import AsyncAuth, SyncAuth
+from dmr.security.token.cache import TokenCache
+from dmr.security.token.last_used import LastUsedBatch
 from dmr.security.token.request import set_request_attrs
 from dmr.security.token.token import (
     DEFAULT_TOKEN_ALGORITHM,
     DEFAULT_TOKEN_SALT,
     TokenLikeAsync,
     TokenLikeSync,
+    get_token_hash,
 )
 
 if TYPE_CHECKING:
     from django.contrib.auth.base_user import AbstractBaseUser
+    from django.db import models
 
     from dmr.controller import Controller
     from dmr.endpoint import Endpoint
@@ -30,7 +35,7 @@ _TokenLikeT = TypeVar(
 )
 
 
-class _BaseTokenAuth(Generic[_TokenLikeT]):
+class _BaseTokenAuth(Generic[_TokenLikeT]):  # noqa: WPS230
     """
     Token auth.
 
@@ -40,6 +45,12 @@ class _BaseTokenAuth(Generic[_TokenLikeT]):
             Default to ``settings.SECRET_KEY``.
         token_salt: What salt should we use for token hash?
         token_algorithm: What algorithm should we use for token hash?
+        last_used_interval: Skip ``last_used_at`` updates
+            when the token was used more recently than this.
+        last_used_batch: Collect used tokens to update them in bulk,
+            see :class:`~dmr.security.token.last_used.LastUsedBatch`.
+        token_cache: Cache found tokens with their users,
+            see :class:`~dmr.security.token.cache.TokenCache`.
 
     .. note::
 
@@ -59,18 +70,25 @@ class _BaseTokenAuth(Generic[_TokenLikeT]):
         methods to work inside a transaction with ``.select_for_update()``
         on token instance.
 
+    .. versionchanged:: 0.15.0
+        Added *last_used_interval*, *last_used_batch*,
+        and *token_cache* parameters.
+
     """
 
     __slots__ = (
         '_token_model',
         '_update_last_used',
+        'last_used_batch',
+        'last_used_interval',
         'security_scheme_name',
         'token_algorithm',
+        'token_cache',
         'token_salt',
         'token_secret',
     )
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         *,
         security_scheme_name: str = 'token',
@@ -78,6 +96,9 @@ class _BaseTokenAuth(Generic[_TokenLikeT]):
         token_secret: str | None = None,
         token_salt: str = DEFAULT_TOKEN_SALT,
         token_algorithm: str = DEFAULT_TOKEN_ALGORITHM,
+        last_used_interval: dt.timedelta | None = None,
+        last_used_batch: LastUsedBatch | None = None,
+        token_cache: TokenCache | None = None,
     ) -> None:
         self.security_scheme_name = security_scheme_name
         self._update_last_used = update_last_used
@@ -85,6 +106,9 @@ class _BaseTokenAuth(Generic[_TokenLikeT]):
         self.token_secret = token_secret
         self.token_salt = token_salt
         self.token_algorithm = token_algorithm
+        self.last_used_interval = last_used_interval
+        self.last_used_batch = last_used_batch
+        self.token_cache = token_cache
         self._token_model: type[_TokenLikeT] | None = None
 
     @abc.abstractmethod
@@ -103,6 +127,31 @@ class _BaseTokenAuth(Generic[_TokenLikeT]):
         """Provides a security schema usage requirement."""
         return {self.security_scheme_name: []}
 
+    def _token_hash(self, raw_token: str) -> str:
+        return get_token_hash(
+            raw_token,
+            secret=self.token_secret,
+            salt=self.token_salt,
+            algorithm=self.token_algorithm,
+        )
+
+    def _touch_cached(self, raw_token: str, used_at: dt.datetime) -> None:
+        # Bulk updates do not refresh cached tokens by themselves:
+        if self.token_cache is not None:
+            self.token_cache.touch(self._token_hash(raw_token), used_at)
+
+    def _needs_mark_used(self, token: _TokenLikeT) -> bool:
+        if not self._update_last_used:
+            return False
+        if self.last_used_interval is None:
+            return True
+        # Custom token models might not have this field:
+        last_used_at = getattr(token, 'last_used_at', None)
+        return (
+            last_used_at is None
+            or dt.datetime.now(dt.UTC) - last_used_at >= self.last_used_interval
+        )
+
 
 class BaseTokenSyncAuth(_BaseTokenAuth[TokenLikeSync[Any]], SyncAuth):  # noqa: WPS214
     """Shared sync authentication pipeline for single-source token auth."""
@@ -132,8 +181,8 @@ class BaseTokenSyncAuth(_BaseTokenAuth[TokenLikeSync[Any]], SyncAuth):  # noqa:
         self.check_token(token)
         user = token.get_user()
         self.check_user(user)
-        if self._update_last_used:
-            token.mark_used()
+        if self._needs_mark_used(token):
+            self.mark_used(token, raw_token=raw_token)
         self.set_request_attrs(request, user, token=token)
         return user
 
@@ -150,15 +199,15 @@ class BaseTokenSyncAuth(_BaseTokenAuth[TokenLikeSync[Any]], SyncAuth):  # noqa:
         return self._token_model
 
     def get_token(self, raw_token: str) -> TokenLikeSync:
-        """Look up and validate the token from the DB."""
-        token = self.token_model.find_raw(
-            raw_token,
-            token_secret=self.token_secret,
-            token_salt=self.token_salt,
-            token_algorithm=self.token_algorithm,
-        )
+        """Look up and validate the token from the cache or the DB."""
+        if self.token_cache is None:
+            return self._find_token(raw_token)
+
+        token_hash = self._token_hash(raw_token)
+        token = self.token_cache.get(token_hash, self.token_model)
         if token is None:
-            raise NotAuthenticatedError
+            token = self._find_token(raw_token)
+            self.token_cache.set(token_hash, token, user=token.get_user())
         return token
 
     def check_token(self, token: TokenLikeSync) -> None:
@@ -171,6 +220,14 @@ class BaseTokenSyncAuth(_BaseTokenAuth[TokenLikeSync[Any]], SyncAuth):  # noqa:
         if not user.is_active:
             raise NotAuthenticatedError
 
+    def mark_used(self, token: TokenLikeSync, *, raw_token: str) -> None:
+        """Update token's ``last_used_at``, right away or in a batch."""
+        if self.last_used_batch is None:
+            token.mark_used()
+            return
+        used_at = self.last_used_batch.add(cast('models.Model', token))
+        self._touch_cached(raw_token, used_at)
+
     def set_request_attrs(
         self,
         request: HttpRequest,
@@ -181,6 +238,17 @@ class BaseTokenSyncAuth(_BaseTokenAuth[TokenLikeSync[Any]], SyncAuth):  # noqa:
         """Set current user as authed for this request."""
         set_request_attrs(request, user, token=token)
 
+    def _find_token(self, raw_token: str) -> TokenLikeSync:
+        token = self.token_model.find_raw(
+            raw_token,
+            token_secret=self.token_secret,
+            token_salt=self.token_salt,
+            token_algorithm=self.token_algorithm,
+        )
+        if token is None:
+            raise NotAuthenticatedError
+        return token
+
 
 class BaseTokenAsyncAuth(_BaseTokenAuth[TokenLikeAsync[Any]], AsyncAuth):  # noqa: WPS214
     """Shared async authentication pipeline for single-source token auth."""
@@ -210,8 +278,8 @@ class BaseTokenAsyncAuth(_BaseTokenAuth[TokenLikeAsync[Any]], AsyncAuth):  # noq
         await self.check_token(token)
         user = await token.aget_user()
         await self.check_user(user)
-        if self._update_last_used:
-            await token.amark_used()
+        if self._needs_mark_used(token):
+            await self.mark_used(token, raw_token=raw_token)
         await self.set_request_attrs(request, user, token=token)
         return user
 
@@ -228,15 +296,16 @@ class BaseTokenAsyncAuth(_BaseTokenAuth[TokenLikeAsync[Any]], AsyncAuth):  # noq
         return self._token_model
 
     async def get_token(self, raw_token: str) -> TokenLikeAsync:
-        """Look up and validate the token from the DB."""
-        token = await self.token_model.afind_raw(
-            raw_token,
-            token_secret=self.token_secret,
-            token_salt=self.token_salt,
-            token_algorithm=self.token_algorithm,
-        )
+        """Look up and validate the token from the cache or the DB."""
+        if self.token_cache is None:
+            return await self._find_token(raw_token)
+
+        token_hash = self._token_hash(raw_token)
+        token = self.token_cache.get(token_hash, self.token_model)
         if token is None:
-            raise NotAuthenticatedError
+            token = await self._find_token(raw_token)
+            user = await token.aget_user()
+            self.token_cache.set(token_hash, token, user=user)
         return token
 
     async def check_token(self, token: TokenLikeAsync) -> None:
@@ -249,6 +318,19 @@ class BaseTokenAsyncAuth(_BaseTokenAuth[TokenLikeAsync[Any]], AsyncAuth):  # noq
         if not user.is_active:
             raise NotAuthenticatedError
 
+    async def mark_used(
+        self,
+        token: TokenLikeAsync,
+        *,
+        raw_token: str,
+    ) -> None:
+        """Update token's ``last_used_at``, right away or in a batch."""
+        if self.last_used_batch is None:
+            await token.amark_used()
+            return
+        used_at = await self.last_used_batch.aadd(cast('models.Model', token))
+        self._touch_cached(raw_token, used_at)
+
     async def set_request_attrs(
         self,
         request: HttpRequest,
@@ -259,6 +341,17 @@ class BaseTokenAsyncAuth(_BaseTokenAuth[TokenLikeAsync[Any]], AsyncAuth):  # noq
         """Set current user as authed for this request."""
         set_request_attrs(request, user, token=token)
 
+    async def _find_token(self, raw_token: str) -> TokenLikeAsync:
+        token = await self.token_model.afind_raw(
+            raw_token,
+            token_secret=self.token_secret,
+            token_salt=self.token_salt,
+            token_algorithm=self.token_algorithm,
+        )
+        if token is None:
+            raise NotAuthenticatedError
+        return token
+
 
 def _load_default_model() -> Any:
     # This is needed, so we can trick the `import-linter`
@@ -1,3 +1,4 @@
+import datetime as dt
 from collections.abc import Mapping
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Final, Self
@@ -10,6 +11,8 @@ from dmr.internal.csrf import ensure_csrf
 from dmr.metadata import EndpointMetadata, ResponseSpec, ResponseSpecProvider
 from dmr.openapi.objects import Reference, SecurityScheme
 from dmr.security.token.auth.base import BaseTokenAsyncAuth, BaseTokenSyncAuth
+from dmr.security.token.cache import TokenCache
+from dmr.security.token.last_used import LastUsedBatch
 from dmr.security.token.token import DEFAULT_TOKEN_ALGORITHM, DEFAULT_TOKEN_SALT
 
 if TYPE_CHECKING:
@@ -95,7 +98,7 @@ class CookieTokenSyncAuth(_BaseCookieTokenAuth, BaseTokenSyncAuth):
 
     __slots__ = ('cookie_name',)
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         *,
         cookie_name: str = _DEFAULT_PARAM,
@@ -104,6 +107,9 @@ class CookieTokenSyncAuth(_BaseCookieTokenAuth, BaseTokenSyncAuth):
         token_secret: str | None = None,
         token_salt: str = DEFAULT_TOKEN_SALT,
         token_algorithm: str = DEFAULT_TOKEN_ALGORITHM,
+        last_used_interval: dt.timedelta | None = None,
+        last_used_batch: LastUsedBatch | None = None,
+        token_cache: TokenCache | None = None,
     ) -> None:
         """Apply possible customizations."""
         super().__init__(
@@ -112,6 +118,9 @@ class CookieTokenSyncAuth(_BaseCookieTokenAuth, BaseTokenSyncAuth):
             token_secret=token_secret,
             token_salt=token_salt,
             token_algorithm=token_algorithm,
+            last_used_interval=last_used_interval,
+            last_used_batch=last_used_batch,
+            token_cache=token_cache,
         )
         self.cookie_name = cookie_name
 
@@ -144,7 +153,7 @@ class CookieTokenAsyncAuth(_BaseCookieTokenAuth, BaseTokenAsyncAuth):
 
     __slots__ = ('cookie_name',)
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         *,
         cookie_name: str = _DEFAULT_PARAM,
@@ -153,6 +162,9 @@ class CookieTokenAsyncAuth(_BaseCookieTokenAuth, BaseTokenAsyncAuth):
         token_secret: str | None = None,
         token_salt: str = DEFAULT_TOKEN_SALT,
         token_algorithm: str = DEFAULT_TOKEN_ALGORITHM,
+        last_used_interval: dt.timedelta | None = None,
+        last_used_batch: LastUsedBatch | None = None,
+        token_cache: TokenCache | None = None,
     ) -> None:
         """Apply possible customizations."""
         super().__init__(
@@ -161,6 +173,9 @@ class CookieTokenAsyncAuth(_BaseCookieTokenAuth, BaseTokenAsyncAuth):
             token_secret=token_secret,
             token_salt=token_salt,
             token_algorithm=token_algorithm,
+            last_used_interval=last_used_interval,
+            last_used_batch=last_used_batch,
+            token_cache=token_cache,
         )
         self.cookie_name = cookie_name
 
@@ -1,9 +1,12 @@
+import datetime as dt
 from typing import Final
 
 from django.http import HttpRequest
 
 from dmr.openapi.objects import Reference, SecurityScheme
 from dmr.security.token.auth.base import BaseTokenAsyncAuth, BaseTokenSyncAuth
+from dmr.security.token.cache import TokenCache
+from dmr.security.token.last_used import LastUsedBatch
 from dmr.security.token.token import DEFAULT_TOKEN_ALGORITHM, DEFAULT_TOKEN_SALT
 
 _AUTH_DESCRIPTION: Final = 'Opaque token authentication'
@@ -68,6 +71,9 @@ class HeaderTokenSyncAuth(_BaseHeaderTokenAuth, BaseTokenSyncAuth):
         token_secret: str | None = None,
         token_salt: str = DEFAULT_TOKEN_SALT,
         token_algorithm: str = DEFAULT_TOKEN_ALGORITHM,
+        last_used_interval: dt.timedelta | None = None,
+        last_used_batch: LastUsedBatch | None = None,
+        token_cache: TokenCache | None = None,
     ) -> None:
         """
         Apply possible customizations.
@@ -109,6 +115,9 @@ class HeaderTokenSyncAuth(_BaseHeaderTokenAuth, BaseTokenSyncAuth):
             token_secret=token_secret,
             token_salt=token_salt,
             token_algorithm=token_algorithm,
+            last_used_interval=last_used_interval,
+            last_used_batch=last_used_batch,
+            token_cache=token_cache,
         )
         self.header_name = header_name
         self.prefix = prefix
@@ -133,6 +142,9 @@ class HeaderTokenAsyncAuth(_BaseHeaderTokenAuth, BaseTokenAsyncAuth):
         token_secret: str | None = None,
         token_salt: str = DEFAULT_TOKEN_SALT,
         token_algorithm: str = DEFAULT_TOKEN_ALGORITHM,
+        last_used_interval: dt.timedelta | None = None,
+        last_used_batch: LastUsedBatch | None = None,
+        token_cache: TokenCache | None = None,
     ) -> None:
         """Apply possible customizations. See :class:`HeaderTokenSyncAuth`."""
         super().__init__(
@@ -141,6 +153,9 @@ class HeaderTokenAsyncAuth(_BaseHeaderTokenAuth, BaseTokenAsyncAuth):
             token_secret=token_secret,
             token_salt=token_salt,
             token_algorithm=token_algorithm,
+            last_used_interval=last_used_interval,
+            last_used_batch=last_used_batch,
+            token_cache=token_cache,
         )
         self.header_name = header_name
         self.prefix = prefix
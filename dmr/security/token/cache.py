@@ -0,0 +1,317 @@
+import dataclasses
+import datetime as dt
+import threading
+import time
+from collections.abc import Collection
+from itertools import starmap
+from typing import TYPE_CHECKING, Any, Final, TypeAlias, TypeVar, cast, final
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+
+from dmr.internal.ttl_cache import TTLCache
+from dmr.security.token.token import TokenLikeAsync, TokenLikeSync
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+#: Default number of tokens to keep in process memory.
+DEFAULT_TOKEN_CACHE_SIZE: Final = 1000
+
+#: Default user fields to cache, besides the primary key and the username.
+DEFAULT_USER_FIELDS: Final = ('is_active', 'is_staff', 'is_superuser')
+
+# Saving only these fields does not change whether the token can auth:
+_LAST_USED_FIELDS: Final = frozenset(('last_used_at', 'updated_at'))
+
+_TokenLike: TypeAlias = TokenLikeSync[Any] | TokenLikeAsync[Any]
+_TokenT = TypeVar('_TokenT', bound=_TokenLike)
+# Token model and primary key:
+_TokenKey: TypeAlias = tuple[type[models.Model], Any]
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """Immutable field values of a model instance."""
+
+    # Not `type[Model]`, because it is matched against token protocols:
+    model: type[Any]
+    pk: Any
+    db: str | None
+    field_names: tuple[str, ...]
+    field_values: tuple[Any, ...]
+
+    @classmethod
+    def take(
+        cls,
+        instance: models.Model,
+        only: Collection[str] | None = None,
+    ) -> '_Snapshot':
+        # Fields must keep the model's order, other fields are deferred:
+        fields = [
+            field
+            for field in instance._meta.concrete_fields  # noqa: SLF001
+            if only is None
+            or field.primary_key
+            or field.name in only
+            or field.attname in only
+        ]
+        return cls(
+            model=type(instance),
+            pk=instance.pk,
+            db=instance._state.db,  # noqa: SLF001
+            field_names=tuple(field.attname for field in fields),
+            field_values=tuple(
+                getattr(instance, field.attname) for field in fields
+            ),
+        )
+
+    def replace(self, **field_values: Any) -> '_Snapshot':
+        return dataclasses.replace(
+            self,
+            field_values=tuple(
+                starmap(
+                    field_values.get,
+                    zip(self.field_names, self.field_values, strict=True),
+                ),
+            ),
+        )
+
+    def restore(self) -> models.Model:
+        # Every request gets its own instance, just like from the database:
+        return cast(
+            models.Model,
+            self.model.from_db(
+                self.db,
+                list(self.field_names),
+                list(self.field_values),
+            ),
+        )
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CachedToken:
+    token: _Snapshot
+    user: _Snapshot
+    # Name of the token's foreign key to the user, if there's one:
+    user_field: str | None
+
+    @property
+    def token_key(self) -> _TokenKey:
+        return (self.token.model, self.token.pk)
+
+    def restore(self) -> models.Model:
+        token = self.token.restore()
+        if self.user_field is not None:
+            user_field = token._meta.get_field(self.user_field)  # noqa: SLF001
+            # So `get_user()` does not query the database:
+            user_field.set_cached_value(token, self.user.restore())  # type: ignore[union-attr]
+        return token
+
+
+@final
+class TokenCache:  # noqa: WPS214
+    """
+    In-process cache of tokens, with their users, by token hash.
+
+    Saves a database query with a join for every request
+    made with the same token within *ttl* seconds.
+    Tokens are still checked to be active and not expired on every request.
+
+    Only immutable field values of tokens and users are cached,
+    every request gets its own fresh token and user instances.
+    Users only get their primary key, username and *user_fields* cached,
+    other user fields are deferred and loaded from the database on access.
+
+    Tokens are dropped from the cache when they are saved or deleted,
+    for example, by :meth:`~dmr.security.token.app.models.Token.revoke`,
+    and when their users are saved or deleted, for example, deactivated.
+    Saves of ``last_used_at`` only update the cached value,
+    so do bulk updates by :class:`~dmr.security.token.last_used.LastUsedBatch`
+    via :meth:`touch`.
+    Only changes made by the same process are seen,
+    other changes are picked up after *ttl* seconds.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = (
+        '__weakref__',
+        '_cache',
+        '_lock',
+        '_senders',
+        '_token_hashes',
+        '_user_hashes',
+        'maxsize',
+        'ttl',
+        'user_fields',
+    )
+
+    def __init__(
+        self,
+        *,
+        ttl: int,
+        maxsize: int = DEFAULT_TOKEN_CACHE_SIZE,
+        user_fields: tuple[str, ...] = DEFAULT_USER_FIELDS,
+    ) -> None:
+        """
+        Create the token cache.
+
+        Parameters:
+            ttl: How many seconds to keep tokens in the cache.
+            maxsize: Maximum number of tokens kept in process memory.
+            user_fields: User fields to cache, besides the primary key
+                and the username. Missing fields are skipped.
+
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.user_fields = user_fields
+        self._cache: TTLCache[str, _CachedToken] = TTLCache(maxsize)
+        # Indexes to invalidate tokens without scanning the whole cache:
+        self._token_hashes: dict[_TokenKey, str] = {}
+        self._user_hashes: dict[Any, set[str]] = {}
+        self._senders: set[type[models.Model]] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        token_hash: str,
+        token_model: type[_TokenT],
+    ) -> _TokenT | None:
+        """Get a fresh instance of the cached *token_model* token."""
+        cached = self._cache.get(token_hash)
+        if cached is None or not issubclass(cached.token.model, token_model):
+            return None
+        return cast(_TokenT, cached.restore())
+
+    def set(
+        self,
+        token_hash: str,
+        token: _TokenLike,
+        *,
+        user: 'AbstractBaseUser',
+    ) -> None:
+        """Cache the token with the user it belongs to."""
+        token_instance = cast(models.Model, token)
+        cached = _CachedToken(
+            token=_Snapshot.take(token_instance),
+            user=_Snapshot.take(user, self._user_field_names(user)),
+            user_field=_user_field(token_instance, user),
+        )
+        self._connect(cached.token.model, self._token_changed)
+        self._connect(cached.user.model, self._user_changed)
+        with self._lock:
+            self._cache.set(
+                token_hash,
+                cached,
+                expires_at=time.time() + self.ttl,
+            )
+            self._token_hashes[cached.token_key] = token_hash
+            self._user_hashes.setdefault(user.pk, set()).add(token_hash)
+            if len(self._token_hashes) > self.maxsize * 2:
+                self._prune_indexes()
+
+    def touch(self, token_hash: str, used_at: dt.datetime) -> None:
+        """
+        Update ``last_used_at`` of the cached token.
+
+        Bulk updates do not send ``post_save`` signal,
+        so they have to refresh the cached token explicitly.
+        """
+        with self._lock:
+            cached = self._cache.get(token_hash)
+            if cached is None:
+                return
+            self._cache.set(
+                token_hash,
+                dataclasses.replace(
+                    cached,
+                    token=cached.token.replace(last_used_at=used_at),
+                ),
+                expires_at=time.time() + self.ttl,
+            )
+
+    def _user_field_names(self, user: 'AbstractBaseUser') -> tuple[str, ...]:
+        # Not all user models have `USERNAME_FIELD` in their types:
+        username_field: str = getattr(user, 'USERNAME_FIELD', 'username')
+        return (username_field, *self.user_fields)
+
+    def _connect(
+        self,
+        sender: type[models.Model],
+        receiver: Any,
+    ) -> None:
+        if sender in self._senders:
+            return
+        # Receivers are weak, they go away together with this cache:
+        post_save.connect(receiver, sender=sender)
+        post_delete.connect(receiver, sender=sender)
+        self._senders.add(sender)
+
+    def _token_changed(
+        self,
+        sender: type[models.Model],
+        instance: models.Model,
+        update_fields: frozenset[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        with self._lock:
+            token_hash = self._token_hashes.get((sender, instance.pk))
+            if token_hash is None:
+                return
+            cached = self._cache.get(token_hash)
+            if (
+                cached is not None
+                and kwargs.get('signal') is post_save
+                and update_fields
+                and update_fields <= _LAST_USED_FIELDS
+            ):
+                self._cache.set(
+                    token_hash,
+                    dataclasses.replace(
+                        cached,
+                        token=_Snapshot.take(instance),
+                    ),
+                    expires_at=time.time() + self.ttl,
+                )
+                return
+            self._token_hashes.pop((sender, instance.pk), None)
+            self._cache.pop(token_hash)
+
+    def _user_changed(
+        self,
+        sender: type[models.Model],
+        instance: models.Model,
+        **kwargs: Any,
+    ) -> None:
+        with self._lock:
+            for token_hash in self._user_hashes.pop(instance.pk, ()):
+                self._cache.pop(token_hash)
+
+    def _prune_indexes(self) -> None:
+        # Expired and evicted tokens stay in indexes until this point:
+        self._token_hashes = {
+            token_key: token_hash
+            for token_key, token_hash in self._token_hashes.items()
+            if self._cache.get(token_hash) is not None
+        }
+        cached_hashes = set(self._token_hashes.values())
+        self._user_hashes = {
+            user_pk: token_hashes & cached_hashes
+            for user_pk, token_hashes in self._user_hashes.items()
+            if not token_hashes.isdisjoint(cached_hashes)
+        }
+
+
+def _user_field(token: models.Model, user: models.Model) -> str | None:
+    for field in token._meta.concrete_fields:  # noqa: SLF001
+        if (
+            field.many_to_one
+            and isinstance(user, field.related_model)  # type: ignore[arg-type]
+            and getattr(token, field.attname) == user.pk
+        ):
+            return field.name
+    return None
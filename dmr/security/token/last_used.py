@@ -0,0 +1,176 @@
+import datetime as dt
+import threading
+import time
+from typing import Any, Final, TypeAlias, final
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models
+
+#: Default number of seconds between bulk ``last_used_at`` updates.
+DEFAULT_FLUSH_INTERVAL: Final = 60
+
+#: Default number of tokens that triggers a bulk update right away.
+DEFAULT_FLUSH_SIZE: Final = 1000
+
+# Primary keys of tokens to the time of their last use:
+_UsedAt: TypeAlias = dict[Any, dt.datetime]
+_PendingTokens: TypeAlias = dict[type[models.Model], _UsedAt]
+
+
+@final
+class LastUsedBatch:  # noqa: WPS214
+    """
+    Collects used tokens in memory to update ``last_used_at`` in bulk.
+
+    Instead of one ``UPDATE`` per request, used tokens are written
+    with one ``UPDATE`` per token model, when *flush_interval* seconds
+    have passed since the last write, or when *flush_size*
+    tokens are collected, whatever comes first.
+    Writes happen in the request that triggers them.
+    When no request comes in time, a background timer thread
+    writes the collected tokens after *flush_interval* seconds.
+    Each token gets the time of its last use as ``last_used_at``.
+
+    Collected tokens are lost if the process exits before the next write,
+    call :meth:`flush` on shutdown if that matters.
+
+    Token models must have ``last_used_at`` field,
+    like :class:`~dmr.security.token.app.models.Token` does.
+    ``updated_at`` field is also written, when token models have it.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = (
+        '_flushed_at',
+        '_lock',
+        '_pending',
+        '_timer',
+        'flush_interval',
+        'flush_size',
+    )
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+    ) -> None:
+        """Create an empty batch."""
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._pending: _PendingTokens = {}
+        self._flushed_at = time.time()
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def add(self, token: models.Model) -> dt.datetime:
+        """
+        Collect used token, write collected tokens if it is time.
+
+        Returns the time of use, that will be written as ``last_used_at``.
+        """
+        used_at = dt.datetime.now(dt.UTC)
+        pending = self._add(token, used_at)
+        if pending:
+            _update(pending)
+        return used_at
+
+    async def aadd(self, token: models.Model) -> dt.datetime:
+        """
+        Async collect used token, write collected tokens if it is time.
+
+        Returns the time of use, that will be written as ``last_used_at``.
+        """
+        used_at = dt.datetime.now(dt.UTC)
+        pending = self._add(token, used_at)
+        if pending:
+            await _aupdate(pending)
+        return used_at
+
+    def flush(self) -> None:
+        """Write all collected tokens now."""
+        with self._lock:
+            pending = self._pop_pending()
+        _update(pending)
+
+    async def aflush(self) -> None:
+        """Async write all collected tokens now."""
+        with self._lock:
+            pending = self._pop_pending()
+        await _aupdate(pending)
+
+    def _add(
+        self,
+        token: models.Model,
+        used_at: dt.datetime,
+    ) -> _PendingTokens | None:
+        with self._lock:
+            self._pending.setdefault(type(token), {})[token.pk] = used_at
+            pending_size = sum(len(pks) for pks in self._pending.values())
+            flush_in = self.flush_interval - (time.time() - self._flushed_at)
+            if pending_size < self.flush_size and flush_in > 0:
+                self._schedule_flush(flush_in)
+                return None
+            return self._pop_pending()
+
+    def _schedule_flush(self, delay: float) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(delay, self._flush_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_in_background(self) -> None:
+        try:  # noqa: WPS501
+            self.flush()
+        finally:
+            # Timer threads don't get `request_finished` signal:
+            connections.close_all()
+
+    def _pop_pending(self) -> _PendingTokens:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending = self._pending
+        self._pending = {}
+        self._flushed_at = time.time()
+        return pending
+
+
+def _update(pending: _PendingTokens) -> None:
+    for token_model, used_at in pending.items():
+        token_model._default_manager.filter(  # noqa: SLF001
+            pk__in=used_at,
+        ).update(**_updated_fields(token_model, used_at))
+
+
+async def _aupdate(pending: _PendingTokens) -> None:
+    # There's usually only one token model:
+    for token_model, used_at in pending.items():
+        await token_model._default_manager.filter(  # noqa: SLF001, WPS476
+            pk__in=used_at,
+        ).aupdate(**_updated_fields(token_model, used_at))
+
+
+def _updated_fields(
+    token_model: type[models.Model],
+    used_at: _UsedAt,
+) -> dict[str, Any]:
+    updated_fields: dict[str, Any] = {'last_used_at': _last_used_at(used_at)}
+    try:
+        token_model._meta.get_field('updated_at')  # noqa: SLF001
+    except FieldDoesNotExist:
+        # Custom token models might not have this field:
+        return updated_fields
+    updated_fields['updated_at'] = dt.datetime.now(dt.UTC)
+    return updated_fields
+
+
+def _last_used_at(used_at: _UsedAt) -> models.Case:
+    return models.Case(
+        *[
+            models.When(pk=pk, then=models.Value(pk_used_at))
+            for pk, pk_used_at in used_at.items()
+        ],
+        output_field=models.DateTimeField(),
+    )
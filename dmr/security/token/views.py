@@ -1,20 +1,21 @@
 import datetime as dt
 import uuid
 from abc import abstractmethod
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from http import HTTPStatus
-from typing import Any, Generic
+from typing import Any, ClassVar, Generic
 
 from django.contrib.auth import aauthenticate, authenticate
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.http import HttpRequest
 from django.views.decorators.debug import sensitive_post_parameters
-from typing_extensions import Sentinel, TypedDict, TypeVar
+from typing_extensions import Sentinel, TypedDict, TypeVar, override
 
 from dmr import Body, Controller, ResponseSpec, modify
 from dmr.decorators import endpoint_decorator
 from dmr.errors import ErrorModel
 from dmr.exceptions import NotAuthenticatedError
+from dmr.security.login_executor import LoginExecutor
 from dmr.security.token.constants import TOKEN_DEFAULT_EXPIRY
 from dmr.security.token.request import set_request_attrs
 from dmr.security.token.token import (
@@ -181,19 +182,35 @@ class ObtainTokenAsyncController(
         token_salt: Salt to be used for the token hash.
         token_algorithm: Salt to be used for the token hash.
             Defaults to ``sha256``.
+        login_executor: Optional dedicated executor to verify credentials,
+            see :class:`~dmr.security.login_executor.LoginExecutor`.
+            Adds ``429`` response for rejected logins, when set.
 
     .. versionadded:: 0.12.0
+
+    .. versionchanged:: 0.15.0
+        Added *login_executor* attribute.
     """
 
     token_cls: type[TokenLikeAsync[_UserT]]
+    login_executor: ClassVar[LoginExecutor | None] = None
 
-    responses = (
+    responses: ClassVar[Sequence[ResponseSpec]] = (
         ResponseSpec(
             return_type=ErrorModel,
             status_code=HTTPStatus.UNAUTHORIZED,
         ),
     )
 
+    @override
+    def __init_subclass__(cls) -> None:
+        if cls.login_executor is not None:
+            cls.responses = cls.login_executor.add_response_spec(
+                cls.responses,
+                cls.error_model,
+            )
+        super().__init_subclass__()
+
     @endpoint_decorator(sensitive_post_parameters())
     @modify(status_code=HTTPStatus.OK)
     async def post(self, parsed_body: Body[_ObtainTokenT]) -> _TokenResponseT:
@@ -202,10 +219,14 @@ class ObtainTokenAsyncController(
 
     async def login(self, parsed_body: _ObtainTokenT) -> _TokenResponseT:
         """Perform the sync login routine for user."""
-        user = await aauthenticate(
-            self.request,
-            **(await self.convert_auth_payload(parsed_body)),
-        )
+        credentials = await self.convert_auth_payload(parsed_body)
+        if self.login_executor is None:
+            user = await aauthenticate(self.request, **credentials)
+        else:
+            user = await self.login_executor.aauthenticate(
+                self.request,
+                **credentials,
+            )
         if user is None:
             raise NotAuthenticatedError
         await self.set_request_attrs(self.request, user)
@@ -0,0 +1,170 @@
+import copy
+import time
+from typing import TYPE_CHECKING, Any, Final, final
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+from dmr.internal.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+#: Default number of users to keep in process memory.
+DEFAULT_USER_CACHE_SIZE: Final = 1000
+
+
+@final
+class UserCache:  # noqa: WPS214
+    """
+    Cache of users by the value of their lookup field.
+
+    By default, users are kept in process memory.
+    Pass *cache_name* to store them in a Django cache instead,
+    which is shared between processes.
+
+    Every request gets its own copy of the cached user,
+    so changing it does not affect other requests.
+
+    Users are dropped from the cache when they are saved or deleted,
+    so deactivated users can't auth anymore.
+    In-process caches only see changes made by the same process,
+    other changes are picked up after *ttl* seconds.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('__weakref__', '_cache', '_lookup_fields', 'cache_name', 'ttl')
+
+    def __init__(
+        self,
+        *,
+        ttl: int,
+        maxsize: int = DEFAULT_USER_CACHE_SIZE,
+        cache_name: str | None = None,
+    ) -> None:
+        """
+        Create the user cache.
+
+        Parameters:
+            ttl: How many seconds to keep users in the cache.
+            maxsize: Maximum number of users kept in process memory.
+            cache_name: Django cache alias to use instead of process memory.
+
+        """
+        self.ttl = ttl
+        self.cache_name = cache_name
+        self._cache: TTLCache[tuple[str, str], AbstractBaseUser] | None = (
+            TTLCache(maxsize) if cache_name is None else None
+        )
+        self._lookup_fields: set[str] = set()
+        # Receivers are weak, they go away together with this cache.
+        # Lazy model reference, because apps might not be ready yet:
+        post_save.connect(
+            self._invalidate_signal,
+            sender=settings.AUTH_USER_MODEL,
+        )
+        post_delete.connect(
+            self._invalidate_signal,
+            sender=settings.AUTH_USER_MODEL,
+        )
+
+    def add_lookup_field(self, lookup_field: str) -> None:
+        """
+        Invalidate cached users by *lookup_field* on changes.
+
+        Fields are also added on :meth:`set`, but shared caches
+        must know them in advance to handle changes from other processes.
+        """
+        self._lookup_fields.add(lookup_field)
+
+    def get(
+        self,
+        lookup_field: str,
+        lookup_value: str,
+    ) -> 'AbstractBaseUser | None':
+        """Get the cached user."""
+        if self._cache is not None:
+            return self._local_get(lookup_field, lookup_value)
+        return caches[self.cache_name].get(  # type: ignore[index, no-any-return]
+            self._cache_key(lookup_field, lookup_value),
+        )
+
+    async def aget(
+        self,
+        lookup_field: str,
+        lookup_value: str,
+    ) -> 'AbstractBaseUser | None':
+        """Async get the cached user."""
+        if self._cache is not None:
+            return self._local_get(lookup_field, lookup_value)
+        return await caches[self.cache_name].aget(  # type: ignore[index, no-any-return]
+            self._cache_key(lookup_field, lookup_value),
+        )
+
+    def set(
+        self,
+        lookup_field: str,
+        lookup_value: str,
+        user: 'AbstractBaseUser',
+    ) -> None:
+        """Cache the user."""
+        self._lookup_fields.add(lookup_field)
+        if self._cache is not None:
+            # The caller keeps using its own instance:
+            self._cache.set(
+                (lookup_field, lookup_value),
+                copy.copy(user),
+                expires_at=time.time() + self.ttl,
+            )
+            return
+        caches[self.cache_name].set(  # type: ignore[index]
+            self._cache_key(lookup_field, lookup_value),
+            user,
+            timeout=self.ttl,
+        )
+
+    async def aset(
+        self,
+        lookup_field: str,
+        lookup_value: str,
+        user: 'AbstractBaseUser',
+    ) -> None:
+        """Async cache the user."""
+        if self._cache is not None:
+            self.set(lookup_field, lookup_value, user)
+            return
+        self._lookup_fields.add(lookup_field)
+        await caches[self.cache_name].aset(  # type: ignore[index]
+            self._cache_key(lookup_field, lookup_value),
+            user,
+            timeout=self.ttl,
+        )
+
+    def invalidate(self, user: 'AbstractBaseUser') -> None:
+        """Drop the user from the cache by all used lookup fields."""
+        for lookup_field in tuple(self._lookup_fields):
+            lookup_value = str(getattr(user, lookup_field, None))
+            if self._cache is None:
+                caches[self.cache_name].delete(  # type: ignore[index]
+                    self._cache_key(lookup_field, lookup_value),
+                )
+            else:
+                self._cache.pop((lookup_field, lookup_value))
+
+    def _local_get(
+        self,
+        lookup_field: str,
+        lookup_value: str,
+    ) -> 'AbstractBaseUser | None':
+        # for mypy: only called for in-process caches
+        assert self._cache is not None  # noqa: S101
+        user = self._cache.get((lookup_field, lookup_value))
+        return None if user is None else copy.copy(user)
+
+    def _cache_key(self, lookup_field: str, lookup_value: str) -> str:
+        return f'dmr::user::{lookup_field}::{lookup_value}'
+
+    def _invalidate_signal(self, sender: type[Any], **kwargs: Any) -> None:
+        self.invalidate(kwargs['instance'])
@@ -13,6 +13,7 @@ from dmr.internal.cache import clear_settings_cache as clear_settings_cache
 from dmr.openapi.config import OpenAPIConfig
 
 if TYPE_CHECKING:
+    from dmr.compression import Compression
     from dmr.metadata import ResponseSpec
     from dmr.openapi import OpenAPIConfig
     from dmr.parsers import Parser
@@ -59,6 +60,7 @@ class Settings(enum.StrEnum):
     auth = 'auth'
     throttling = 'throttling'
     throttling_allow_unsafe_cache = 'throttling_allow_unsafe_cache'
+    compression = 'compression'
     no_validate_http_spec = 'no_validate_http_spec'
     validate_responses = 'validate_responses'
     semantic_responses = 'semantic_responses'
@@ -110,6 +112,7 @@ class SettingsDict(TypedDict, total=False):
     auth: Sequence['AsyncAuth | SyncAuth']
     throttling: Sequence['AsyncThrottle | SyncThrottle']
     throttling_allow_unsafe_cache: bool | None
+    compression: 'Compression | None'
     no_validate_http_spec: Set[HttpSpec]
     validate_responses: bool
     semantic_responses: bool
@@ -137,6 +140,8 @@ _DEFAULTS: Final[Mapping[str, Any]] = {  # noqa: WPS407
     Settings.auth: [],
     Settings.throttling: [],
     Settings.throttling_allow_unsafe_cache: True,
+    # Response compression is turned off by default:
+    Settings.compression: None,
     # OpenAPI settings:
     Settings.openapi_config: OpenAPIConfig(
         title='Your Awesome Project',
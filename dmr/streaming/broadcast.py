@@ -0,0 +1,242 @@
+import asyncio
+import enum
+from collections import deque
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Generic,
+    TypeAlias,
+    TypeVar,
+    cast,
+    final,
+)
+
+from dmr.negotiation import request_renderer
+from dmr.streaming.stream import RenderedEvent
+
+if TYPE_CHECKING:
+    from dmr.endpoint import Endpoint
+    from dmr.serializer import BaseSerializer
+    from dmr.streaming.controller import StreamingController
+    from dmr.streaming.renderer import StreamingRenderer
+    from dmr.streaming.validation import StreamingValidator
+
+#: Default number of events that can wait for one slow subscriber.
+DEFAULT_MAX_QUEUE: Final = 100
+
+_EventT = TypeVar('_EventT')
+
+# Events are rendered once per format and endpoint:
+_GroupKey: TypeAlias = tuple['StreamingRenderer', 'Endpoint']
+
+
+class SlowConsumerPolicy(enum.StrEnum):
+    """
+    What to do with a subscriber when its queue is full.
+
+    .. versionadded:: 0.15.0
+    """
+
+    #: Skip new events for this subscriber until it catches up.
+    drop = 'drop'
+    #: Close the stream of this subscriber.
+    disconnect = 'disconnect'
+    #: Replace all queued events of this subscriber with the newest one.
+    coalesce = 'coalesce'
+
+
+@final
+class Broadcast(Generic[_EventT]):
+    """
+    Publishes events from one producer to many streaming connections.
+
+    Each published event is validated and rendered only once
+    per streaming format and endpoint, for example once for SSE
+    and once for JsonLines. The same ``bytes`` object
+    is then sent to all subscribers of this format and endpoint.
+
+    Every subscriber has its own queue of at most *max_queue* events,
+    *slow_consumer* policy decides what happens when it is full.
+
+    Subscribers only exist in the current process and event loop,
+    :meth:`publish` must be called from the event loop thread.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('_groups', 'max_queue', 'slow_consumer')
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        slow_consumer: SlowConsumerPolicy = SlowConsumerPolicy.drop,
+    ) -> None:
+        """
+        Create the broadcast with no subscribers.
+
+        Parameters:
+            max_queue: Number of events that can wait for one subscriber.
+            slow_consumer: What to do when a subscriber's queue is full.
+
+        """
+        self.max_queue = max_queue
+        self.slow_consumer = slow_consumer
+        self._groups: dict[_GroupKey, _Group] = {}
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of current subscribers, for metrics."""
+        return sum(len(group.subscribers) for group in self._groups.values())
+
+    def subscribe(
+        self,
+        controller: 'StreamingController[BaseSerializer]',
+    ) -> AsyncIterator[_EventT]:
+        """
+        Subscribe the controller's connection to all new events.
+
+        Return the result from a streaming endpoint as is.
+        It produces already rendered events, which are sent as is,
+        but it is typed as the event type for endpoint annotations.
+        The subscription ends when the connection is closed.
+        """
+        # We are sure that it is a `StreamingRenderer` at this point:
+        renderer = cast(
+            'StreamingRenderer',
+            request_renderer(controller.request, strict=True),
+        )
+        method = controller.request.method
+        # for mypy: it can't be `None` at this point
+        assert method is not None  # noqa: S101
+
+        # Endpoints might have different event models and validation:
+        group_key = (renderer, controller.api_endpoints[method])
+        group = self._groups.get(group_key)
+        if group is None:
+            group = _Group(
+                controller.serializer,
+                renderer,
+                renderer.streaming_validator_cls.from_controller(
+                    controller,
+                    status_code=HTTPStatus.OK,
+                ),
+            )
+            self._groups[group_key] = group
+
+        subscription = _Subscription(self, group.subscribers)
+        group.subscribers.add(subscription)
+        return cast(AsyncIterator[_EventT], subscription)
+
+    def publish(self, event: _EventT) -> None:
+        """
+        Validate and render the event once, queue it for all subscribers.
+
+        Raises validation and rendering errors before the event
+        is queued for anyone.
+        """
+        self._drop_empty_groups()
+        rendered = [
+            (group, group.render(event)) for group in self._groups.values()
+        ]
+        for group, rendered_event in rendered:
+            for subscription in tuple(group.subscribers):
+                subscription.put(rendered_event)
+
+    def close(self) -> None:
+        """Close streams of all subscribers, for example on shutdown."""
+        for group in tuple(self._groups.values()):
+            for subscription in tuple(group.subscribers):
+                subscription.close()
+
+    def _drop_empty_groups(self) -> None:
+        # Groups are left empty, when all their subscribers are closed:
+        for group_key, group in tuple(self._groups.items()):
+            if not group.subscribers:
+                del self._groups[group_key]  # noqa: WPS420
+
+
+@final
+class _Group:
+    """Subscribers that share the same rendered events."""
+
+    __slots__ = ('renderer', 'serializer', 'subscribers', 'validator')
+
+    def __init__(
+        self,
+        serializer: type['BaseSerializer'],
+        renderer: 'StreamingRenderer',
+        validator: 'StreamingValidator',
+    ) -> None:
+        self.serializer = serializer
+        self.renderer = renderer
+        self.validator = validator
+        self.subscribers: set[_Subscription] = set()
+
+    def render(self, event: Any) -> RenderedEvent:
+        return RenderedEvent(
+            self.serializer.serialize(
+                self.validator.apply_event_pipeline(event),
+                renderer=self.renderer,
+            ),
+        )
+
+
+@final
+class _Subscription:
+    """Async iterator over the events queued for one connection."""
+
+    __slots__ = ('_broadcast', '_closed', '_queue', '_subscribers', '_waiter')
+
+    def __init__(
+        self,
+        broadcast: Broadcast[Any],
+        subscribers: set['_Subscription'],
+    ) -> None:
+        self._broadcast = broadcast
+        self._subscribers = subscribers
+        self._queue: deque[RenderedEvent] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._closed = False
+
+    def __aiter__(self) -> '_Subscription':
+        return self
+
+    async def __anext__(self) -> RenderedEvent:
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:  # noqa: WPS501
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._queue.popleft()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def put(self, event: RenderedEvent) -> None:
+        if len(self._queue) >= self._broadcast.max_queue:
+            policy = self._broadcast.slow_consumer
+            if policy is SlowConsumerPolicy.drop:
+                return
+            if policy is SlowConsumerPolicy.disconnect:
+                self._queue.clear()
+                self.close()
+                return
+            self._queue.clear()
+        self._queue.append(event)
+        self._wake()
+
+    def close(self) -> None:
+        self._closed = True
+        self._subscribers.discard(self)
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
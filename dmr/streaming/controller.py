@@ -77,6 +77,44 @@ class StreamingController(Controller[_SerializerT_co]):
     By default it is disabled. It is only enabled in the SSE streaming.
     """
 
+    streaming_read_ahead: ClassVar[int | None] = None
+    """
+    Optional number of rendered events to prepare in advance.
+
+    Events are pulled from the events producer in a separate task
+    while the previous events are being sent to the client.
+    So, a slow producer and a slow client don't wait for each other.
+    When the limit is reached, the producer waits for the client.
+
+    By default it is disabled and events are pulled one by one.
+
+    .. versionadded:: 0.15.0
+    """
+
+    streaming_read_ahead_bytes: ClassVar[int | None] = None
+    """
+    Optional total size of rendered events to prepare in advance.
+
+    Works together with
+    :attr:`~dmr.streaming.controller.StreamingController.streaming_read_ahead`,
+    whatever limit is reached first.
+
+    .. versionadded:: 0.15.0
+    """
+
+    streaming_send_timeout: ClassVar[float | None] = None
+    """
+    Optional number of seconds to disconnect slow clients after.
+
+    The stream is closed when sending one event takes longer,
+    or when the read-ahead buffer stays full for longer.
+    A send that never completes is cancelled,
+    just like when the client disconnects.
+    Enables read-ahead of one event, if it is not configured.
+
+    .. versionadded:: 0.15.0
+    """
+
     streaming_response_cls: ClassVar[type[StreamingResponse]] = (
         StreamingResponse
     )
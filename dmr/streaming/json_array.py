@@ -0,0 +1,227 @@
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Final, get_args, get_origin
+
+from django.http import StreamingHttpResponse
+
+from dmr.exceptions import ValidationError
+from dmr.internal.io import maybe_aclosing, maybe_closing
+from dmr.negotiation import ContentType, request_renderer
+from dmr.renderers import Renderer
+from dmr.settings import default_renderer
+from dmr.types import EMPTY
+
+if TYPE_CHECKING:
+    from dmr.compression import StreamCompressor
+    from dmr.controller import Controller
+    from dmr.metadata import EndpointMetadata
+    from dmr.serializer import BaseSerializer
+
+#: Default size of a single chunk of the json array in bytes.
+DEFAULT_CHUNK_SIZE: Final = 64 * 1024  # noqa: WPS432
+
+_ARRAY_TYPES: Final = frozenset((
+    list,
+    tuple,
+    set,
+    frozenset,
+    Sequence,
+    Iterable,
+    Iterator,
+    AsyncIterable,
+    AsyncIterator,
+))
+
+
+class JsonArrayResponse(StreamingHttpResponse):
+    """
+    Streams a standard ``application/json`` array item by item.
+
+    Regular responses first build the whole Python list
+    and then render a single huge ``bytes`` object.
+    This response takes any iterator or async iterator instead,
+    for example :meth:`django.db.models.query.QuerySet.iterator`,
+    renders items one by one with the endpoint's renderer
+    and sends them in chunks, so the memory stays flat
+    regardless of the result size.
+
+    Can be returned from both sync and async controllers
+    with the regular ``list[Model]`` response spec.
+    When responses validation is turned on, each item is validated
+    against the item model of the response spec while streaming.
+    Since headers are already sent at this point, invalid items
+    will break the response stream.
+
+    .. code:: python
+
+        >>> from http import HTTPStatus
+        >>> from dmr import Controller, ResponseSpec, validate
+        >>> from dmr.plugins.pydantic import PydanticSerializer
+        >>> from dmr.streaming.json_array import JsonArrayResponse
+
+        >>> class ExportController(Controller[PydanticSerializer]):
+        ...     @validate(ResponseSpec(list[int], status_code=HTTPStatus.OK))
+        ...     def get(self) -> JsonArrayResponse:
+        ...         return JsonArrayResponse(iter(range(10_000)), self)
+
+    .. danger::
+
+        WSGI handlers will consume async iterators in a sync way.
+        Use sync iterators with WSGI and async iterators with ASGI.
+
+    .. versionadded:: 0.15.0
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        iterable: Iterable[Any] | AsyncIterable[Any],
+        controller: 'Controller[BaseSerializer]',
+        *,
+        item_model: Any = EMPTY,
+        validate_items: bool | None = None,
+        status_code: HTTPStatus = HTTPStatus.OK,
+        headers: dict[str, str] | None = None,
+        renderer: Renderer | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Create the streaming json array response.
+
+        Arguments:
+            iterable: Sync or async iterable of items to be rendered.
+            controller: Controller to serialize items with.
+            item_model: Type to validate items with.
+                Inferred from the endpoint's response spec by default.
+            validate_items: Should we validate each item?
+                Defaults to the endpoint's ``validate_responses`` value.
+            status_code: Status code for the response.
+            headers: Headers to be set on the response.
+            renderer: Renderer for the items. Defaults to the negotiated one,
+                when it renders json, and to the default renderer otherwise.
+                The response ``Content-Type`` is taken from this renderer.
+            chunk_size: Minimal size of a single chunk in bytes.
+
+        """
+        metadata = _resolve_metadata(controller)
+        self._serializer = controller.serializer
+        self._renderer = renderer or _json_renderer(controller)
+        self._chunk_size = chunk_size
+        self._item_model = (
+            _resolve_item_model(metadata, status_code)
+            if item_model is EMPTY
+            else item_model
+        )
+        self._validate_items = (
+            metadata is not None and metadata.validate_responses is True
+            if validate_items is None
+            else validate_items
+        )
+        #: Per-connection compressor, set by response compression.
+        self.compressor: StreamCompressor | None = None
+        super().__init__(
+            (
+                self._produce_async_chunks(iterable)
+                if isinstance(iterable, AsyncIterable)
+                else self._produce_chunks(iterable)
+            ),
+            status=status_code,
+            headers=headers,
+            content_type=self._renderer.content_type,
+        )
+
+    def _produce_chunks(self, iterable: Iterable[Any]) -> Iterator[bytes]:
+        buffer = bytearray(b'[')
+        with maybe_closing(iterable):
+            for index, element in enumerate(iterable):
+                self._render_item(buffer, element, is_first=not index)
+                if len(buffer) >= self._chunk_size:
+                    yield self._flush(buffer)
+        buffer.extend(b']')
+        yield self._flush(buffer, is_last=True)
+
+    async def _produce_async_chunks(
+        self,
+        iterable: AsyncIterable[Any],
+    ) -> AsyncIterator[bytes]:
+        buffer = bytearray(b'[')
+        is_first = True
+        async with maybe_aclosing(iterable):
+            async for element in iterable:
+                self._render_item(buffer, element, is_first=is_first)
+                is_first = False
+                if len(buffer) >= self._chunk_size:
+                    yield self._flush(buffer)
+        buffer.extend(b']')
+        yield self._flush(buffer, is_last=True)
+
+    def _render_item(
+        self,
+        buffer: bytearray,
+        element: Any,
+        *,
+        is_first: bool,
+    ) -> None:
+        if self._validate_items:
+            self._validate_item(element)
+        if not is_first:
+            buffer.extend(b',')
+        buffer.extend(
+            self._serializer.serialize(element, renderer=self._renderer),
+        )
+
+    def _validate_item(self, element: Any) -> None:
+        try:
+            self._serializer.from_python(element, self._item_model, strict=True)
+        except self._serializer.validation_error as exc:
+            raise ValidationError(
+                self._serializer.serialize_validation_error(exc),
+            ) from None
+
+    def _flush(self, buffer: bytearray, *, is_last: bool = False) -> bytes:
+        chunk = bytes(buffer)
+        buffer.clear()
+        if self.compressor is None:
+            return chunk
+        chunk = self.compressor.compress_event(chunk)
+        return chunk + self.compressor.finish() if is_last else chunk
+
+
+def _resolve_metadata(
+    controller: 'Controller[BaseSerializer]',
+) -> 'EndpointMetadata | None':
+    method = controller.request.method
+    # for mypy: it can't be `None` at this point
+    assert method is not None  # noqa: S101
+    endpoint = controller.api_endpoints.get(method)
+    if endpoint is None and method == 'HEAD':
+        # `HEAD` requests can be served by the `GET` endpoint:
+        endpoint = controller.api_endpoints.get('GET')
+    return None if endpoint is None else endpoint.metadata
+
+
+def _json_renderer(controller: 'Controller[BaseSerializer]') -> Renderer:
+    renderer = request_renderer(controller.request)
+    if renderer is not None and renderer.content_type == ContentType.json:
+        return renderer
+    return default_renderer
+
+
+def _resolve_item_model(
+    metadata: 'EndpointMetadata | None',
+    status_code: HTTPStatus,
+) -> Any:
+    if metadata is None:
+        return Any
+    response = metadata.responses.get(status_code)
+    if response is None:
+        return Any
+    type_args = get_args(response.return_type)
+    if get_origin(response.return_type) in _ARRAY_TYPES and type_args:
+        return type_args[0]
+    return Any
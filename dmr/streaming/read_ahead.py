@@ -0,0 +1,151 @@
+import asyncio
+import dataclasses
+from collections import deque
+from typing import final
+
+from dmr.streaming.exceptions import StreamingCloseError
+
+
+@final
+@dataclasses.dataclass(frozen=True, slots=True)
+class ReadAheadStats:
+    """
+    Current state of the read-ahead buffer of one streaming response.
+
+    Attributes:
+        queued_events: Rendered events waiting to be sent.
+        queued_bytes: Total size of rendered events waiting to be sent.
+        peak_events: The most events that were waiting at once.
+        peak_bytes: The most bytes that were waiting at once.
+
+    .. versionadded:: 0.15.0
+    """
+
+    queued_events: int
+    queued_bytes: int
+    peak_events: int
+    peak_bytes: int
+
+
+@final
+class ReadAheadBuffer:
+    """
+    Bounded buffer of rendered events between the producer and the client.
+
+    The producer waits when there are *max_events* events
+    or *max_bytes* bytes in the buffer. One event is always accepted
+    into an empty buffer, even if it is larger than *max_bytes*.
+    If the producer waits for more than *stall_timeout* seconds,
+    the client is considered stalled.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = (
+        '_chunks',
+        '_error',
+        '_getter',
+        '_putter',
+        'max_bytes',
+        'max_events',
+        'peak_bytes',
+        'peak_events',
+        'queued_bytes',
+        'stall_timeout',
+    )
+
+    def __init__(
+        self,
+        *,
+        max_events: int,
+        max_bytes: int | None,
+        stall_timeout: float | None,
+    ) -> None:
+        """Create an empty buffer."""
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.stall_timeout = stall_timeout
+        self.queued_bytes = 0
+        self.peak_events = 0
+        self.peak_bytes = 0
+        self._chunks: deque[bytes] = deque()
+        self._error: BaseException | None = None
+        self._getter: asyncio.Future[None] | None = None
+        self._putter: asyncio.Future[None] | None = None
+
+    def stats(self) -> ReadAheadStats:
+        """Return current buffer depth, for metrics."""
+        return ReadAheadStats(
+            queued_events=len(self._chunks),
+            queued_bytes=self.queued_bytes,
+            peak_events=self.peak_events,
+            peak_bytes=self.peak_bytes,
+        )
+
+    async def put(self, chunk: bytes) -> None:
+        """
+        Add the rendered event, wait for free space if the buffer is full.
+
+        When there was no free space for *stall_timeout* seconds,
+        the client is stalled: all events are dropped
+        and :exc:`~dmr.streaming.exceptions.StreamingCloseError` is raised.
+        """
+        if self._is_full():
+            try:
+                async with asyncio.timeout(self.stall_timeout):
+                    await self._wait_for_space()
+            except TimeoutError:
+                self._chunks.clear()
+                self.queued_bytes = 0
+                raise StreamingCloseError from None
+
+        self._chunks.append(chunk)
+        self.queued_bytes += len(chunk)
+        self.peak_events = max(self.peak_events, len(self._chunks))
+        self.peak_bytes = max(self.peak_bytes, self.queued_bytes)
+        _wake(self._getter)
+
+    async def get(self) -> bytes:
+        """
+        Take the oldest rendered event, wait for it if the buffer is empty.
+
+        Raises the error that closed the buffer, when it is empty.
+        """
+        while not self._chunks:
+            if self._error is not None:
+                raise self._error
+            self._getter = asyncio.get_running_loop().create_future()
+            try:  # noqa: WPS501
+                await self._getter
+            finally:
+                self._getter = None
+
+        chunk = self._chunks.popleft()
+        self.queued_bytes -= len(chunk)
+        _wake(self._putter)
+        return chunk
+
+    def close(self, error: BaseException) -> None:
+        """No more events will be added, *error* is raised after the rest."""
+        self._error = error
+        _wake(self._getter)
+
+    async def _wait_for_space(self) -> None:
+        while self._is_full():
+            self._putter = asyncio.get_running_loop().create_future()
+            try:  # noqa: WPS501
+                await self._putter
+            finally:
+                self._putter = None
+
+    def _is_full(self) -> bool:
+        if not self._chunks:
+            return False
+        return len(self._chunks) >= self.max_events or (
+            self.max_bytes is not None and self.queued_bytes >= self.max_bytes
+        )
+
+
+def _wake(waiter: asyncio.Future[None] | None) -> None:
+    if waiter is not None and not waiter.done():
+        waiter.set_result(None)
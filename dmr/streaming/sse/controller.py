@@ -1,9 +1,13 @@
-from typing import Any, ClassVar, TypeVar
+import functools
+from collections.abc import AsyncIterator, Callable
+from http import HTTPStatus
+from typing import Any, ClassVar, TypeVar, cast
 
 from typing_extensions import override
 
 from dmr.errors import ErrorType
 from dmr.exceptions import ValidationError
+from dmr.negotiation import request_renderer
 from dmr.renderers import Renderer
 from dmr.serializer import BaseSerializer
 from dmr.settings import default_renderer
@@ -11,7 +15,10 @@ from dmr.streaming.controller import StreamingController
 from dmr.streaming.renderer import StreamingRenderer
 from dmr.streaming.sse.metadata import SSEvent
 from dmr.streaming.sse.renderer import SSERenderer
+from dmr.streaming.sse.replay import ReplayBuffer
 from dmr.streaming.sse.validation import SSEStreamingValidator
+from dmr.streaming.stream import RenderedEvent
+from dmr.streaming.validation import StreamingValidator
 
 _SerializerT_co = TypeVar(
     '_SerializerT_co',
@@ -19,8 +26,10 @@ _SerializerT_co = TypeVar(
     covariant=True,
 )
 
+_EventT = TypeVar('_EventT')
 
-class SSEController(StreamingController[_SerializerT_co]):
+
+class SSEController(StreamingController[_SerializerT_co]):  # noqa: WPS214
     """
     Controller for streaming Server Sent Events (SSE).
 
@@ -80,3 +89,102 @@ class SSEController(StreamingController[_SerializerT_co]):
     def ping_event(self) -> Any | None:
         """Return a ping event's payload."""
         return SSEvent(comment='ping')
+
+    async def replay_events(
+        self,
+        events: AsyncIterator[_EventT],
+        replay_buffer: ReplayBuffer,
+    ) -> AsyncIterator[_EventT]:
+        """
+        Resume the stream from the ``Last-Event-ID`` request header.
+
+        First, sends events from *replay_buffer* that the client missed
+        while it was reconnecting, they are already rendered.
+        Then, sends *events* and records the ones with ``id``
+        into *replay_buffer* for future reconnects.
+        Live events that were just replayed are skipped.
+
+        When ``Last-Event-ID`` is no longer in the buffer,
+        :meth:`handle_replay_miss` is called instead.
+
+        .. versionadded:: 0.15.0
+        """
+        replayed: set[str] = set()
+        for missed_event in await self._missed_events(replay_buffer, replayed):
+            yield missed_event
+
+        record_event = self._event_recorder(replay_buffer)
+        async for live_event in events:
+            event_id = getattr(live_event, 'id', None)
+            if event_id is None:
+                yield live_event
+            elif str(event_id) not in replayed:
+                yield record_event(live_event, str(event_id))
+
+    async def handle_replay_miss(self, last_event_id: str) -> list[Any]:
+        """
+        Return events to send when ``Last-Event-ID`` can't be replayed.
+
+        It happens when the event was already evicted from the buffer,
+        or the buffer has never seen this id, for example after a restart.
+        By default, returns no events and the client only gets new events.
+        Override it to send a fresh snapshot instead.
+
+        .. versionadded:: 0.15.0
+        """
+        return []
+
+    async def _missed_events(
+        self,
+        replay_buffer: ReplayBuffer,
+        replayed: set[str],
+    ) -> list[Any]:
+        last_event_id = self.request.headers.get('Last-Event-ID')
+        if last_event_id is None:
+            return []
+        missed = replay_buffer.since(last_event_id)
+        if missed is None:
+            return await self.handle_replay_miss(last_event_id)
+        replayed.update(event_id for event_id, _ in missed)
+        return [rendered for _, rendered in missed]
+
+    def _event_recorder(
+        self,
+        replay_buffer: ReplayBuffer,
+    ) -> Callable[[_EventT, str], _EventT]:
+        renderer = cast(
+            'StreamingRenderer',
+            request_renderer(self.request, strict=True),
+        )
+        return functools.partial(
+            self._record_event,
+            renderer=renderer,
+            validator=renderer.streaming_validator_cls.from_controller(
+                self,
+                status_code=HTTPStatus.OK,
+            ),
+            replay_buffer=replay_buffer,
+        )
+
+    def _record_event(
+        self,
+        event: _EventT,
+        event_id: str,
+        *,
+        renderer: StreamingRenderer,
+        validator: StreamingValidator,
+        replay_buffer: ReplayBuffer,
+    ) -> _EventT:
+        try:
+            rendered = RenderedEvent(
+                self.serializer.serialize(
+                    validator.apply_event_pipeline(event),
+                    renderer=renderer,
+                ),
+            )
+        except Exception:
+            # Invalid events are sent as is,
+            # so regular per-event error handling applies to them:
+            return event
+        replay_buffer.record(event_id, rendered)
+        return cast(_EventT, rendered)
@@ -0,0 +1,76 @@
+import threading
+from collections import deque
+from itertools import islice
+from typing import Final, final
+
+from dmr.streaming.stream import RenderedEvent
+
+#: Default number of recent events to keep for reconnecting clients.
+DEFAULT_MAXLEN: Final = 1000
+
+
+@final
+class ReplayBuffer:
+    """
+    Bounded in-memory buffer of recently sent SSE events.
+
+    Events are stored already rendered and are keyed by their ``id``.
+    Reconnecting clients send the last consumed id
+    in the ``Last-Event-ID`` header and only receive events
+    that were sent after it.
+    Only the last *maxlen* events are kept, older ones are evicted.
+
+    Use a separate buffer for each stream or topic,
+    see :meth:`~dmr.streaming.sse.SSEController.replay_events`.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ('_events', '_lock', '_offset', '_positions', 'maxlen')
+
+    def __init__(self, *, maxlen: int = DEFAULT_MAXLEN) -> None:
+        """Create an empty buffer."""
+        self.maxlen = maxlen
+        self._events: deque[tuple[str, RenderedEvent]] = deque()
+        # Event ids to their positions, counted from the first recorded one:
+        self._positions: dict[str, int] = {}
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of events in the buffer."""
+        return len(self._events)
+
+    def record(self, event_id: str, event: RenderedEvent) -> None:
+        """
+        Store the rendered event, evict the oldest one if the buffer is full.
+
+        Events with already recorded ids are ignored,
+        so many connections can record the same stream.
+        """
+        with self._lock:
+            if event_id in self._positions:
+                return
+            self._positions[event_id] = self._offset + len(self._events)
+            self._events.append((event_id, event))
+            if len(self._events) > self.maxlen:
+                evicted_id, _ = self._events.popleft()
+                del self._positions[evicted_id]  # noqa: WPS420
+                self._offset += 1
+
+    def since(
+        self,
+        last_event_id: str,
+    ) -> list[tuple[str, RenderedEvent]] | None:
+        """
+        Return ids and events that were recorded after *last_event_id*.
+
+        Returns ``None`` when *last_event_id* is unknown or already evicted.
+        """
+        with self._lock:
+            position = self._positions.get(last_event_id)
+            if position is None:
+                return None
+            return list(
+                islice(self._events, position - self._offset + 1, None),
+            )
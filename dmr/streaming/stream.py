@@ -1,7 +1,9 @@
 import asyncio
-from collections.abc import AsyncIterator, Iterator, Mapping
+import contextlib
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator, Mapping
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, final
 
 from django.conf import settings
 from django.http import HttpResponseBase
@@ -11,15 +13,33 @@ from dmr.internal.enums import stringify
 from dmr.internal.io import aiter_to_iter, maybe_aclosing
 from dmr.renderers import Renderer
 from dmr.streaming.exceptions import StreamingCloseError
+from dmr.streaming.read_ahead import ReadAheadBuffer
 
 if TYPE_CHECKING:
+    from dmr.compression import StreamCompressor
     from dmr.serializer import BaseSerializer
     from dmr.streaming.controller import StreamingController
     from dmr.streaming.renderer import StreamingRenderer
     from dmr.streaming.validation import StreamingValidator
 
 
-class StreamingResponse(HttpResponseBase):  # noqa: WPS338
+@final
+class RenderedEvent(bytes):  # noqa: WPS600
+    """
+    Event that is already validated and rendered to the stream format.
+
+    :class:`StreamingResponse` sends such events as is,
+    skipping events validation and serialization.
+    Used to render an event once and send it to many connections,
+    see :class:`~dmr.streaming.broadcast.Broadcast`.
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ()
+
+
+class StreamingResponse(HttpResponseBase):  # noqa: WPS214, WPS338
     """
     Our own response subclass to mark that we explicitly return SSE.
 
@@ -80,6 +100,10 @@ class StreamingResponse(HttpResponseBase):  # noqa: WPS338
         self.regular_renderer = regular_renderer
         self.streaming_renderer = streaming_renderer
         self.streaming_validator = streaming_validator
+        #: Per-connection compressor, set by response compression.
+        self.compressor: StreamCompressor | None = None
+        #: Read-ahead buffer, set when streaming starts, if it is enabled.
+        self.read_ahead_buffer: ReadAheadBuffer | None = None
 
     # Why?
     # Because it is only used by ASGI / WSGI handlers which don't care
@@ -140,6 +164,11 @@ class StreamingResponse(HttpResponseBase):  # noqa: WPS338
             else self._produce_events_with_ping
         )
         events = event_producer()
+        if (
+            self._controller.streaming_read_ahead is not None
+            or self._controller.streaming_send_timeout is not None
+        ):
+            events = self._read_ahead(events)
         async with (
             maybe_aclosing(self._streaming_content),
             maybe_aclosing(events),
@@ -148,58 +177,101 @@ class StreamingResponse(HttpResponseBase):  # noqa: WPS338
                 # This async for will never "exit" normally, because
                 # we raise an exception after the last event.
                 async for event in events:  # pragma: no branch
-                    yield event
+                    yield (
+                        event
+                        if self.compressor is None
+                        else self.compressor.compress_event(event)
+                    )
             except StreamingCloseError:
-                pass  # noqa: WPS420
+                if self.compressor is not None:
+                    yield self.compressor.finish()
             finally:
                 self.close()
 
     async def _produce_events_no_ping(self) -> AsyncIterator[Any]:
         while True:
-            yield self._controller.serializer.serialize(
-                await self._next_event(),
-                renderer=self.streaming_renderer,
-            )
+            yield self._serialize(await self._next_event())
 
     async def _produce_events_with_ping(self) -> AsyncIterator[Any]:
         # for mypy: just checked above
         assert self._controller.streaming_ping_seconds is not None  # noqa: S101
 
+        ping_timer = _PingTimer(self._controller.streaming_ping_seconds)
+        try:  # noqa: WPS501
+            async for event in self._events_or_pings(ping_timer):
+                yield self._serialize(event)
+        finally:
+            ping_timer.cancel()
+
+    async def _events_or_pings(
+        self,
+        ping_timer: '_PingTimer',
+    ) -> AsyncIterator[Any]:
         event_task: asyncio.Task[Any] | None = None
 
         while True:
             if event_task is None:
                 event_task = asyncio.ensure_future(self._next_event())
 
-            ping_task: asyncio.Task[None] = asyncio.ensure_future(
-                asyncio.sleep(self._controller.streaming_ping_seconds),
-            )
-            done, _ = await asyncio.wait(
-                [event_task, ping_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            # The ping timer is recreated on each iteration,
-            # so a still pending one must not be left running.
-            ping_task.cancel()
-
-            if ping_task in done and event_task not in done:
+            # Each sent event or ping only moves the deadline:
+            ping_timer.reset()
+            if not await ping_timer.wait(event_task):
                 # Ping fired before the next real event: send the
                 # ping comment and do not touch the original task.
-                event = self._controller.ping_event()
-            else:
-                # Event fired before the ping:
-                try:  # noqa: WPS501
-                    event = event_task.result()
-                finally:
-                    # Now we need to clean the task, because
-                    # we would need a new event on the next iteration:
-                    event_task = None
-
-            yield self._controller.serializer.serialize(
-                event,
-                renderer=self.streaming_renderer,
-            )
+                yield self._controller.ping_event()
+                continue
+
+            try:  # noqa: WPS501
+                event = event_task.result()
+            finally:
+                # Now we need to clean the task, because
+                # we would need a new event on the next iteration:
+                event_task = None
+            yield event
+
+    async def _read_ahead(
+        self,
+        events: AsyncIterator[bytes],
+    ) -> AsyncIterator[bytes]:
+        send_timeout = self._controller.streaming_send_timeout
+        read_ahead_buffer = ReadAheadBuffer(
+            max_events=self._controller.streaming_read_ahead or 1,
+            max_bytes=self._controller.streaming_read_ahead_bytes,
+            stall_timeout=send_timeout,
+        )
+        self.read_ahead_buffer = read_ahead_buffer
+        producer = asyncio.ensure_future(
+            self._fill_read_ahead(events, read_ahead_buffer),
+        )
+        try:  # noqa: WPS501
+            while True:
+                chunk = await read_ahead_buffer.get()
+                sent_at = time.monotonic()
+                async with _send_deadline(send_timeout):
+                    yield chunk
+                # The client was too slow to receive the previous event:
+                if send_timeout is not None and (
+                    time.monotonic() - sent_at > send_timeout
+                ):
+                    raise StreamingCloseError
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+    async def _fill_read_ahead(
+        self,
+        events: AsyncIterator[bytes],
+        read_ahead_buffer: ReadAheadBuffer,
+    ) -> None:
+        try:
+            async with maybe_aclosing(events):
+                # This async for will never "exit" normally, because
+                # we raise an exception after the last event.
+                async for chunk in events:  # pragma: no branch
+                    await read_ahead_buffer.put(chunk)
+        except Exception as exc:
+            read_ahead_buffer.close(exc)
 
     async def _next_event(self) -> Any:
         try:
@@ -212,8 +284,18 @@ class StreamingResponse(HttpResponseBase):  # noqa: WPS338
             return await self._handle_event_error(exc)
 
     def _apply_validator(self, event: Any) -> Any:
+        if isinstance(event, RenderedEvent):
+            return event
         return self.streaming_validator.apply_event_pipeline(event)
 
+    def _serialize(self, event: Any) -> bytes:
+        if isinstance(event, RenderedEvent):
+            return event
+        return self._controller.serializer.serialize(
+            event,
+            renderer=self.streaming_renderer,
+        )
+
     async def _handle_event_error(
         self,
         exc: Exception,
@@ -228,3 +310,92 @@ class StreamingResponse(HttpResponseBase):  # noqa: WPS338
             return await self._controller.handle_event_error(exc)
         except Exception as sub:
             raise sub from exc
+
+
+@contextlib.asynccontextmanager
+async def _send_deadline(
+    send_timeout: float | None,
+) -> AsyncGenerator[None, None]:
+    # Event is sent by the ASGI handler while we wait for it to come back.
+    # When sending takes too long, for example, the client stopped reading,
+    # we cancel the sending task, just like it happens on a disconnect:
+    if send_timeout is None:
+        yield
+        return
+    sending_task = asyncio.current_task()
+    # for mypy: we are always inside a task here
+    assert sending_task is not None  # noqa: S101
+    timer_handle = asyncio.get_running_loop().call_later(
+        send_timeout,
+        sending_task.cancel,
+    )
+    try:  # noqa: WPS501
+        yield
+    finally:
+        timer_handle.cancel()
+
+
+@final
+class _PingTimer:
+    """
+    Single rearmable ping timer for one streaming connection.
+
+    Moving the deadline does not touch the event loop.
+    When the scheduled callback finds that the deadline was moved,
+    it schedules itself again. So there's at most one timer handle
+    per ping interval, no matter how many events are sent.
+    """
+
+    __slots__ = ('_deadline', '_loop', '_seconds', '_timer_handle', '_waiter')
+
+    def __init__(self, seconds: float) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._seconds = seconds
+        self._deadline = self._loop.time() + seconds
+        self._timer_handle: asyncio.TimerHandle | None = self._loop.call_at(
+            self._deadline,
+            self._fire,
+        )
+        self._waiter: asyncio.Future[None] | None = None
+
+    def reset(self) -> None:
+        """Start counting the ping interval from now."""
+        self._deadline = self._loop.time() + self._seconds
+        if self._timer_handle is None:
+            self._timer_handle = self._loop.call_at(self._deadline, self._fire)
+
+    async def wait(self, event_task: 'asyncio.Future[Any]') -> bool:
+        """
+        Wait for the event task or for the ping deadline.
+
+        Returns ``True`` when the event task is done,
+        and ``False`` when it is time to send a ping.
+        The event task is never cancelled.
+        """
+        if not event_task.done():
+            waiter = self._loop.create_future()
+            self._waiter = waiter
+            event_task.add_done_callback(self._wake)
+            try:  # noqa: WPS501
+                await waiter
+            finally:
+                event_task.remove_done_callback(self._wake)
+                self._waiter = None
+        return event_task.done()
+
+    def cancel(self) -> None:
+        """Stop the timer, when the stream is closed."""
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+    def _fire(self) -> None:
+        if self._loop.time() < self._deadline:
+            self._timer_handle = self._loop.call_at(self._deadline, self._fire)
+            return
+        self._timer_handle = None
+        self._wake()
+
+    def _wake(self, future: 'asyncio.Future[Any] | None' = None) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
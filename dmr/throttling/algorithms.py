@@ -1,12 +1,13 @@
 import abc
+import math
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from typing_extensions import override
 
 from dmr.exceptions import TooManyRequestsError
 from dmr.throttling.backends import CachedRateLimit
-from dmr.throttling.lua import LEAKY_BUCKET, SIMPLE_RATE
+from dmr.throttling.lua import GCRA, LEAKY_BUCKET, SIMPLE_RATE
 
 if TYPE_CHECKING:
     from dmr.controller import Controller
@@ -15,11 +16,19 @@ if TYPE_CHECKING:
     from dmr.throttling import AsyncThrottle, SyncThrottle
 
 
+#: Milliseconds in a second.
+_MS: Final = 1000
+
+
 class BaseThrottleAlgorithm:
     """Base class for all throttling algorithms."""
 
     __slots__ = ()
 
+    #: Does this algorithm only count requests in fixed time windows?
+    #: Such algorithms can be implemented with atomic cache counters.
+    counts_fixed_windows: ClassVar[bool] = False
+
     @abc.abstractmethod
     def access(
         self,
@@ -65,10 +74,16 @@ class SimpleRate(BaseThrottleAlgorithm):
 
     Defines a fixed window with a fixed amount of requests possible.
     When window is expired, resets the count of requests.
+
+    Backends with atomic counters,
+    like :class:`~dmr.throttling.backends.SyncDjangoCache` with ``atomic=True``,
+    align windows to the clock instead of the first request in a window.
     """
 
     __slots__ = ()
 
+    counts_fixed_windows: ClassVar[bool] = True
+
     @override
     def transaction_script(self, script_format: str) -> str | None:
         if script_format == 'lua':
@@ -277,3 +292,124 @@ class LeakyBucket(BaseThrottleAlgorithm):
     def _ceil_div(self, dividend: int, divisor: int) -> int:
         """Integer ceiling division for non-negative values."""
         return (dividend + divisor - 1) // divisor
+
+
+class GenericCellRate(BaseThrottleAlgorithm):
+    """
+    Generic cell rate algorithm, also known as GCRA.
+
+    Requests are spaced by ``duration / max_requests`` emission interval,
+    while up to ``max_requests`` requests can still be made in a burst.
+    Like :class:`dmr.throttling.algorithms.LeakyBucket`,
+    it has no window boundaries and provides smooth rate-limiting.
+
+    It stores a single number per cache key:
+    theoretical arrival time of the next request in milliseconds.
+    It is kept in ``time`` field of the cached state and ``history``
+    is always empty, so cached values are small and cheap to serialize.
+
+    .. seealso::
+
+        https://en.wikipedia.org/wiki/Generic_cell_rate_algorithm
+
+    .. versionadded:: 0.15.0
+    """
+
+    __slots__ = ()
+
+    @override
+    def transaction_script(self, script_format: str) -> str | None:
+        if script_format == 'lua':
+            return GCRA
+        return super().transaction_script(script_format)
+
+    @override
+    def access(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttle: 'SyncThrottle | AsyncThrottle',
+        cache_object: CachedRateLimit | None,
+    ) -> CachedRateLimit:
+        """Check access; raise when the next request is too early."""
+        now = _now_in_ms()
+        tat = self._arrival_time(cache_object, now)
+        next_tat = tat + self._interval(throttle)
+        if next_tat - throttle.duration_in_seconds * _MS > now:
+            raise TooManyRequestsError(
+                headers=self._report_usage(
+                    endpoint,
+                    controller,
+                    throttle,
+                    tat,
+                    now,
+                ),
+            )
+        return CachedRateLimit(history=[], time=next_tat)
+
+    @override
+    def report_usage(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttle: 'SyncThrottle | AsyncThrottle',
+        cache_object: CachedRateLimit | None,
+    ) -> dict[str, str]:
+        """Report throttling usage without incrementing."""
+        now = _now_in_ms()
+        return self._report_usage(
+            endpoint,
+            controller,
+            throttle,
+            self._arrival_time(cache_object, now),
+            now,
+            report_all=False,
+        )
+
+    def _interval(self, throttle: 'SyncThrottle | AsyncThrottle') -> int:
+        # Must be the same as in the lua script:
+        return max(
+            1,
+            throttle.duration_in_seconds * _MS // throttle.max_requests,
+        )
+
+    def _arrival_time(
+        self,
+        cache_object: CachedRateLimit | None,
+        now: int,
+    ) -> int:
+        if cache_object is None:
+            return now
+        return max(cache_object['time'], now)
+
+    def _report_usage(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttle: 'SyncThrottle | AsyncThrottle',
+        tat: int,
+        now: int,
+        *,
+        report_all: bool = True,
+    ) -> dict[str, str]:
+        interval = self._interval(throttle)
+        # Time left till the whole limit is available again:
+        busy = tat - now
+        remaining = max(
+            0,
+            (throttle.duration_in_seconds * _MS - busy) // interval,
+        )
+        if not remaining:
+            # Time left till the next request is allowed:
+            busy += interval - throttle.duration_in_seconds * _MS
+        return throttle.collect_response_headers(
+            endpoint,
+            controller,
+            remaining=remaining,
+            reset=math.ceil(max(0, busy) / _MS),
+            report_all=report_all,
+        )
+
+
+def _now_in_ms() -> int:
+    return int(time.time() * _MS)
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, ClassVar
 
 from typing_extensions import TypedDict
@@ -43,6 +44,16 @@ class _BaseThrottleBackend:
             return self.needs_transaction_script
         return None
 
+    def is_atomic(self) -> bool:
+        """
+        Does this backend update the rate limiting state atomically?
+
+        Non-atomic backends are guarded by in-process locks.
+
+        .. versionadded:: 0.15.0
+        """
+        return False
+
     def initialize_algorithm(self, algorithm: 'BaseThrottleAlgorithm') -> None:
         """Initialize and prepare backend for the algorithm."""
         # Do the validation:
@@ -93,6 +104,36 @@ class BaseThrottleSyncBackend(_BaseThrottleBackend):
         """Sync get the state with no increments."""
         raise NotImplementedError
 
+    def incr_many(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['SyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> list[CachedRateLimit]:
+        """
+        Sync increment cached rate limit states of several throttles.
+
+        Throttles are checked in order, the first denied one raises
+        and the following ones are not incremented.
+        Calls :meth:`incr` for each throttle by default,
+        override it to check all throttles in a single round-trip.
+
+        .. versionadded:: 0.15.0
+        """
+        return [
+            self.incr(
+                endpoint,
+                controller,
+                throttle,
+                cache_key=cache_key,
+                algorithm=algorithm,
+            )
+            for throttle, cache_key in zip(throttles, cache_keys, strict=True)
+        ]
+
 
 class BaseThrottleAsyncBackend(_BaseThrottleBackend):
     """
@@ -127,3 +168,30 @@ class BaseThrottleAsyncBackend(_BaseThrottleBackend):
     ) -> CachedRateLimit | None:
         """Sync get the state with no increments."""
         raise NotImplementedError
+
+    async def incr_many(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['AsyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> list[CachedRateLimit]:
+        """
+        Async increment cached rate limit states of several throttles.
+
+        See :meth:`BaseThrottleSyncBackend.incr_many` for more details.
+
+        .. versionadded:: 0.15.0
+        """
+        return [
+            await self.incr(  # noqa: WPS476
+                endpoint,
+                controller,
+                throttle,
+                cache_key=cache_key,
+                algorithm=algorithm,
+            )
+            for throttle, cache_key in zip(throttles, cache_keys, strict=True)
+        ]
@@ -1,10 +1,20 @@
+import contextlib
 import dataclasses
-from typing import TYPE_CHECKING, final
+import struct
+import time
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Final, final
 
 from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
 from typing_extensions import override
 
-from dmr.settings import default_parser, default_renderer
+from dmr.exceptions import (
+    EndpointMetadataError,
+    InternalServerError,
+    TooManyRequestsError,
+)
+from dmr.settings import default_parser
 from dmr.throttling.backends.base import (
     BaseThrottleAsyncBackend,
     BaseThrottleSyncBackend,
@@ -18,6 +28,15 @@ if TYPE_CHECKING:
     from dmr.throttling import AsyncThrottle, SyncThrottle
     from dmr.throttling.algorithms import BaseThrottleAlgorithm
 
+# Binary state layout: version byte, `time` and `history` as signed ints.
+# JSON state of older versions always starts with `{`, so it never clashes:
+_STATE_VERSION: Final = 1
+_STATE_HEADER: Final = struct.Struct('>Bq')
+_STATE_ITEM: Final = struct.Struct('>q')
+
+# Counters can expire between `add` and `incr` calls, we retry that:
+_INCR_ATTEMPTS: Final = 3
+
 
 @final
 class UnsafeCacheBackendWarning(UserWarning):
@@ -25,8 +44,9 @@ class UnsafeCacheBackendWarning(UserWarning):
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
-class _DjangoCache:
+class _DjangoCache:  # noqa: WPS214
     cache_name: str = DEFAULT_CACHE_ALIAS
+    atomic: bool = False
     _cache: BaseCache = dataclasses.field(init=False)
 
     def __post_init__(
@@ -35,6 +55,96 @@ class _DjangoCache:
         """Initialize the cache backend."""
         object.__setattr__(self, '_cache', caches[self.cache_name])
 
+    def is_atomic(self) -> bool:
+        """Atomic counters don't need locks."""
+        return self.atomic
+
+    def _check_atomic_algorithm(
+        self,
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> None:
+        if self.atomic and not algorithm.counts_fixed_windows:
+            raise EndpointMetadataError(
+                f'Cannot use atomic backend {self!r} with {algorithm!r}, '
+                'because atomic counters only support '
+                'algorithms with fixed windows',
+            )
+
+    def _counter_window(
+        self,
+        cache_key: str,
+        throttle: 'SyncThrottle | AsyncThrottle',
+    ) -> tuple[str, int, int]:
+        # Windows are aligned to the clock, so all workers share the same key
+        # and the key expires together with its window:
+        now = int(time.time())
+        window_end = (
+            now // throttle.duration_in_seconds + 1
+        ) * throttle.duration_in_seconds
+        return f'{cache_key}::{window_end}', window_end, window_end - now
+
+    def _check_counter(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttle: 'SyncThrottle | AsyncThrottle',
+        *,
+        requests: int,
+        window_end: int,
+    ) -> CachedRateLimit:
+        if requests > throttle.max_requests:
+            # Headers of all throttles, just like non-atomic `access` does:
+            raise TooManyRequestsError(
+                headers=throttle.collect_response_headers(
+                    endpoint,
+                    controller,
+                    remaining=0,
+                    reset=window_end - int(time.time()),
+                    report_all=True,
+                ),
+            )
+        return CachedRateLimit(history=[requests], time=window_end)
+
+    def _load_counter(
+        self,
+        requests: int | None,
+        throttle: 'SyncThrottle | AsyncThrottle',
+        window_end: int,
+    ) -> CachedRateLimit | None:
+        if requests is None:
+            return None
+        return CachedRateLimit(
+            history=[min(requests, throttle.max_requests)],
+            time=window_end,
+        )
+
+    def _access_many(  # noqa: WPS211
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['SyncThrottle | AsyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+        stored_caches: Mapping[str, bytes],
+        updates: dict[int, dict[str, bytes]],
+    ) -> list[CachedRateLimit]:
+        # Allowed states are collected into `updates` by their ttl
+        # before the first denied throttle raises, so they are still saved:
+        cache_objects: list[CachedRateLimit] = []
+        for throttle, cache_key in zip(throttles, cache_keys, strict=True):
+            cache_object = algorithm.access(
+                endpoint,
+                controller,
+                throttle,
+                self._load_cache(controller, stored_caches.get(cache_key)),
+            )
+            updates[throttle.duration_in_seconds][cache_key] = self._dump_cache(
+                cache_object,
+            )
+            cache_objects.append(cache_object)
+        return cache_objects
+
     def _load_cache(
         self,
         controller: 'Controller[BaseSerializer]',
@@ -42,7 +152,10 @@ class _DjangoCache:
     ) -> CachedRateLimit | None:
         if stored_cache is None:
             return None
+        if stored_cache[:1] == bytes((_STATE_VERSION,)):
+            return _unpack_state(stored_cache)
 
+        # State written by older versions as JSON:
         return controller.serializer.deserialize(  # type: ignore[no-any-return]
             stored_cache,
             parser=default_parser,
@@ -50,28 +163,56 @@ class _DjangoCache:
             model=CachedRateLimit,
         )
 
-    def _dump_cache(
-        self,
-        controller: 'Controller[BaseSerializer]',
-        cache_object: CachedRateLimit,
-    ) -> bytes:
-        return controller.serializer.serialize(
-            cache_object,
-            renderer=default_renderer,
+    def _dump_cache(self, cache_object: CachedRateLimit) -> bytes:
+        return _STATE_HEADER.pack(
+            _STATE_VERSION,
+            cache_object['time'],
+        ) + b''.join(
+            _STATE_ITEM.pack(requests) for requests in cache_object['history']
         )
 
 
+def _unpack_state(stored_cache: bytes) -> CachedRateLimit:
+    _version, state_time = _STATE_HEADER.unpack_from(stored_cache)
+    return CachedRateLimit(
+        time=state_time,
+        history=[
+            packed[0]
+            for packed in _STATE_ITEM.iter_unpack(
+                stored_cache[_STATE_HEADER.size :],
+            )
+        ],
+    )
+
+
 @dataclasses.dataclass(slots=True, frozen=True)
 class SyncDjangoCache(_DjangoCache, BaseThrottleSyncBackend):
     """
     Uses Django sync cache framework for storing the rate limiting state.
 
+    By default, the state is updated with non-atomic ``get`` and ``set``
+    calls, guarded by an in-process lock.
+    Pass ``atomic=True`` to use atomic ``add`` and ``incr`` cache calls
+    with a key per time window instead.
+    It requires no locks and is correct across processes,
+    when the cache has atomic ``incr``, like Redis or Memcached.
+    Only algorithms with fixed windows,
+    like :class:`~dmr.throttling.algorithms.SimpleRate`, are supported.
+
     .. seealso::
 
         https://docs.djangoproject.com/en/stable/topics/cache/
 
+    .. versionchanged:: 0.15.0
+        Added ``atomic`` parameter.
+
     """
 
+    @override
+    def initialize_algorithm(self, algorithm: 'BaseThrottleAlgorithm') -> None:
+        BaseThrottleSyncBackend.initialize_algorithm(self, algorithm)
+        self._check_atomic_algorithm(algorithm)
+
     @override
     def incr(
         self,
@@ -82,6 +223,19 @@ class SyncDjangoCache(_DjangoCache, BaseThrottleSyncBackend):
         cache_key: str,
         algorithm: 'BaseThrottleAlgorithm',
     ) -> CachedRateLimit:
+        if self.atomic:
+            counter_key, window_end, ttl_seconds = self._counter_window(
+                cache_key,
+                throttle,
+            )
+            return self._check_counter(
+                endpoint,
+                controller,
+                throttle,
+                requests=self._incr_counter(counter_key, ttl_seconds),
+                window_end=window_end,
+            )
+
         # It is not atomic, but this is fine, we document this:
         cache_object = algorithm.access(
             endpoint,
@@ -98,6 +252,42 @@ class SyncDjangoCache(_DjangoCache, BaseThrottleSyncBackend):
         )
         return cache_object
 
+    @override
+    def incr_many(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['SyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> list[CachedRateLimit]:
+        """Check all throttles with one ``get_many`` and ``set_many``."""
+        if self.atomic:
+            return BaseThrottleSyncBackend.incr_many(
+                self,
+                endpoint,
+                controller,
+                throttles,
+                cache_keys=cache_keys,
+                algorithm=algorithm,
+            )
+
+        updates: dict[int, dict[str, bytes]] = defaultdict(dict)
+        try:
+            return self._access_many(
+                endpoint,
+                controller,
+                throttles,
+                cache_keys=cache_keys,
+                algorithm=algorithm,
+                stored_caches=self._cache.get_many(cache_keys),
+                updates=updates,
+            )
+        finally:
+            for ttl_seconds, cache_updates in updates.items():
+                self._cache.set_many(cache_updates, timeout=ttl_seconds)
+
     @override
     def get(
         self,
@@ -108,9 +298,28 @@ class SyncDjangoCache(_DjangoCache, BaseThrottleSyncBackend):
         cache_key: str,
     ) -> CachedRateLimit | None:
         """Sync get the cached rate limit state."""
+        if self.atomic:
+            counter_key, window_end, _ttl = self._counter_window(
+                cache_key,
+                throttle,
+            )
+            return self._load_counter(
+                self._cache.get(counter_key),
+                throttle,
+                window_end,
+            )
         stored_cache = self._cache.get(cache_key)
         return self._load_cache(controller, stored_cache)
 
+    def _incr_counter(self, counter_key: str, ttl_seconds: int) -> int:
+        for _ in range(_INCR_ATTEMPTS):
+            if self._cache.add(counter_key, 1, timeout=ttl_seconds):
+                return 1
+            # The key can expire between `add` and `incr` calls:
+            with contextlib.suppress(ValueError):
+                return self._cache.incr(counter_key)
+        raise _incr_counter_error(counter_key)
+
     def _set(
         self,
         endpoint: 'Endpoint',
@@ -123,7 +332,7 @@ class SyncDjangoCache(_DjangoCache, BaseThrottleSyncBackend):
         """Sync set the cached rate limit state."""
         self._cache.set(
             cache_key,
-            self._dump_cache(controller, cache_object),
+            self._dump_cache(cache_object),
             timeout=ttl_seconds,
         )
 
@@ -133,12 +342,24 @@ class AsyncDjangoCache(_DjangoCache, BaseThrottleAsyncBackend):
     """
     Uses Django async cache framework for storing the rate limiting state.
 
+    Pass ``atomic=True`` to use atomic ``aadd`` and ``aincr`` cache calls
+    with a key per time window instead of non-atomic ``aget`` and ``aset``.
+    See :class:`~dmr.throttling.backends.SyncDjangoCache` for more details.
+
     .. seealso::
 
         https://docs.djangoproject.com/en/stable/topics/cache/
 
+    .. versionchanged:: 0.15.0
+        Added ``atomic`` parameter.
+
     """
 
+    @override
+    def initialize_algorithm(self, algorithm: 'BaseThrottleAlgorithm') -> None:
+        BaseThrottleAsyncBackend.initialize_algorithm(self, algorithm)
+        self._check_atomic_algorithm(algorithm)
+
     @override
     async def incr(
         self,
@@ -149,6 +370,19 @@ class AsyncDjangoCache(_DjangoCache, BaseThrottleAsyncBackend):
         cache_key: str,
         algorithm: 'BaseThrottleAlgorithm',
     ) -> CachedRateLimit:
+        if self.atomic:
+            counter_key, window_end, ttl_seconds = self._counter_window(
+                cache_key,
+                throttle,
+            )
+            return self._check_counter(
+                endpoint,
+                controller,
+                throttle,
+                requests=await self._incr_counter(counter_key, ttl_seconds),
+                window_end=window_end,
+            )
+
         # It is not atomic, but this is fine, we document this:
         cache_object = algorithm.access(
             endpoint,
@@ -165,6 +399,45 @@ class AsyncDjangoCache(_DjangoCache, BaseThrottleAsyncBackend):
         )
         return cache_object
 
+    @override
+    async def incr_many(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['AsyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> list[CachedRateLimit]:
+        """Async check all throttles with ``aget_many`` and ``aset_many``."""
+        if self.atomic:
+            return await BaseThrottleAsyncBackend.incr_many(
+                self,
+                endpoint,
+                controller,
+                throttles,
+                cache_keys=cache_keys,
+                algorithm=algorithm,
+            )
+
+        updates: dict[int, dict[str, bytes]] = defaultdict(dict)
+        try:
+            return self._access_many(
+                endpoint,
+                controller,
+                throttles,
+                cache_keys=cache_keys,
+                algorithm=algorithm,
+                stored_caches=await self._cache.aget_many(cache_keys),
+                updates=updates,
+            )
+        finally:
+            for ttl_seconds, cache_updates in updates.items():
+                await self._cache.aset_many(  # noqa: WPS476
+                    cache_updates,
+                    timeout=ttl_seconds,
+                )
+
     @override
     async def get(
         self,
@@ -175,9 +448,28 @@ class AsyncDjangoCache(_DjangoCache, BaseThrottleAsyncBackend):
         cache_key: str,
     ) -> CachedRateLimit | None:
         """Async get the cached rate limit state."""
+        if self.atomic:
+            counter_key, window_end, _ttl = self._counter_window(
+                cache_key,
+                throttle,
+            )
+            return self._load_counter(
+                await self._cache.aget(counter_key),
+                throttle,
+                window_end,
+            )
         stored_cache = await self._cache.aget(cache_key)
         return self._load_cache(controller, stored_cache)
 
+    async def _incr_counter(self, counter_key: str, ttl_seconds: int) -> int:
+        for _ in range(_INCR_ATTEMPTS):
+            if await self._cache.aadd(counter_key, 1, timeout=ttl_seconds):  # noqa: WPS476
+                return 1
+            # The key can expire between `aadd` and `aincr` calls:
+            with contextlib.suppress(ValueError):
+                return await self._cache.aincr(counter_key)  # noqa: WPS476
+        raise _incr_counter_error(counter_key)
+
     async def _set(
         self,
         endpoint: 'Endpoint',
@@ -190,6 +482,13 @@ class AsyncDjangoCache(_DjangoCache, BaseThrottleAsyncBackend):
         """Async set the cached rate limit state."""
         await self._cache.aset(
             cache_key,
-            self._dump_cache(controller, cache_object),
+            self._dump_cache(cache_object),
             timeout=ttl_seconds,
         )
+
+
+def _incr_counter_error(counter_key: str) -> InternalServerError:
+    return InternalServerError(
+        f'Cannot increment throttling counter {counter_key!r}: '
+        f'it has expired between `add` and `incr` {_INCR_ATTEMPTS} times',
+    )
@@ -7,19 +7,28 @@ except ImportError:  # pragma: no cover
     )
     raise
 
+import asyncio
 import dataclasses
-from typing import TYPE_CHECKING, Any, ClassVar, Final, cast
+import threading
+import time
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Protocol, cast
 
 from redis import asyncio as aioredis
+from redis.asyncio.cluster import RedisCluster as AsyncRedisCluster
+from redis.cluster import RedisCluster
 from redis.commands.core import AsyncScript, Script
+from redis.crc import key_slot
 from typing_extensions import override
 
-from dmr.exceptions import TooManyRequestsError
+from dmr.exceptions import EndpointMetadataError, TooManyRequestsError
 from dmr.throttling.backends.base import (
     BaseThrottleAsyncBackend,
     BaseThrottleSyncBackend,
     CachedRateLimit,
 )
+from dmr.throttling.lua import batch_script
 
 if TYPE_CHECKING:
     from dmr.controller import Controller
@@ -32,9 +41,272 @@ if TYPE_CHECKING:
 _WRITE: Final = 0
 _READ: Final = 1
 
+#: Maximum number of cache keys with local leases per backend.
+_MAX_LEASES: Final = 10_000
+
+
+@dataclasses.dataclass(slots=True)
+class _Lease:
+    # Requests left to be used locally:
+    units: int
+    # Redis counter after this lease was taken:
+    current: int
+    # Redis server timestamp when the window ends:
+    expire_at: int
+    # Local monotonic time when the window ends,
+    # Redis server clock and local clock might differ:
+    deadline: float
+
+
+class _LocalLeases:
+    """Per-process requests leased from Redis."""
+
+    __slots__ = ('_leases', '_lock')
+
+    def __init__(self) -> None:
+        self._leases: dict[str, _Lease] = {}
+        # Leases are shared between threads:
+        self._lock = threading.Lock()
+
+    def take(self, cache_key: str) -> CachedRateLimit | None:
+        now = time.monotonic()
+        with self._lock:
+            lease = self._leases.get(cache_key)
+            if lease is None or lease.units <= 0 or lease.deadline <= now:
+                return None
+            lease.units -= 1
+            return _leased_state(lease)
+
+    def store(self, cache_key: str, lease: _Lease) -> CachedRateLimit:
+        with self._lock:
+            if len(self._leases) >= _MAX_LEASES:
+                self._prune()
+            self._leases[cache_key] = lease
+            return _leased_state(lease)
+
+    def unused(self, cache_key: str) -> int:
+        with self._lock:
+            lease = self._leases.get(cache_key)
+            return 0 if lease is None else lease.units
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for cache_key, lease in list(self._leases.items()):
+            if lease.deadline <= now:
+                self._leases.pop(cache_key)
+        if len(self._leases) >= _MAX_LEASES:
+            # Drop the oldest lease, its units are lost:
+            self._leases.pop(next(iter(self._leases)))
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _ScriptCall:
+    script: AsyncScript
+    keys: list[str]
+    args: list[int]
+    future: 'asyncio.Future[Any]'
+
+
+class _Pipeline(Protocol):
+    # `redis` leaves the result of `execute` untyped:
+    async def execute(self, *, raise_on_error: bool) -> list[Any]: ...
+
+
+class _ScriptBatcher:
+    """Sends scripts called close in time with a single pipeline."""
+
+    __slots__ = ('_client', '_delay', '_pending', '_tasks')
+
+    def __init__(self, client: 'aioredis.Redis[Any]', delay: float) -> None:
+        self._client = client
+        self._delay = delay
+        # Futures are bound to their event loops:
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            list[_ScriptCall],
+        ] = weakref.WeakKeyDictionary()
+        # Strong references to running pipelines:
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def __call__(
+        self,
+        script: AsyncScript,
+        *,
+        keys: list[str],
+        args: list[int],
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        pending = self._pending.setdefault(loop, [])
+        script_call = _ScriptCall(script, keys, args, loop.create_future())
+        pending.append(script_call)
+        if len(pending) == 1:
+            # The first call in a batch schedules sending the whole batch:
+            if self._delay:
+                loop.call_later(self._delay, self._flush, loop)
+            else:
+                loop.call_soon(self._flush, loop)
+        return await script_call.future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        task = loop.create_task(self._execute(self._pending.pop(loop, [])))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, script_calls: list[_ScriptCall]) -> None:
+        try:
+            script_results = await self._send(script_calls)
+        except Exception as exc:
+            for failed_call in script_calls:
+                _settle(failed_call.future, exc)
+            return
+        for script_call, script_result in zip(
+            script_calls,
+            script_results,
+            strict=True,
+        ):
+            _settle(script_call.future, script_result)
+
+    async def _send(self, script_calls: list[_ScriptCall]) -> list[Any]:
+        pipeline = self._client.pipeline(transaction=False)
+        for script_call in script_calls:
+            await script_call.script(  # noqa: WPS476
+                keys=script_call.keys,
+                args=script_call.args,
+                client=pipeline,
+            )
+        return await cast('_Pipeline', pipeline).execute(raise_on_error=False)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _BaseRedis:  # noqa: WPS214
+    lease_size: int = dataclasses.field(default=1, kw_only=True)
+    # Backends with different leases are not equal:
+    _leases: _LocalLeases | None = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create local leases, when they are used."""
+        object.__setattr__(
+            self,
+            '_leases',
+            _LocalLeases() if self.lease_size > 1 else None,
+        )
+
+    def _check_lease_algorithm(
+        self,
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> None:
+        if self.lease_size > 1 and not algorithm.counts_fixed_windows:
+            raise EndpointMetadataError(
+                f'Cannot use leases of {self!r} with {algorithm!r}, '
+                'because leases only support algorithms with fixed windows',
+            )
+
+    def _script_args(
+        self,
+        throttle: 'SyncThrottle | AsyncThrottle',
+        mode: int,
+    ) -> list[int]:
+        return [
+            throttle.max_requests,
+            throttle.duration_in_seconds,
+            mode,
+            self.lease_size,
+        ]
+
+    def _batch_args(
+        self,
+        throttles: Sequence['SyncThrottle | AsyncThrottle'],
+    ) -> list[int]:
+        return [
+            script_arg
+            for throttle in throttles
+            for script_arg in self._script_args(throttle, _WRITE)
+        ]
+
+    def _process_results(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['SyncThrottle | AsyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+        script_results: list[tuple[int, ...]],
+    ) -> list[CachedRateLimit]:
+        # Script stops after the first denied throttle, so results can be
+        # shorter than throttles, but the last one raises in this case:
+        return [
+            self._process_result(
+                endpoint,
+                controller,
+                throttle,
+                cache_key=cache_key,
+                algorithm=algorithm,
+                script_result=script_result,
+            )
+            for throttle, cache_key, script_result in zip(
+                throttles,
+                cache_keys,
+                script_results,
+                strict=False,
+            )
+        ]
+
+    def _process_result(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttle: 'SyncThrottle | AsyncThrottle',
+        *,
+        cache_key: str,
+        algorithm: 'BaseThrottleAlgorithm',
+        script_result: tuple[int, ...],
+    ) -> CachedRateLimit:
+        cache_object = CachedRateLimit(
+            history=[script_result[1]],
+            time=script_result[2],
+        )
+        if script_result[0] == 0:
+            raise TooManyRequestsError(
+                headers=algorithm.report_usage(
+                    endpoint,
+                    controller,
+                    throttle,
+                    cache_object,
+                ),
+            )
+        if self._leases is None:
+            return cache_object
+        return self._leases.store(
+            cache_key,
+            _Lease(
+                # One of the granted requests is used right now:
+                units=script_result[3] - 1,
+                current=script_result[1],
+                expire_at=script_result[2],
+                deadline=time.monotonic() + script_result[4],
+            ),
+        )
+
+    def _unused(self, cache_key: str) -> int:
+        if self._leases is None:
+            return 0
+        return self._leases.unused(cache_key)
+
+    def _process_read(
+        self,
+        cache_key: str,
+        script_result: tuple[int, ...],
+    ) -> CachedRateLimit:
+        return CachedRateLimit(
+            # Requests leased, but not used yet, are not reported as used:
+            history=[script_result[1] - self._unused(cache_key)],
+            time=script_result[2],
+        )
+
 
 @dataclasses.dataclass(slots=True, frozen=True)
-class SyncRedis(BaseThrottleSyncBackend):
+class SyncRedis(_BaseRedis, BaseThrottleSyncBackend):
     """
     Uses sync Redis client for multiproccess safe rate-limiting.
 
@@ -47,20 +319,43 @@ class SyncRedis(BaseThrottleSyncBackend):
 
         pip install redis
 
+    Pass ``lease_size`` to lease this many requests from Redis at once
+    and use them locally, without any Redis calls, until they are exhausted.
+    It reduces Redis load for high limits, but leased requests
+    which are not used by this process till the end of the window are lost.
+    So, clients can be limited a bit earlier than the global limit,
+    up to ``(lease_size - 1) * number_of_processes`` requests.
+    Only algorithms with fixed windows,
+    like :class:`~dmr.throttling.algorithms.SimpleRate`, are supported.
+
     .. seealso::
 
         https://redis.readthedocs.io
 
+    .. versionchanged:: 0.15.0
+        Added ``lease_size`` parameter.
+
     """
 
     client: 'redis.Redis[Any]'
     _script: Script = dataclasses.field(init=False, repr=False, compare=False)
+    _batch_script: Script = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     needs_transaction_script: ClassVar[str] = 'lua'  # pyright: ignore[reportIncompatibleVariableOverride]
 
+    @override
+    def is_atomic(self) -> bool:
+        """Lua scripts are executed atomically."""
+        return True
+
     @override
     def initialize_algorithm(self, algorithm: 'BaseThrottleAlgorithm') -> None:
         BaseThrottleSyncBackend.initialize_algorithm(self, algorithm)
+        self._check_lease_algorithm(algorithm)
         script = algorithm.transaction_script(self.needs_transaction_script)
         # for mypy: we just checked this:
         assert script is not None  # noqa: S101
@@ -69,6 +364,11 @@ class SyncRedis(BaseThrottleSyncBackend):
             '_script',
             self.client.register_script(script),
         )
+        object.__setattr__(  # noqa: PLC2801
+            self,
+            '_batch_script',
+            self.client.register_script(batch_script(script)),
+        )
 
     @override
     def incr(
@@ -80,32 +380,66 @@ class SyncRedis(BaseThrottleSyncBackend):
         cache_key: str,
         algorithm: 'BaseThrottleAlgorithm',
     ) -> CachedRateLimit:
+        leased = None if self._leases is None else self._leases.take(cache_key)
+        if leased is not None:
+            return leased
         script_result = cast(
-            tuple[int, int, int],
+            tuple[int, ...],
             self._script(
                 keys=[cache_key],
-                # write request:
-                args=[
-                    throttle.max_requests,
-                    throttle.duration_in_seconds,
-                    _WRITE,
-                ],
+                args=self._script_args(throttle, _WRITE),
             ),
         )
-        cache_object = CachedRateLimit(
-            history=[script_result[1]],
-            time=script_result[2],
+        return self._process_result(
+            endpoint,
+            controller,
+            throttle,
+            cache_key=cache_key,
+            algorithm=algorithm,
+            script_result=script_result,
         )
-        if script_result[0] == 0:
-            raise TooManyRequestsError(
-                headers=algorithm.report_usage(
-                    endpoint,
-                    controller,
-                    throttle,
-                    cache_object,
-                ),
+
+    @override
+    def incr_many(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['SyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> list[CachedRateLimit]:
+        """Check all throttles with a single script call."""
+        if self._leases is not None or not _in_one_slot(
+            self.client,
+            cache_keys,
+        ):
+            # Leases are local per key, and Redis Cluster can't run
+            # a script for keys from different hash slots,
+            # so these throttles are checked one by one:
+            return BaseThrottleSyncBackend.incr_many(
+                self,
+                endpoint,
+                controller,
+                throttles,
+                cache_keys=cache_keys,
+                algorithm=algorithm,
             )
-        return cache_object
+        script_results = cast(
+            list[tuple[int, ...]],
+            self._batch_script(
+                keys=list(cache_keys),
+                args=self._batch_args(throttles),
+            ),
+        )
+        return self._process_results(
+            endpoint,
+            controller,
+            throttles,
+            cache_keys=cache_keys,
+            algorithm=algorithm,
+            script_results=script_results,
+        )
 
     @override
     def get(
@@ -118,25 +452,17 @@ class SyncRedis(BaseThrottleSyncBackend):
     ) -> CachedRateLimit | None:
         """Sync get the cached rate limit state."""
         script_result = cast(
-            tuple[int, int, int],
+            tuple[int, ...],
             self._script(
                 keys=[cache_key],
-                # read-only request:
-                args=[
-                    throttle.max_requests,
-                    throttle.duration_in_seconds,
-                    _READ,
-                ],
+                args=self._script_args(throttle, _READ),
             ),
         )
-        return CachedRateLimit(
-            history=[script_result[1]],
-            time=script_result[2],
-        )
+        return self._process_read(cache_key, script_result)
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
-class AsyncRedis(BaseThrottleAsyncBackend):
+class AsyncRedis(_BaseRedis, BaseThrottleAsyncBackend):
     """
     Uses async Redis client for multiproccess safe rate-limiting.
 
@@ -149,24 +475,69 @@ class AsyncRedis(BaseThrottleAsyncBackend):
 
         pip install redis
 
+    Pass ``lease_size`` to lease this many requests from Redis at once.
+    See :class:`~dmr.throttling.backends.redis.SyncRedis` for more details.
+
+    Pass ``batch_delay`` in seconds to send scripts of concurrent requests
+    with a single Redis pipeline instead of a command per request.
+    The first check in a batch waits for ``batch_delay`` seconds
+    for other checks to join, ``0`` only waits for the current
+    event loop iteration.
+    It reduces the network overhead under high concurrency,
+    but adds up to ``batch_delay`` latency to every checked request.
+
     .. seealso::
 
         https://redis.readthedocs.io
 
+    .. versionchanged:: 0.15.0
+        Added ``lease_size`` and ``batch_delay`` parameters.
+
     """
 
     client: 'aioredis.Redis[Any]'
+    batch_delay: float | None = dataclasses.field(default=None, kw_only=True)
     _script: AsyncScript = dataclasses.field(
         init=False,
         repr=False,
         compare=False,
     )
+    _batch_script: AsyncScript = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _batcher: _ScriptBatcher | None = dataclasses.field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     needs_transaction_script: ClassVar[str] = 'lua'  # pyright: ignore[reportIncompatibleVariableOverride]
 
+    @override
+    def __post_init__(self) -> None:
+        """Create local leases and the script batcher, when they are used."""
+        _BaseRedis.__post_init__(self)
+        object.__setattr__(
+            self,
+            '_batcher',
+            (
+                None
+                if self.batch_delay is None
+                else _ScriptBatcher(self.client, self.batch_delay)
+            ),
+        )
+
+    @override
+    def is_atomic(self) -> bool:
+        """Lua scripts are executed atomically."""
+        return True
+
     @override
     def initialize_algorithm(self, algorithm: 'BaseThrottleAlgorithm') -> None:
         BaseThrottleAsyncBackend.initialize_algorithm(self, algorithm)
+        self._check_lease_algorithm(algorithm)
         script = algorithm.transaction_script(self.needs_transaction_script)
         # for mypy: we just checked this:
         assert script is not None  # noqa: S101
@@ -175,6 +546,11 @@ class AsyncRedis(BaseThrottleAsyncBackend):
             '_script',
             self.client.register_script(script),
         )
+        object.__setattr__(  # noqa: PLC2801
+            self,
+            '_batch_script',
+            self.client.register_script(batch_script(script)),
+        )
 
     @override
     async def incr(
@@ -186,27 +562,68 @@ class AsyncRedis(BaseThrottleAsyncBackend):
         cache_key: str,
         algorithm: 'BaseThrottleAlgorithm',
     ) -> CachedRateLimit:
+        leased = None if self._leases is None else self._leases.take(cache_key)
+        if leased is not None:
+            return leased
         script_result = cast(
-            tuple[int, int, int],
-            await self._script(
+            tuple[int, ...],
+            await self._run(
+                self._script,
                 keys=[cache_key],
-                args=[throttle.max_requests, throttle.duration_in_seconds, 0],
+                args=self._script_args(throttle, _WRITE),
             ),
         )
-        cache_object = CachedRateLimit(
-            history=[script_result[1]],
-            time=script_result[2],
+        return self._process_result(
+            endpoint,
+            controller,
+            throttle,
+            cache_key=cache_key,
+            algorithm=algorithm,
+            script_result=script_result,
         )
-        if script_result[0] == 0:
-            raise TooManyRequestsError(
-                headers=algorithm.report_usage(
-                    endpoint,
-                    controller,
-                    throttle,
-                    cache_object,
-                ),
+
+    @override
+    async def incr_many(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        throttles: Sequence['AsyncThrottle'],
+        *,
+        cache_keys: Sequence[str],
+        algorithm: 'BaseThrottleAlgorithm',
+    ) -> list[CachedRateLimit]:
+        """Async check all throttles with a single script call."""
+        if self._leases is not None or not _in_one_slot(
+            self.client,
+            cache_keys,
+        ):
+            # Leases are local per key, and Redis Cluster can't run
+            # a script for keys from different hash slots,
+            # so these throttles are checked one by one:
+            return await BaseThrottleAsyncBackend.incr_many(
+                self,
+                endpoint,
+                controller,
+                throttles,
+                cache_keys=cache_keys,
+                algorithm=algorithm,
             )
-        return cache_object
+        script_results = cast(
+            list[tuple[int, ...]],
+            await self._run(
+                self._batch_script,
+                keys=list(cache_keys),
+                args=self._batch_args(throttles),
+            ),
+        )
+        return self._process_results(
+            endpoint,
+            controller,
+            throttles,
+            cache_keys=cache_keys,
+            algorithm=algorithm,
+            script_results=script_results,
+        )
 
     @override
     async def get(
@@ -219,14 +636,46 @@ class AsyncRedis(BaseThrottleAsyncBackend):
     ) -> CachedRateLimit | None:
         """Async get the cached rate limit state."""
         script_result = cast(
-            tuple[int, int, int],
-            await self._script(
+            tuple[int, ...],
+            await self._run(
+                self._script,
                 keys=[cache_key],
-                # read-only request with the last `1`:
-                args=[throttle.max_requests, throttle.duration_in_seconds, 1],
+                args=self._script_args(throttle, _READ),
             ),
         )
-        return CachedRateLimit(
-            history=[script_result[1]],
-            time=script_result[2],
-        )
+        return self._process_read(cache_key, script_result)
+
+    async def _run(
+        self,
+        script: AsyncScript,
+        *,
+        keys: list[str],
+        args: list[int],
+    ) -> Any:
+        if self._batcher is None:
+            return cast('Any', await script(keys=keys, args=args))
+        return await self._batcher(script, keys=keys, args=args)
+
+
+def _settle(future: 'asyncio.Future[Any]', script_result: Any) -> None:
+    if future.done():
+        return  # the waiter was cancelled
+    # Pipelines return errors of single commands as results:
+    if isinstance(script_result, Exception):
+        future.set_exception(script_result)
+    else:
+        future.set_result(script_result)
+
+
+def _leased_state(lease: _Lease) -> CachedRateLimit:
+    return CachedRateLimit(
+        history=[lease.current - lease.units],
+        time=lease.expire_at,
+    )
+
+
+def _in_one_slot(client: object, cache_keys: Sequence[str]) -> bool:
+    if not isinstance(client, (RedisCluster, AsyncRedisCluster)):
+        return True
+    # Keys can share the slot with a common `{hash-tag}`:
+    return len({key_slot(key.encode()) for key in cache_keys}) == 1
@@ -1,11 +1,22 @@
 import asyncio
 import dataclasses
 import enum
+import functools
+from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, Generic, Self, TypeAlias, TypeVar, final
+from typing import (  # noqa: WPS235
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Self,
+    TypeAlias,
+    TypeVar,
+    cast,
+    final,
+)
 
 from typing_extensions import override
 
@@ -18,6 +29,7 @@ from dmr.throttling.backends import (
     AsyncDjangoCache,
     BaseThrottleAsyncBackend,
     BaseThrottleSyncBackend,
+    CachedRateLimit,
     SyncDjangoCache,
 )
 from dmr.throttling.cache_keys import BaseThrottleCacheKey, RemoteAddr
@@ -56,7 +68,7 @@ class Rate(enum.IntEnum):
     day = 24 * hour
 
 
-class _BaseThrottle(ResponseSpecProvider, Generic[_BackendT]):
+class _BaseThrottle(ResponseSpecProvider, Generic[_BackendT]):  # noqa: WPS214
     __slots__ = (
         '_algorithm',
         '_backend',
@@ -128,6 +140,40 @@ class _BaseThrottle(ResponseSpecProvider, Generic[_BackendT]):
         # Run check and early initializations:
         self._backend.initialize_algorithm(self._algorithm)
 
+    @property
+    def backend(self) -> _BackendT:
+        """
+        Storage backend of this throttle.
+
+        .. versionadded:: 0.15.0
+        """
+        return self._backend
+
+    @property
+    def algorithm(self) -> BaseThrottleAlgorithm:
+        """
+        Algorithm of this throttle.
+
+        .. versionadded:: 0.15.0
+        """
+        return self._algorithm
+
+    def can_group_with(self, other: '_BaseThrottle[Any]') -> bool:
+        """
+        Can this throttle be checked together with the *other* one?
+
+        Throttles of the same type with equal backends
+        and the same algorithm can be checked with a single backend call.
+
+        .. versionadded:: 0.15.0
+        """
+        return (
+            not self._has_custom_logic()
+            and type(self) is type(other)  # noqa: WPS516
+            and self.backend == other.backend
+            and type(self.algorithm) is type(other.algorithm)  # noqa: WPS516
+        )
+
     def full_cache_key(
         self,
         endpoint: 'Endpoint',
@@ -231,6 +277,10 @@ class _BaseThrottle(ResponseSpecProvider, Generic[_BackendT]):
             )
         return response_headers
 
+    @abstractmethod
+    def _has_custom_logic(self) -> bool:
+        raise NotImplementedError
+
     def _headers_spec(self) -> dict[str, HeaderSpec]:
         headers_spec: dict[str, HeaderSpec] = {}
         for header_provider in self.response_headers:
@@ -266,6 +316,9 @@ class SyncThrottle(_BaseThrottle[BaseThrottleSyncBackend]):
         cache_key = self.full_cache_key(endpoint, controller)
         if cache_key is None:
             return
+        if self._backend.is_atomic():
+            self._check(endpoint, controller, cache_key)
+            return
         with lock:
             self._check(endpoint, controller, cache_key)
 
@@ -274,15 +327,28 @@ class SyncThrottle(_BaseThrottle[BaseThrottleSyncBackend]):
         endpoint: 'Endpoint',
         controller: 'Controller[BaseSerializer]',
     ) -> dict[str, str]:
-        """Report throttle usage stats."""
-        cache_key = self.full_cache_key(endpoint, controller)
-        if cache_key is None:
-            return {}
+        """
+        Report throttle usage stats.
+
+        Reuses the state from the check of the current request,
+        if there was one, instead of reading it from the backend again.
+        """
+        cache_object = _checked_usage(controller, self)
+        if cache_object is None:
+            cache_key = self.full_cache_key(endpoint, controller)
+            if cache_key is None:
+                return {}
+            cache_object = self._backend.get(
+                endpoint,
+                controller,
+                self,
+                cache_key=cache_key,
+            )
         return self._algorithm.report_usage(
             endpoint,
             controller,
             self,
-            self._backend.get(endpoint, controller, self, cache_key=cache_key),
+            cache_object,
         )
 
     def _check(
@@ -292,14 +358,23 @@ class SyncThrottle(_BaseThrottle[BaseThrottleSyncBackend]):
         cache_key: str,
     ) -> None:
         """Check whether this request has rate limiting quota left."""
-        # NOTE: this is locked inside `__call__`, don't worry:
-        self._backend.incr(
+        # NOTE: non-atomic backends are locked inside `__call__`, don't worry:
+        cache_object = self._backend.incr(
             endpoint,
             controller,
             self,
             cache_key=cache_key,
             algorithm=self._algorithm,
         )
+        _save_usage(controller, [self], [cache_object])
+
+    @override
+    def _has_custom_logic(self) -> bool:
+        # Custom throttle logic must be called as is:
+        return (
+            type(self).__call__ is not SyncThrottle.__call__
+            or type(self)._check is not SyncThrottle._check  # noqa: SLF001
+        )
 
 
 class AsyncThrottle(_BaseThrottle[BaseThrottleAsyncBackend]):
@@ -330,6 +405,9 @@ class AsyncThrottle(_BaseThrottle[BaseThrottleAsyncBackend]):
         cache_key = self.full_cache_key(endpoint, controller)
         if cache_key is None:
             return
+        if self._backend.is_atomic():
+            await self._check(endpoint, controller, cache_key)
+            return
         async with lock:
             await self._check(endpoint, controller, cache_key)
 
@@ -338,20 +416,28 @@ class AsyncThrottle(_BaseThrottle[BaseThrottleAsyncBackend]):
         endpoint: 'Endpoint',
         controller: 'Controller[BaseSerializer]',
     ) -> dict[str, str]:
-        """Async report throttle usage stats."""
-        cache_key = self.full_cache_key(endpoint, controller)
-        if cache_key is None:
-            return {}
-        return self._algorithm.report_usage(
-            endpoint,
-            controller,
-            self,
-            await self._backend.get(
+        """
+        Async report throttle usage stats.
+
+        Reuses the state from the check of the current request,
+        if there was one, instead of reading it from the backend again.
+        """
+        cache_object = _checked_usage(controller, self)
+        if cache_object is None:
+            cache_key = self.full_cache_key(endpoint, controller)
+            if cache_key is None:
+                return {}
+            cache_object = await self._backend.get(
                 endpoint,
                 controller,
                 self,
                 cache_key=cache_key,
-            ),
+            )
+        return self._algorithm.report_usage(
+            endpoint,
+            controller,
+            self,
+            cache_object,
         )
 
     async def _check(
@@ -361,14 +447,135 @@ class AsyncThrottle(_BaseThrottle[BaseThrottleAsyncBackend]):
         cache_key: str,
     ) -> None:
         """Check whether this request has rate limiting quota left."""
-        # NOTE: this is locked on endpoint.py level, don't worry:
-        await self._backend.incr(
+        # NOTE: non-atomic backends are locked inside `__call__`, don't worry:
+        cache_object = await self._backend.incr(
             endpoint,
             controller,
             self,
             cache_key=cache_key,
             algorithm=self._algorithm,
         )
+        _save_usage(controller, [self], [cache_object])
+
+    @override
+    def _has_custom_logic(self) -> bool:
+        # Custom throttle logic must be called as is:
+        return (
+            type(self).__call__ is not AsyncThrottle.__call__
+            or type(self)._check is not AsyncThrottle._check  # noqa: SLF001
+        )
+
+
+@final
+@dataclasses.dataclass(slots=True, frozen=True)
+class ThrottleGroup:
+    """
+    Consecutive throttles of an endpoint which can be checked together.
+
+    Throttles with equal backends and the same algorithm are grouped,
+    and checked with a single ``incr_many`` backend call,
+    which backends can do in a single round-trip.
+    Throttles are still checked in order and the first denied one
+    stops the checks, just like they would be checked one by one.
+
+    Throttles which override ``__call__`` or ``_check``
+    are never grouped and are called as is.
+
+    .. versionadded:: 0.15.0
+    """
+
+    throttles: tuple[SyncThrottle | AsyncThrottle, ...]
+
+    def __call__(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        lock: AbstractContextManager[Any, Any],
+    ) -> None:
+        """Sync check all throttles of this group."""
+        if len(self.throttles) == 1:
+            cast(SyncThrottle, self.throttles[0])(endpoint, controller, lock)
+            return
+        throttles, cache_keys = self._with_cache_keys(endpoint, controller)
+        if not throttles:
+            return
+        backend = cast(SyncThrottle, throttles[0]).backend
+        check = functools.partial(
+            backend.incr_many,
+            endpoint,
+            controller,
+            cast(list[SyncThrottle], throttles),
+            cache_keys=cache_keys,
+            algorithm=throttles[0].algorithm,
+        )
+        if backend.is_atomic():
+            _save_usage(controller, throttles, check())
+            return
+        with lock:
+            _save_usage(controller, throttles, check())
+
+    async def acall(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+        lock: AbstractAsyncContextManager[Any, Any],
+    ) -> None:
+        """Async check all throttles of this group."""
+        if len(self.throttles) == 1:
+            await cast(AsyncThrottle, self.throttles[0])(
+                endpoint,
+                controller,
+                lock,
+            )
+            return
+        throttles, cache_keys = self._with_cache_keys(endpoint, controller)
+        if not throttles:
+            return
+        backend = cast(AsyncThrottle, throttles[0]).backend
+        check = functools.partial(
+            backend.incr_many,
+            endpoint,
+            controller,
+            cast(list[AsyncThrottle], throttles),
+            cache_keys=cache_keys,
+            algorithm=throttles[0].algorithm,
+        )
+        if backend.is_atomic():
+            _save_usage(controller, throttles, await check())
+            return
+        async with lock:
+            _save_usage(controller, throttles, await check())
+
+    @classmethod
+    def build(
+        cls,
+        throttles: Sequence[SyncThrottle | AsyncThrottle] | None,
+    ) -> tuple['ThrottleGroup', ...] | None:
+        """Group consecutive throttles in import time."""
+        if not throttles:
+            return None
+        groups: list[list[SyncThrottle | AsyncThrottle]] = [[throttles[0]]]
+        for throttle in throttles[1:]:
+            if groups[-1][-1].can_group_with(throttle):
+                groups[-1].append(throttle)
+            else:
+                groups.append([throttle])
+        return tuple(cls(tuple(group)) for group in groups)
+
+    def _with_cache_keys(
+        self,
+        endpoint: 'Endpoint',
+        controller: 'Controller[BaseSerializer]',
+    ) -> tuple[list[SyncThrottle | AsyncThrottle], list[str]]:
+        # Throttles without cache keys are skipped for this request:
+        throttles: list[SyncThrottle | AsyncThrottle] = []
+        cache_keys: list[str] = []
+        for throttle in self.throttles:
+            cache_key = throttle.full_cache_key(endpoint, controller)
+            if cache_key is not None:
+                throttles.append(throttle)
+                cache_keys.append(cache_key)
+        return throttles, cache_keys
 
 
 @final
@@ -405,7 +612,8 @@ class ThrottlingReport:
     which reports the first stat for throttle that is failing,
     it reports all stats for all throttles.
 
-    It will make N (which is the number of throttles) requests to cache.
+    It reuses the state of throttles checked during this request,
+    and only makes requests to cache for the rest of them.
 
     .. warning::
 
@@ -415,6 +623,10 @@ class ThrottlingReport:
         If you want to handle errors, catch them explicitly.
 
     .. versionadded:: 0.7.0
+
+    .. versionchanged:: 0.15.0
+        Reuses the state of throttles checked during this request.
+
     """
 
     controller: 'Controller[BaseSerializer]'
@@ -423,7 +635,8 @@ class ThrottlingReport:
         """
         Report throttling all headers for a sync controller and endpoint.
 
-        Note that it will make N consecutive requests to cache.
+        Note that it might make N consecutive requests to cache,
+        if throttles were not checked during this request.
         It might be rather long. Use the sync version with care.
         """
         endpoint = self._get_endpoint()
@@ -475,3 +688,38 @@ class ThrottlingReport:
             header_name: ', '.join(header_value)
             for header_name, header_value in headers.items()
         }
+
+
+#: State returned by throttle checks of the current request.
+_CheckedUsage: TypeAlias = dict[_BaseThrottle[Any], CachedRateLimit]
+
+
+def _save_usage(
+    controller: 'Controller[BaseSerializer]',
+    throttles: Sequence[SyncThrottle | AsyncThrottle],
+    cache_objects: Sequence[CachedRateLimit],
+) -> None:
+    # We store the state returned by `incr` on the request,
+    # so reporting headers does not need another backend round-trip:
+    request = controller.request
+    checked_usage: _CheckedUsage | None = getattr(
+        request,
+        '__dmr_throttling_usage__',
+        None,
+    )
+    if checked_usage is None:
+        checked_usage = {}
+        request.__dmr_throttling_usage__ = checked_usage  # type: ignore[attr-defined]
+    checked_usage.update(zip(throttles, cache_objects, strict=False))
+
+
+def _checked_usage(
+    controller: 'Controller[BaseSerializer]',
+    throttle: SyncThrottle | AsyncThrottle,
+) -> CachedRateLimit | None:
+    checked_usage: _CheckedUsage = getattr(
+        controller.request,
+        '__dmr_throttling_usage__',
+        {},
+    )
+    return checked_usage.get(throttle)
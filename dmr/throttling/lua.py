@@ -11,27 +11,32 @@ SIMPLE_RATE: Final = """
 -- ARGV[1]  : max_requests   (integer)
 -- ARGV[2]  : window_seconds (integer TTL for the fixed window)
 -- ARGV[3]  : view_only      (integer whether or not we only want to view data)
+-- ARGV[4]  : units          (optional integer number of requests to lease,
+--                            defaults to 1)
 --
--- Returns a three-element array:
+-- Returns a five-element array:
 --   [1]  allowed    : 1 = request allowed, 0 = denied
 --   [2]  current    : request count AFTER this call (or at time of denial)
---   [3]  ttl        : seconds remaining in the current window
+--   [3]  expire_at  : server timestamp when the current window ends
+--   [4]  granted    : number of leased requests, up to `units`
+--   [5]  ttl        : seconds left until the current window ends
 
 local key          = KEYS[1]
 local max_requests = tonumber(ARGV[1])
 local window       = tonumber(ARGV[2])
 local view_only    = tonumber(ARGV[3])
+local units        = tonumber(ARGV[4]) or 1
 
 -- Current counter:
 local current = 0
 
 if view_only == 0 then
     -- Atomically increment the counter.
-    -- If the key didn't exist, Redis creates it starting at 1.
-    current = redis.call("INCR", key)
+    -- If the key didn't exist, Redis creates it starting at `units`.
+    current = redis.call("INCRBY", key, units)
 
     -- On the very first request in a window, stamp the TTL.
-    if current == 1 then
+    if current == units then
         redis.call("EXPIRE", key, window)
     end
 else
@@ -47,15 +52,20 @@ local now        = tonumber(time_reply[1])   -- integer seconds
 local expire_at  = now + ttl
 
 if current > max_requests then
+    -- Only lease what is left before the cap:
+    local granted = math.max(0, max_requests - (current - units))
     if view_only == 0 then
         -- Undo the increment so the counter stays at the cap,
         -- making the "current" value honest for the caller.
-        redis.call("DECR", key)
+        redis.call("DECRBY", key, current - max_requests)
+    end
+    if granted == 0 then
+        return {0, max_requests, expire_at, 0, ttl}
     end
-    return {0, max_requests, expire_at}
+    return {1, max_requests, expire_at, granted, ttl}
 end
 
-return {1, current, expire_at}
+return {1, current, expire_at, units, ttl}
 """
 
 # Leaky bucket
@@ -120,3 +130,97 @@ end
 
 return {1, level, capacity}
 """
+
+# Generic cell rate
+# -----------------
+
+GCRA: Final = """
+-- gcra.lua
+-- Generic cell rate algorithm for Redis
+--
+-- KEYS[1]  : cache key  (e.g. "throttle:<user>:<endpoint>")
+-- ARGV[1]  : max_requests        (integer)
+-- ARGV[2]  : duration_in_seconds (integer)
+-- ARGV[3]  : view_only      (integer whether or not we only want to view data)
+--
+-- Stores a single integer per key: theoretical arrival time (TAT)
+-- of the next request in milliseconds.
+--
+-- Returns a three-element array:
+--   [1] allowed : 1 = request allowed, 0 = denied
+--   [2] unused  : always 0, kept for the common result shape
+--   [3] tat     : theoretical arrival time AFTER this call in milliseconds
+
+local key          = KEYS[1]
+local max_requests = tonumber(ARGV[1])
+local period       = tonumber(ARGV[2]) * 1000
+local view_only    = tonumber(ARGV[3])
+local interval     = math.max(1, math.floor(period / max_requests))
+
+-- Use Redis server clock, just like other scripts do:
+local time_reply = redis.call("TIME")        -- {seconds, microseconds}
+local now        = tonumber(time_reply[1]) * 1000
+                   + math.floor(tonumber(time_reply[2]) / 1000)
+
+local tat = math.max(tonumber(redis.call("GET", key)) or now, now)
+if view_only == 1 then
+    return {1, 0, tat}
+end
+
+local next_tat = tat + interval
+if next_tat - period > now then
+    -- Do NOT update stored state, the request is denied:
+    return {0, 0, tat}
+end
+
+-- Key expires together with the last request's emission:
+redis.call("SET", key, next_tat, "PX", next_tat - now)
+return {1, 0, next_tat}
+"""
+
+# Batches
+# -------
+
+_BATCH_TEMPLATE: Final = """
+-- batch.lua
+-- Runs the single key script below for several keys in one call
+--
+-- KEYS[i]  : cache key of the i-th throttle
+-- ARGV     : arguments of all throttles one after another,
+--            each throttle has the same number of arguments
+--
+-- Returns an array of results of the single key script,
+-- stops after the first denied key, the following ones are not checked.
+
+local function check(KEYS, ARGV)
+{script}
+end
+
+local results    = {{}}
+local args_count = #ARGV / #KEYS
+
+for index = 1, #KEYS do
+    local offset = (index - 1) * args_count
+    local result = check(
+        {{KEYS[index]}},
+        {{unpack(ARGV, offset + 1, offset + args_count)}}
+    )
+    results[index] = result
+    if result[1] == 0 then
+        break
+    end
+end
+
+return results
+"""
+
+
+def batch_script(script: str) -> str:
+    """
+    Wrap a single key script to check several keys in one call.
+
+    Redis Cluster requires all keys of one call to be in the same hash slot.
+
+    .. versionadded:: 0.15.0
+    """
+    return _BATCH_TEMPLATE.format(script=script)
@@ -12,6 +12,8 @@ from django.http import HttpResponseBase
 from typing_extensions import Sentinel
 
 from dmr.components import BodyComponent
+from dmr.compression import Compression
+from dmr.conditional import ConditionalGet
 from dmr.cookies import CookieSpec, NewCookie
 from dmr.exceptions import EndpointMetadataError, UnsolvableAnnotationsError
 from dmr.headers import HeaderSpec, NewHeader
@@ -275,6 +277,8 @@ class EndpointMetadataBuilder:  # noqa: WPS214
             throttling_before_auth=throttling_before_auth,
             throttling_after_auth=throttling_after_auth,
             throttling_allow_unsafe_cache=allow_cache,
+            conditional=self._build_conditional(method),
+            compression=self._build_compression(),
             no_validate_http_spec=self._build_no_validate_http_spec(),
             allowed_http_methods=allowed_http_methods,
             semantic_responses=self._build_semantic_responses(),
@@ -336,6 +340,8 @@ class EndpointMetadataBuilder:  # noqa: WPS214
             throttling_before_auth=throttling_before_auth,
             throttling_after_auth=throttling_after_auth,
             throttling_allow_unsafe_cache=allow_cache,
+            conditional=self._build_conditional(method),
+            compression=self._build_compression(),
             no_validate_http_spec=self._build_no_validate_http_spec(),
             allowed_http_methods=allowed_http_methods,
             semantic_responses=self._build_semantic_responses(),
@@ -391,6 +397,8 @@ class EndpointMetadataBuilder:  # noqa: WPS214
             throttling_before_auth=throttling_before_auth,
             throttling_after_auth=throttling_after_auth,
             throttling_allow_unsafe_cache=allow_cache,
+            conditional=self._build_conditional(method),
+            compression=self._build_compression(),
             no_validate_http_spec=self._build_no_validate_http_spec(),
             allowed_http_methods=allowed_http_methods,
             semantic_responses=self._build_semantic_responses(),
@@ -670,6 +678,36 @@ class EndpointMetadataBuilder:  # noqa: WPS214
             else:
                 raise EndpointMetadataError(msg)
 
+    def _build_conditional(self, method: str) -> ConditionalGet | None:
+        conditional = (
+            self.payload.conditional
+            if self.payload
+            and not isinstance(self.payload.conditional, Sentinel)
+            else self.controller_cls.conditional
+        )
+        if conditional is None or method not in conditional.supported_methods:
+            return None
+        if conditional.is_async and not inspect.iscoroutinefunction(
+            self.func,
+        ):
+            raise EndpointMetadataError(
+                'Cannot use async `conditional` validators '
+                f'with sync {self.endpoint_name!r}',
+            )
+        return conditional
+
+    def _build_compression(self) -> Compression | None:
+        if self.payload and not isinstance(
+            self.payload.compression,
+            Sentinel,
+        ):
+            return self.payload.compression
+        if not isinstance(self.controller_cls.compression, Sentinel):
+            return self.controller_cls.compression
+        return resolve_setting(  # type: ignore[no-any-return]
+            Settings.compression,
+        )
+
     def _build_validate_responses(self) -> bool:
         if self.payload and self.payload.validate_responses is not None:
             return self.payload.validate_responses
@@ -902,6 +940,11 @@ class EndpointMetadataValidator:
                 modification=self.metadata.modification,
             )
         ])
+        if self.metadata.conditional is not None:
+            all_responses = [
+                self.metadata.conditional.modify_response_spec(response)
+                for response in all_responses
+            ]
         existing_responses = {
             response.status_code: response for response in all_responses
         }
@@ -911,6 +954,11 @@ class EndpointMetadataValidator:
                 existing_responses,
             ),
         )
+        if self.metadata.compression is not None:
+            all_responses = [
+                self.metadata.compression.modify_response_spec(response)
+                for response in all_responses
+            ]
         return all_responses
 
     def _resolve_response_type(
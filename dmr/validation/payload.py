@@ -15,6 +15,8 @@ from dmr.settings import HttpSpec
 from dmr.types import EMPTY
 
 if TYPE_CHECKING:
+    from dmr.compression import Compression
+    from dmr.conditional import ConditionalGet
     from dmr.openapi.objects import (
         Callback,
         ExternalDocumentation,
@@ -54,6 +56,8 @@ class _BasePayload:
     auth: Sequence['SyncAuth'] | Sequence['AsyncAuth'] | None = ()
     throttling: Sequence['SyncThrottle'] | Sequence['AsyncThrottle'] | None = ()
     throttling_allow_unsafe_cache: bool | Sentinel | None = EMPTY
+    conditional: 'ConditionalGet | Sentinel | None' = EMPTY
+    compression: 'Compression | Sentinel | None' = EMPTY
 
 
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
@@ -25,6 +25,7 @@ from dmr.types import EMPTY
 if TYPE_CHECKING:
     from dmr.controller import Controller
     from dmr.endpoint import Endpoint
+    from dmr.fieldsets import Fieldset
     from dmr.parsers import Parser
     from dmr.renderers import Renderer
 
@@ -78,7 +79,7 @@ class ResponseValidator:  # noqa: WPS214
         self._validate_response_cookies(response, schema)
         return response
 
-    def validate_modification(
+    def validate_modification(  # noqa: WPS210
         self,
         endpoint: 'Endpoint',
         controller: 'Controller[BaseSerializer]',
@@ -102,16 +103,25 @@ class ResponseValidator:  # noqa: WPS214
             cookies=self.metadata.modification.actionable_cookies(),
             renderer=renderer,
         )
-        if not self._should_validate_responses():
+        fieldset = _sparse_fieldset(controller)
+        # Sparse responses are always validated to drop unrequested fields:
+        if fieldset is None and not self._should_validate_responses():
             return all_response_data
         schema = self._get_response_schema(all_response_data.status_code)
-        self._validate_body(
+        validated = self._validate_body(
             structured,
             schema,
             content_type=renderer.content_type,
             strict=True,
+            fieldset=fieldset,
         )
-        return all_response_data
+        if (
+            fieldset is None
+            or fieldset.project(schema.return_type) is schema.return_type
+        ):
+            return all_response_data
+        # Only requested fields are rendered:
+        return dataclasses.replace(all_response_data, raw_data=validated)
 
     def _should_validate_responses(self) -> bool:
         return self.metadata.validate_responses is True
@@ -139,6 +149,7 @@ class ResponseValidator:  # noqa: WPS214
         parser: 'Parser',
         renderer: 'Renderer | None',
     ) -> None:
+        fieldset = _sparse_fieldset(controller)
         if isinstance(response, HttpResponse):
             # When we have a regular response, we deserialize
             # its content the regular way.
@@ -146,7 +157,11 @@ class ResponseValidator:  # noqa: WPS214
                 response.content,
                 parser=parser,
                 request=controller.request,
-                model=schema.return_type,
+                model=(
+                    schema.return_type
+                    if fieldset is None
+                    else fieldset.project(schema.return_type)
+                ),
             )
         elif isinstance(response, FileResponse):
             # But, when we are dealing with `FileResponse`
@@ -176,6 +191,7 @@ class ResponseValidator:  # noqa: WPS214
                 parser.content_type,
             ),
             strict=None,
+            fieldset=fieldset,
         )
 
     def _validate_body(
@@ -185,7 +201,8 @@ class ResponseValidator:  # noqa: WPS214
         *,
         content_type: str,
         strict: bool | None,
-    ) -> None:
+        fieldset: 'Fieldset[Any] | None' = None,
+    ) -> Any:
         """
         Does structured validation based on the provided schema.
 
@@ -197,6 +214,11 @@ class ResponseValidator:  # noqa: WPS214
                 Basically, we do for ``@modify`` responses and fallback
                 to default ``None`` on ``@validate`` responses, because
                 it is re-parsed from the response (xml or json, etc) body.
+            fieldset: sparse fieldset requested by the client, if any.
+                Response model is projected to the requested fields.
+
+        Returns:
+            Validated data.
 
         Raises:
             ResponseSchemaError: When validation fails.
@@ -224,12 +246,14 @@ class ResponseValidator:  # noqa: WPS214
                 )
         else:
             model = schema.return_type
+        model = model if fieldset is None else fieldset.project(model)
 
         if schema.streaming:
-            return  # We can't validate stream returns below this point.
+            # We can't validate stream returns below this point.
+            return structured
 
         try:
-            self.serializer.from_python(structured, model, strict=strict)
+            return self.serializer.from_python(structured, model, strict=strict)
         except self.serializer.validation_error as exc:
             raise ValidationError(
                 self.serializer.serialize_validation_error(exc),
@@ -330,6 +354,14 @@ class ResponseValidator:  # noqa: WPS214
         )
 
 
+def _sparse_fieldset(
+    controller: 'Controller[BaseSerializer]',
+) -> 'Fieldset[Any] | None':
+    # Sparse fieldsets only return some of the response model's fields,
+    # see `dmr.fieldsets.FieldsComponent` for more details:
+    return getattr(controller.request, '__dmr_fieldset__', None)
+
+
 @final
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
 class ValidatedModification:
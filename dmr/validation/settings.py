@@ -2,6 +2,7 @@ import dataclasses
 from collections.abc import Sequence
 from typing import Any, ClassVar, cast
 
+from dmr.compression import Compression
 from dmr.exceptions import EndpointMetadataError
 from dmr.internal.enums import stringify
 from dmr.metadata import ResponseSpec
@@ -33,6 +34,7 @@ class _SettingsModel(SettingsDict, total=False):
     responses: Sequence[Any]
     openapi_config: Any
     global_error_handler: Any
+    compression: Any
 
 
 assert _SettingsModel.__optional_keys__ == set(Settings), (  # noqa: S101
@@ -165,3 +167,9 @@ class SettingsValidator:
             raise EndpointMetadataError(
                 'Settings.global_error_handler must be a string or callable',
             )
+
+        compression = settings.get('compression')
+        if compression is not None and not isinstance(compression, Compression):
+            raise EndpointMetadataError(
+                'Settings.compression must be a Compression instance or None',
+            )
@@ -13,7 +13,7 @@ from dmr import Controller, modify
 from dmr.plugins.pydantic import PydanticFastSerializer
 from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
 from dmr.throttling import AsyncThrottle, Rate, SyncThrottle
-from dmr.throttling.algorithms import LeakyBucket, SimpleRate
+from dmr.throttling.algorithms import GenericCellRate, LeakyBucket, SimpleRate
 from dmr.throttling.backends.redis import AsyncRedis, SyncRedis
 from dmr.throttling.headers import RateLimitIETFDraft, RetryAfter
 
@@ -258,3 +258,89 @@ async def test_redis_async_leaky_bucket(
         'RateLimit': IsOneOf('"RemoteAddr";r=0;t=30', '"RemoteAddr";r=0;t=29'),
         'Retry-After': IsOneOf('30', '29'),
     }
+
+
+def test_redis_sync_gcra(
+    dmr_rf: DMRRequestFactory,
+    redis_client: 'redis.Redis[Any]',
+) -> None:
+    """Ensure correct sync redis client works with GCRA."""
+
+    class _SyncController(Controller[PydanticFastSerializer]):
+        @modify(
+            throttling=[
+                SyncThrottle(
+                    _ATTEMPTS,
+                    _RATE,
+                    backend=SyncRedis(redis_client),
+                    algorithm=GenericCellRate(),
+                ),
+            ],
+        )
+        def get(self) -> str:
+            return 'inside'
+
+    # Burst of two requests is allowed:
+    for _ in range(_ATTEMPTS):
+        request = dmr_rf.get('/whatever/')
+        response = _SyncController.as_view()(request)
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+
+    keys = [
+        throttle_key
+        for throttle_key in redis_client.scan_iter()
+        if b'::' in throttle_key
+    ]
+    assert len(keys) == 1
+    # The state is a single integer:
+    assert int(redis_client.get(keys[0]) or 0) > 0
+
+    # Third is rejected till the next emission interval:
+    request = dmr_rf.get('/whatever/')
+    response = _SyncController.as_view()(request)
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'X-RateLimit-Limit': '2',
+        'X-RateLimit-Remaining': '0',
+        # Time can vary:
+        'X-RateLimit-Reset': IsOneOf('30', '29'),
+        'Retry-After': IsOneOf('30', '29'),
+    }
+
+
+@pytest.mark.asyncio
+async def test_redis_async_gcra(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    redis_async_client: 'aioredis.Redis[Any]',
+) -> None:
+    """Async controllers work with redis backend and GCRA."""
+
+    class _AsyncController(Controller[PydanticFastSerializer]):
+        throttling = [
+            AsyncThrottle(
+                _ATTEMPTS,
+                _RATE,
+                algorithm=GenericCellRate(),
+                backend=AsyncRedis(redis_async_client),
+            ),
+        ]
+
+        async def get(self) -> str:
+            return 'inside'
+
+    for _ in range(_ATTEMPTS):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['Retry-After'] == IsOneOf('30', '29')
@@ -0,0 +1,91 @@
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+import redis
+from django.http import HttpResponse
+from redis import asyncio as aioredis
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+from dmr.throttling import AsyncThrottle, Rate, SyncThrottle
+from dmr.throttling.algorithms import LeakyBucket
+from dmr.throttling.backends.redis import AsyncRedis, SyncRedis
+
+
+@pytest.mark.parametrize('algorithm', [None, LeakyBucket()])
+def test_redis_sync_group(
+    dmr_rf: DMRRequestFactory,
+    redis_client: 'redis.Redis[Any]',
+    *,
+    algorithm: LeakyBucket | None,
+) -> None:
+    """Ensures that grouped throttles are checked with one script."""
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(
+                2,
+                Rate.minute,
+                backend=SyncRedis(redis_client),
+                algorithm=algorithm,
+            ),
+            SyncThrottle(
+                1,
+                Rate.minute,
+                backend=SyncRedis(redis_client),
+                algorithm=algorithm,
+            ),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    metadata = _SyncController.api_endpoints['GET'].metadata
+    assert metadata.throttle_groups_before_auth is not None
+    assert len(metadata.throttle_groups_before_auth) == 1
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Limit'] == '1'
+
+
+@pytest.mark.asyncio
+async def test_redis_async_group(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    redis_async_client: 'aioredis.Redis[Any]',
+) -> None:
+    """Ensures that grouped async throttles are checked with one script."""
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        throttling = [
+            AsyncThrottle(
+                2,
+                Rate.minute,
+                backend=AsyncRedis(redis_async_client),
+            ),
+            AsyncThrottle(
+                1,
+                Rate.minute,
+                backend=AsyncRedis(redis_async_client),
+            ),
+        ]
+
+        async def get(self) -> str:
+            return 'inside'
+
+    for status_code in (HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == status_code, response.content
@@ -0,0 +1,81 @@
+import json
+from http import HTTPStatus
+from typing import Any, Final
+
+import pytest
+import redis
+from django.http import HttpResponse
+from redis import asyncio as aioredis
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+from dmr.throttling import AsyncThrottle, Rate, SyncThrottle, ThrottlingReport
+from dmr.throttling.backends.redis import AsyncRedis, SyncRedis
+
+_MAX_REQUESTS: Final = 5
+_LEASE_SIZE: Final = 3
+
+
+def test_redis_sync_leases(
+    dmr_rf: DMRRequestFactory,
+    redis_client: 'redis.Redis[Any]',
+) -> None:
+    """Ensures that leased requests are used locally up to the limit."""
+    backend = SyncRedis(redis_client, lease_size=_LEASE_SIZE)
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(_MAX_REQUESTS, Rate.minute, backend=backend),
+        ]
+
+        def get(self) -> dict[str, str]:
+            return ThrottlingReport(self).report()
+
+    for remaining in range(_MAX_REQUESTS - 1, -1, -1):
+        response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+        report = json.loads(response.content)
+        assert report['X-RateLimit-Remaining'] == str(remaining)
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Remaining'] == '0'
+
+
+@pytest.mark.asyncio
+async def test_redis_async_leases(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    redis_async_client: 'aioredis.Redis[Any]',
+) -> None:
+    """Ensures that async leased requests are used locally."""
+    backend = AsyncRedis(redis_async_client, lease_size=_LEASE_SIZE)
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        throttling = [
+            AsyncThrottle(_MAX_REQUESTS, Rate.minute, backend=backend),
+        ]
+
+        async def get(self) -> dict[str, str]:
+            return await ThrottlingReport(self).areport()
+
+    for remaining in range(_MAX_REQUESTS - 1, -1, -1):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+        report = json.loads(response.content)
+        assert report['X-RateLimit-Remaining'] == str(remaining)
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
@@ -12,7 +12,7 @@ from dmr.plugins.pydantic import PydanticSerializer
 from dmr.serializer import BaseSerializer
 from dmr.test import DMRRequestFactory
 from dmr.throttling import AsyncThrottle, Rate, SyncThrottle
-from dmr.throttling.algorithms import BaseThrottleAlgorithm
+from dmr.throttling.algorithms import BaseThrottleAlgorithm, LeakyBucket
 from dmr.throttling.backends import CachedRateLimit
 from dmr.throttling.backends.redis import AsyncRedis, SyncRedis
 
@@ -73,3 +73,29 @@ def test_async_redis_with_unsupported_algorithm(
                     algorithm=_NoLuaAlgo(),
                 ),
             ]
+
+
+def test_redis_leases_with_unsupported_algorithm(
+    redis_client: 'redis.Redis[Any]',
+) -> None:
+    """Ensures that leases require algorithms with fixed windows."""
+    with pytest.raises(EndpointMetadataError, match='fixed windows'):
+        SyncThrottle(
+            1,
+            Rate.minute,
+            backend=SyncRedis(redis_client, lease_size=2),
+            algorithm=LeakyBucket(),
+        )
+
+
+def test_async_redis_leases_unsupported(
+    redis_async_client: 'aioredis.Redis[Any]',
+) -> None:
+    """Ensures that async leases require algorithms with fixed windows."""
+    with pytest.raises(EndpointMetadataError, match='fixed windows'):
+        AsyncThrottle(
+            1,
+            Rate.minute,
+            backend=AsyncRedis(redis_async_client, lease_size=2),
+            algorithm=LeakyBucket(),
+        )
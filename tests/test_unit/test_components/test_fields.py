@@ -0,0 +1,296 @@
+import json
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any, ClassVar, TypeAlias
+
+import pydantic
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.urls import path
+
+from dmr import Controller, ResponseSpec, validate
+from dmr.exceptions import EndpointMetadataError
+from dmr.fieldsets import Fields, Fieldset, field_names
+from dmr.openapi import build_schema
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.routing import Router
+from dmr.test import DMRRequestFactory
+
+
+class _UserModel(pydantic.BaseModel):
+    limit: ClassVar[int] = 10
+
+    id: int
+    username: str
+    email: str
+
+
+_OtherModel: TypeAlias = dict[str, str]
+
+
+class _UserListController(Controller[PydanticSerializer]):
+    def get(self, parsed_fields: Fields[_UserModel]) -> list[_UserModel]:
+        return list(parsed_fields.values(User.objects.order_by('pk')))
+
+
+@pytest.fixture
+def users(db: None) -> list[User]:
+    """Create users to select fields from."""
+    return User.objects.bulk_create([
+        User(username='first', email='first@example.com'),
+        User(username='second', email='second@example.com'),
+    ])
+
+
+@pytest.mark.parametrize(
+    ('query', 'expected_fields'),
+    [
+        ({}, ['id', 'username', 'email']),
+        ({'fields': ''}, ['id', 'username', 'email']),
+        ({'fields': 'email,id,username'}, ['id', 'username', 'email']),
+        ({'fields': 'username'}, ['username']),
+        ({'fields': 'email, id'}, ['id', 'email']),
+        ({'fields': ['email', 'username']}, ['username', 'email']),
+    ],
+)
+@pytest.mark.usefixtures('users')
+def test_fields_selected(
+    dmr_rf: DMRRequestFactory,
+    *,
+    query: dict[str, str],
+    expected_fields: list[str],
+) -> None:
+    """Ensures that only requested fields are returned."""
+    response = _UserListController.as_view()(
+        dmr_rf.get('/whatever/', data=query),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    response_body = json.loads(response.content)
+    assert [list(user) for user in response_body] == [
+        expected_fields,
+        expected_fields,
+    ]
+
+
+def test_fields_unknown(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that unknown fields are rejected."""
+    response = _UserListController.as_view()(
+        dmr_rf.get('/whatever/', data={'fields': 'username,password,limit'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST, response.content
+    assert json.loads(response.content) == {
+        'detail': [
+            {
+                'msg': (
+                    "Unknown fields ['limit', 'password'] requested, "
+                    "allowed: ['id', 'username', 'email']"
+                ),
+                'type': 'value_error',
+            },
+        ],
+    }
+
+
+def test_fields_full_response_validated(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that responses with all fields are still validated."""
+
+    class _InvalidController(Controller[PydanticSerializer]):
+        def get(self, parsed_fields: Fields[_UserModel]) -> list[_UserModel]:
+            return [parsed_fields.pick({'id': 1, 'username': 'a', 'email': 1})]
+
+    response = _InvalidController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_fields_sparse_response_projected(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that unrequested fields are not rendered."""
+
+    class _FullController(Controller[PydanticSerializer]):
+        def get(self, parsed_fields: Fields[_UserModel]) -> list[_UserModel]:
+            return [{'id': 1, 'username': 'a', 'email': 'a@example.com'}]  # type: ignore[list-item]
+
+    response = _FullController.as_view()(
+        dmr_rf.get('/whatever/', data={'fields': 'email,id'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == [
+        {'id': 1, 'email': 'a@example.com'},
+    ]
+
+
+@pytest.mark.parametrize(
+    'user',
+    [
+        {'username': 1},
+        {'id': 1, 'email': 'a@example.com'},
+    ],
+)
+def test_fields_sparse_response_validated(
+    dmr_rf: DMRRequestFactory,
+    *,
+    user: dict[str, Any],
+) -> None:
+    """Ensures that sparse responses are validated."""
+
+    class _InvalidController(Controller[PydanticSerializer]):
+        def get(self, parsed_fields: Fields[_UserModel]) -> list[_UserModel]:
+            return [user]  # type: ignore[list-item]
+
+    response = _InvalidController.as_view()(
+        dmr_rf.get('/whatever/', data={'fields': 'username'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    ('user', 'status_code'),
+    [
+        ({'username': 'a'}, HTTPStatus.OK),
+        ({'username': 1}, HTTPStatus.UNPROCESSABLE_ENTITY),
+    ],
+)
+def test_fields_sparse_response_object_validated(
+    dmr_rf: DMRRequestFactory,
+    *,
+    user: dict[str, Any],
+    status_code: HTTPStatus,
+) -> None:
+    """Ensures that sparse response objects are validated."""
+
+    class _ResponseController(Controller[PydanticSerializer]):
+        @validate(
+            ResponseSpec(list[_UserModel], status_code=HTTPStatus.OK),
+        )
+        def get(self, parsed_fields: Fields[_UserModel]) -> HttpResponse:
+            return self.to_response([user])
+
+    response = _ResponseController.as_view()(
+        dmr_rf.get('/whatever/', data={'fields': 'username'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == status_code, response.content
+
+
+def test_fields_other_response_validated(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that sparse requests still validate other responses."""
+
+    class _ConflictController(Controller[PydanticSerializer]):
+        @validate(
+            ResponseSpec(list[_UserModel], status_code=HTTPStatus.OK),
+            ResponseSpec(dict[str, int], status_code=HTTPStatus.CONFLICT),
+        )
+        def get(self, parsed_fields: Fields[_UserModel]) -> HttpResponse:
+            return self.to_response(
+                {'detail': 'conflict'},
+                status_code=HTTPStatus.CONFLICT,
+            )
+
+    response = _ConflictController.as_view()(
+        dmr_rf.get('/whatever/', data={'fields': 'username'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.django_db
+def test_fieldset_helpers() -> None:
+    """Ensures that fieldset helpers select only requested fields."""
+    user = User.objects.create(username='first', email='first@example.com')
+    sparse = Fieldset[_UserModel](
+        ('id', 'username'),
+        model=_UserModel,
+        is_sparse=True,
+    )
+    full = Fieldset[_UserModel](
+        field_names(_UserModel),
+        model=_UserModel,
+        is_sparse=False,
+    )
+
+    assert 'id' in sparse
+    assert sparse.project(list[_UserModel]) != list[_UserModel]
+    assert sparse.project(list[_UserModel]) == sparse.project(list[_UserModel])
+    assert sparse.project(_OtherModel) is _OtherModel
+    assert full.project(list[_UserModel]) == list[_UserModel]
+    assert 'email' not in sparse
+    assert sparse.pick(user) == {'id': user.pk, 'username': 'first'}
+    assert sparse.only(User.objects.all()).get().get_deferred_fields()
+    assert full.only(User.objects.all()).query.deferred_loading == (
+        frozenset(),
+        True,
+    )
+
+
+@pytest.mark.parametrize(
+    'build_type',
+    [
+        lambda model: model,
+        lambda model: list[model],  # type: ignore[valid-type]
+        lambda model: model | None,
+        lambda model: dict[str, list[model] | int],  # type: ignore[valid-type]
+    ],
+)
+def test_fieldset_project(build_type: Callable[[Any], Any]) -> None:
+    """Ensures that the response model is projected in any type."""
+    sparse = Fieldset[_UserModel](
+        ('id', 'username'),
+        model=_UserModel,
+        is_sparse=True,
+    )
+
+    projected = sparse.project(build_type(_UserModel))
+
+    assert projected != build_type(_UserModel)
+    assert projected == build_type(sparse.project(_UserModel))
+
+
+def test_fields_requires_model() -> None:
+    """Ensures that models without fields are rejected in import time."""
+    with pytest.raises(EndpointMetadataError, match='model with fields'):
+
+        class _NoFieldsController(Controller[PydanticSerializer]):
+            def get(
+                self,
+                parsed_fields: Fields[pydantic.BaseModel],
+            ) -> list[_UserModel]:
+                raise NotImplementedError
+
+
+def test_fields_schema() -> None:
+    """Ensures that field subsets are present in the schema."""
+    schema = build_schema(
+        Router('api/', [path('users/', _UserListController.as_view())]),
+    ).convert()
+
+    query_params = schema['paths']['/api/users/']['get']['parameters']
+    assert query_params == [
+        {
+            'name': 'fields',
+            'in': 'query',
+            'description': 'Comma separated response fields to return',
+            'deprecated': False,
+            'style': 'form',
+            'explode': False,
+            'schema': {
+                'type': 'array',
+                'items': {
+                    'type': 'string',
+                    'enum': ['id', 'username', 'email'],
+                },
+                'uniqueItems': True,
+            },
+        },
+    ]
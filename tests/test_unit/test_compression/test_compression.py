@@ -0,0 +1,248 @@
+import gzip
+import json
+import zlib
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import pytest
+from django.http import HttpResponse
+
+from dmr import Controller, modify
+from dmr.compression import (
+    BrotliEncoder,
+    Compression,
+    DeflateEncoder,
+    GzipEncoder,
+    ZstdEncoder,
+)
+from dmr.conditional import ConditionalGet
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.streaming import StreamingResponse
+from dmr.streaming.sse import SSEController, SSEvent
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+from tests.infra.streaming import get_streaming_content
+
+_PAYLOAD = list(range(500))  # noqa: WPS432
+
+
+class _CompressedController(Controller[PydanticSerializer]):
+    compression = Compression(encoders=[GzipEncoder(), DeflateEncoder()])
+
+    def get(self) -> list[int]:
+        return _PAYLOAD
+
+    @modify(compression=None)
+    def post(self) -> list[int]:
+        return _PAYLOAD
+
+    @modify(compression=Compression(min_size=10_000))  # noqa: WPS432
+    def put(self) -> list[int]:
+        return _PAYLOAD
+
+
+@pytest.mark.parametrize(
+    ('accept_encoding', 'encoding'),
+    [
+        ('gzip', 'gzip'),
+        ('deflate, gzip', 'gzip'),
+        ('gzip;q=0.5, deflate', 'deflate'),
+        ('br, *;q=0.1', 'gzip'),
+        ('*', 'gzip'),
+    ],
+)
+def test_compression_negotiation(
+    dmr_rf: DMRRequestFactory,
+    *,
+    accept_encoding: str,
+    encoding: str,
+) -> None:
+    """Ensures that the best encoding is negotiated."""
+    response = _CompressedController.as_view()(
+        dmr_rf.get('/whatever/', headers={'Accept-Encoding': accept_encoding}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Content-Encoding': encoding,
+        'Vary': 'Accept-Encoding',
+    }
+    decompress = gzip.decompress if encoding == 'gzip' else zlib.decompress
+    assert json.loads(decompress(response.content)) == _PAYLOAD
+
+
+@pytest.mark.parametrize(
+    'headers',
+    [
+        {},
+        {'Accept-Encoding': 'identity'},
+        {'Accept-Encoding': 'gzip;q=0, deflate;q=0'},
+        {'Accept-Encoding': 'br, zstd'},
+        {'Accept-Encoding': 'gzip;q=invalid'},
+    ],
+)
+def test_compression_not_acceptable(
+    dmr_rf: DMRRequestFactory,
+    *,
+    headers: dict[str, str],
+) -> None:
+    """Ensures that responses are not compressed without acceptable codings."""
+    response = _CompressedController.as_view()(
+        dmr_rf.get('/whatever/', headers=headers),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers == {
+        'Content-Type': 'application/json',
+        'Vary': 'Accept-Encoding',
+    }
+    assert json.loads(response.content) == _PAYLOAD
+
+
+@pytest.mark.parametrize('method', ['post', 'put'])
+def test_compression_disabled(
+    dmr_rf: DMRRequestFactory,
+    *,
+    method: str,
+) -> None:
+    """Ensures that disabled and small responses are not compressed."""
+    response = _CompressedController.as_view()(
+        getattr(dmr_rf, method)('/whatever/', headers={'Accept-Encoding': '*'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code < HTTPStatus.MULTIPLE_CHOICES
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.content) == _PAYLOAD
+
+
+def test_compression_response_specs() -> None:
+    """Ensures that compression headers are present in the metadata."""
+    metadata = _CompressedController.api_endpoints['GET'].metadata
+
+    assert metadata.compression is _CompressedController.compression
+    for response in metadata.responses.values():
+        assert {'Content-Encoding', 'Vary'}.issubset(response.headers or {})
+
+    metadata = _CompressedController.api_endpoints['POST'].metadata
+    assert metadata.compression is None
+    for response in metadata.responses.values():
+        assert 'Content-Encoding' not in (response.headers or {})
+
+
+def test_compression_renderer_levels(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that compression levels are used per renderer."""
+
+    class _LevelsController(Controller[PydanticSerializer]):
+        compression = Compression(
+            renderer_levels={'application/json': None},
+        )
+
+        def get(self) -> list[int]:
+            return _PAYLOAD
+
+    response = _LevelsController.as_view()(
+        dmr_rf.get('/whatever/', headers={'Accept-Encoding': 'gzip'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.content) == _PAYLOAD
+
+
+def test_compression_with_conditional(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that compressed responses have weak body hashes."""
+
+    class _ConditionalController(Controller[PydanticSerializer]):
+        conditional = ConditionalGet()
+        compression = Compression()
+
+        def get(self) -> list[int]:
+            return _PAYLOAD
+
+    response = _ConditionalController.as_view()(
+        dmr_rf.get('/whatever/', headers={'Accept-Encoding': 'gzip'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers['Content-Encoding'] == 'gzip'
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+
+    response = _ConditionalController.as_view()(
+        dmr_rf.get(
+            '/whatever/',
+            headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag},
+        ),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, response.content
+    assert 'Content-Encoding' not in response.headers
+
+
+@pytest.mark.parametrize(
+    'encoder_type',
+    [GzipEncoder, DeflateEncoder, BrotliEncoder, ZstdEncoder],
+)
+def test_stream_compressor_flushes_events(
+    encoder_type: type[GzipEncoder],
+) -> None:
+    """Ensures that every event can be decoded as soon as it is received."""
+    try:
+        encoder = encoder_type()
+    except ImportError:
+        pytest.skip(f'{encoder_type.encoding} is not installed')
+    compressor = encoder.stream_compressor(level=encoder.level)
+    decompressor = _decompressor(encoder.encoding)
+
+    for event in (b'data: 1\n\n', b'data: 2\n\n'):
+        chunk = compressor.compress_event(event)
+        assert decompressor(chunk) == event
+    assert not decompressor(compressor.finish())
+
+
+class _CompressedSSE(SSEController[PydanticSerializer]):
+    compression = Compression(encoders=[GzipEncoder()])
+
+    async def get(self) -> AsyncIterator[SSEvent[int]]:
+        return self._events()
+
+    async def _events(self) -> AsyncIterator[SSEvent[int]]:
+        yield SSEvent(1)
+        yield SSEvent(2)
+
+
+@pytest.mark.asyncio
+async def test_compression_streaming(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that streaming responses are compressed per connection."""
+    request = dmr_async_rf.get('/whatever/', headers={'Accept-Encoding': '*'})
+
+    response = await dmr_async_rf.wrap(_CompressedSSE.as_view()(request))
+
+    assert isinstance(response, StreamingResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(await get_streaming_content(response)) == (
+        b'data: 1\r\n\r\ndata: 2\r\n\r\n'
+    )
+
+
+def _decompressor(encoding: str):  # type: ignore[no-untyped-def]
+    if encoding == 'br':
+        import brotli  # noqa: PLC0415
+
+        return brotli.Decompressor().process
+    if encoding == 'zstd':
+        import zstandard  # noqa: PLC0415
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress
+    wbits = zlib.MAX_WBITS | 16 if encoding == 'gzip' else zlib.MAX_WBITS  # noqa: WPS432
+    return zlib.decompressobj(wbits).decompress
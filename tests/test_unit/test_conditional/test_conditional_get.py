@@ -0,0 +1,261 @@
+import json
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import ClassVar
+
+import pytest
+from django.http import HttpResponse
+from django.utils.http import http_date
+
+from dmr import Controller, ResponseSpec, modify, validate
+from dmr.conditional import ConditionalGet
+from dmr.exceptions import EndpointMetadataError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.serializer import BaseSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_UPDATED_AT = datetime(2026, 3, 23, 12, 30, tzinfo=UTC)  # noqa: WPS432
+
+
+class _BodyHashController(Controller[PydanticSerializer]):
+    conditional = ConditionalGet()
+
+    def get(self) -> list[int]:
+        return [1, 2]
+
+    def post(self) -> list[int]:
+        return [1, 2]
+
+
+def test_conditional_body_hash(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that body hash is used as ETag when no function is passed."""
+    response = _BodyHashController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == [1, 2]
+    etag = response.headers['ETag']
+    assert etag == ConditionalGet().compute_etag(response.content)
+
+    response = _BodyHashController.as_view()(
+        dmr_rf.get('/whatever/', headers={'If-None-Match': etag}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, response.content
+    assert response.headers == {
+        'ETag': etag,
+        'Content-Type': 'application/json',
+    }
+    assert response.content == b''
+
+    response = _BodyHashController.as_view()(
+        dmr_rf.get('/whatever/', headers={'If-None-Match': '"other"'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers['ETag'] == etag
+
+
+def test_conditional_unsafe_methods(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that conditional requests are only used for safe methods."""
+    metadata = _BodyHashController.api_endpoints['POST'].metadata
+    assert metadata.conditional is None
+    assert HTTPStatus.NOT_MODIFIED not in metadata.responses
+
+    response = _BodyHashController.as_view()(
+        dmr_rf.post('/whatever/', headers={'If-None-Match': '*'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert response.headers == {'Content-Type': 'application/json'}
+
+
+def test_conditional_disabled_by_endpoint(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that endpoints can disable conditional requests."""
+
+    class _DisabledController(Controller[PydanticSerializer]):
+        conditional = ConditionalGet()
+
+        @modify(conditional=None)
+        def get(self) -> list[int]:
+            return [1, 2]
+
+    metadata = _DisabledController.api_endpoints['GET'].metadata
+    assert metadata.conditional is None
+    assert HTTPStatus.NOT_MODIFIED not in metadata.responses
+
+    response = _DisabledController.as_view()(
+        dmr_rf.get('/whatever/', headers={'If-None-Match': '*'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert 'ETag' not in response.headers
+
+
+def test_conditional_response_specs() -> None:
+    """Ensures that conditional responses are present in the metadata."""
+    metadata = _BodyHashController.api_endpoints['GET'].metadata
+
+    assert metadata.conditional is _BodyHashController.conditional
+    assert metadata.responses[HTTPStatus.NOT_MODIFIED].return_type is None
+    assert set(metadata.responses[HTTPStatus.NOT_MODIFIED].headers or {}) == {
+        'ETag',
+    }
+    assert set(metadata.responses[HTTPStatus.OK].headers or {}) == {'ETag'}
+
+
+class _CheapValidatorsController(Controller[PydanticSerializer]):
+    calls: ClassVar[list[str]] = []
+
+    @modify(
+        conditional=ConditionalGet(
+            etag=lambda controller: 'v1',
+            last_modified=lambda controller: _UPDATED_AT,
+        ),
+    )
+    def get(self) -> str:
+        self.calls.append('get')
+        return 'inside'
+
+
+@pytest.mark.parametrize(
+    'headers',
+    [
+        {'If-None-Match': '"v1"'},
+        {'If-None-Match': 'W/"v1", "v2"'},
+        {'If-None-Match': '*'},
+        {'If-Modified-Since': http_date(_UPDATED_AT.timestamp())},
+    ],
+)
+def test_conditional_cheap_validators(
+    dmr_rf: DMRRequestFactory,
+    *,
+    headers: dict[str, str],
+) -> None:
+    """Ensures that cheap validators skip the endpoint call."""
+    _CheapValidatorsController.calls.clear()
+
+    response = _CheapValidatorsController.as_view()(
+        dmr_rf.get('/whatever/', headers=headers),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, response.content
+    assert response.headers == {
+        'ETag': '"v1"',
+        'Last-Modified': http_date(_UPDATED_AT.timestamp()),
+        'Content-Type': 'application/json',
+    }
+    assert response.content == b''
+    assert not _CheapValidatorsController.calls
+
+
+@pytest.mark.parametrize(
+    'headers',
+    [
+        {},
+        {'If-None-Match': '"v2"'},
+        {
+            'If-None-Match': '"v2"',
+            'If-Modified-Since': http_date(_UPDATED_AT.timestamp()),
+        },
+        {'If-Modified-Since': http_date(_UPDATED_AT.timestamp() - 1)},
+        {'If-Modified-Since': 'invalid'},
+    ],
+)
+def test_conditional_cheap_validators_modified(
+    dmr_rf: DMRRequestFactory,
+    *,
+    headers: dict[str, str],
+) -> None:
+    """Ensures that modified resources are returned with validators."""
+    _CheapValidatorsController.calls.clear()
+
+    response = _CheapValidatorsController.as_view()(
+        dmr_rf.get('/whatever/', headers=headers),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers == {
+        'ETag': '"v1"',
+        'Last-Modified': http_date(_UPDATED_AT.timestamp()),
+        'Content-Type': 'application/json',
+    }
+    assert json.loads(response.content) == 'inside'
+    assert _CheapValidatorsController.calls == ['get']
+
+
+class _ValidateController(Controller[PydanticSerializer]):
+    @validate(
+        ResponseSpec(str, status_code=HTTPStatus.OK),
+        conditional=ConditionalGet(weak=True),
+    )
+    def get(self) -> HttpResponse:
+        return self.to_response('inside')
+
+
+def test_conditional_validate_weak(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that `@validate` endpoints support weak body hashes."""
+    response = _ValidateController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+
+    response = _ValidateController.as_view()(
+        dmr_rf.get('/whatever/', headers={'If-None-Match': etag[2:]}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, response.content
+
+
+async def _async_etag(controller: Controller[BaseSerializer]) -> str:
+    return 'async'
+
+
+@pytest.mark.asyncio
+async def test_conditional_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that async validators work for async endpoints."""
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        conditional = ConditionalGet(etag=_async_etag, hash_body=False)
+
+        async def get(self) -> str:
+            return 'inside'
+
+    request = dmr_async_rf.get('/whatever/')
+    response = await dmr_async_rf.wrap(_AsyncController.as_view()(request))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.headers['ETag'] == '"async"'
+
+    request = dmr_async_rf.get(
+        '/whatever/',
+        headers={'If-None-Match': '"async"'},
+    )
+    response = await dmr_async_rf.wrap(_AsyncController.as_view()(request))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, response.content
+    assert response.content == b''
+
+
+def test_conditional_async_validators_in_sync() -> None:
+    """Ensures that async validators can't be used for sync endpoints."""
+    with pytest.raises(EndpointMetadataError, match='async `conditional`'):
+
+        class _SyncController(Controller[PydanticSerializer]):
+            conditional = ConditionalGet(etag=_async_etag)
+
+            def get(self) -> str:
+                raise NotImplementedError
@@ -0,0 +1,42 @@
+from typing import Final
+
+import pytest
+from django.conf import LazySettings
+from django.test import RequestFactory
+
+from dmr.internal.csrf import _get_csrf_failure_reason
+
+_ORIGIN: Final = 'https://trusted.example.com'
+
+
+@pytest.mark.parametrize('method', ['get', 'head', 'options', 'trace'])
+def test_csrf_safe_methods(rf: RequestFactory, method: str) -> None:
+    """Ensures that safe methods are not checked."""
+    request = getattr(rf, method)('/whatever/')
+
+    assert _get_csrf_failure_reason(request) is None
+
+
+def test_csrf_trusted_origins_changed(
+    rf: RequestFactory,
+    settings: LazySettings,
+) -> None:
+    """Ensures that the shared checker uses current trusted origins."""
+    settings.CSRF_TRUSTED_ORIGINS = []
+
+    reason = _get_csrf_failure_reason(
+        rf.post('/whatever/', HTTP_ORIGIN=_ORIGIN),
+    )
+
+    assert reason == (
+        f'Origin checking failed - {_ORIGIN} '
+        'does not match any trusted origins.'
+    )
+
+    settings.CSRF_TRUSTED_ORIGINS = [_ORIGIN]
+
+    reason = _get_csrf_failure_reason(
+        rf.post('/whatever/', HTTP_ORIGIN=_ORIGIN),
+    )
+
+    assert reason == 'CSRF cookie not set.'
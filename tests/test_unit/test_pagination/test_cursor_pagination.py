@@ -0,0 +1,264 @@
+import json
+from http import HTTPStatus
+from typing import Any
+
+import pydantic
+import pytest
+from django.contrib.auth.models import Permission, User
+from django.http import HttpResponse
+from django.urls import path
+
+from dmr import Controller, Query
+from dmr.exceptions import RequestSerializationError
+from dmr.openapi import build_schema
+from dmr.pagination import CursorPage, CursorPaginator, CursorQuery
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.routing import Router
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_USERNAMES = ('a', 'b', 'c', 'd', 'e')
+
+
+class _UserModel(pydantic.BaseModel):
+    username: str
+
+
+@pytest.fixture
+def users(db: None) -> list[User]:
+    """Create users for pagination."""
+    return User.objects.bulk_create(
+        User(username=username) for username in _USERNAMES
+    )
+
+
+def _usernames(page: CursorPage[Any]) -> list[str]:
+    return [user.username for user in page.object_list]
+
+
+@pytest.mark.parametrize(
+    ('ordering', 'expected'),
+    [
+        (('username', 'pk'), ['a', 'b', 'c', 'd', 'e']),
+        (('-username', '-pk'), ['e', 'd', 'c', 'b', 'a']),
+    ],
+)
+@pytest.mark.usefixtures('users')
+def test_cursor_pagination_forward_and_back(
+    *,
+    ordering: tuple[str, ...],
+    expected: list[str],
+) -> None:
+    """Ensures that cursors can move in both directions."""
+    paginator = CursorPaginator(
+        User.objects.all(),
+        per_page=2,
+        ordering=ordering,
+    )
+
+    first = paginator.page(None)
+    assert _usernames(first) == expected[:2]
+    assert first.previous_cursor is None
+    assert first.next_cursor
+
+    second = paginator.page(first.next_cursor)
+    assert _usernames(second) == expected[2:4]
+    assert second.previous_cursor
+    assert second.next_cursor
+
+    last = paginator.page(second.next_cursor)
+    assert _usernames(last) == expected[4:]
+    assert last.next_cursor is None
+    assert last.previous_cursor
+
+    previous = paginator.page(last.previous_cursor)
+    assert _usernames(previous) == expected[2:4]
+    assert previous.next_cursor
+
+    previous = paginator.page(previous.previous_cursor)
+    assert _usernames(previous) == expected[:2]
+    assert previous.previous_cursor is None
+    assert previous.next_cursor
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_values() -> None:
+    """Ensures that `.values()` querysets are supported."""
+    User.objects.bulk_create(User(username=username) for username in 'abc')
+    paginator = CursorPaginator(
+        User.objects.values('username'),
+        per_page=2,
+        ordering=('username',),
+    )
+
+    first = paginator.page(None)
+    assert first.object_list == [{'username': 'a'}, {'username': 'b'}]
+    assert paginator.page(first.next_cursor).object_list == [
+        {'username': 'c'},
+    ]
+
+
+def test_cursor_pagination_invalid_cursor() -> None:
+    """Ensures that invalid cursors are rejected."""
+    paginator = CursorPaginator(
+        User.objects.all(),
+        per_page=1,
+        ordering=('username', 'pk'),
+    )
+
+    with pytest.raises(RequestSerializationError, match='Invalid cursor'):
+        paginator.page('invalid')
+
+
+def test_cursor_pagination_foreign_cursor() -> None:
+    """Ensures that cursors of other orderings are rejected."""
+    cursor = CursorPaginator(
+        User.objects.all(),
+        per_page=1,
+        ordering=('username',),
+    ).encode_cursor(User(username='a'))
+    paginator = CursorPaginator(
+        User.objects.all(),
+        per_page=1,
+        ordering=('username', 'pk'),
+    )
+
+    with pytest.raises(RequestSerializationError, match='Invalid cursor'):
+        paginator.page(cursor)
+
+
+def test_cursor_pagination_requires_ordering() -> None:
+    """Ensures that unordered querysets can't be paginated."""
+    with pytest.raises(ValueError, match='ordering'):
+        CursorPaginator(User.objects.all(), per_page=1)
+
+
+@pytest.mark.parametrize('field', ['content_type', '-content_type'])
+def test_cursor_pagination_relation_ordering(field: str) -> None:
+    """Ensures that relations can't be used for ordering."""
+    with pytest.raises(ValueError, match='relation'):
+        CursorPaginator(
+            Permission.objects.all(),
+            per_page=1,
+            ordering=(field, 'codename'),
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('field', ['content_type_id', '-content_type__pk'])
+def test_cursor_pagination_relation_keys(field: str) -> None:
+    """Ensures that related primary keys can be used for ordering."""
+    paginator = CursorPaginator(
+        Permission.objects.all(),
+        per_page=5,
+        ordering=(field, 'codename'),
+    )
+    seen: list[int] = []
+    page = paginator.page(None)
+    seen.extend(permission.pk for permission in page.object_list)
+    while page.next_cursor is not None:
+        page = paginator.page(page.next_cursor)
+        seen.extend(permission.pk for permission in page.object_list)
+
+    assert seen == list(
+        Permission.objects.order_by(field, 'codename').values_list(
+            'pk',
+            flat=True,
+        ),
+    )
+
+
+class _UsersController(Controller[PydanticSerializer]):
+    def get(self, parsed_query: Query[CursorQuery]) -> CursorPage[_UserModel]:
+        page = CursorPaginator(
+            User.objects.all(),
+            per_page=2,
+            ordering=('username', 'pk'),
+        ).page(parsed_query.get('cursor'))
+        return CursorPage(
+            per_page=page.per_page,
+            next_cursor=page.next_cursor,
+            previous_cursor=page.previous_cursor,
+            object_list=[
+                _UserModel(username=user.username) for user in page.object_list
+            ],
+        )
+
+
+@pytest.mark.usefixtures('users')
+def test_cursor_pagination_controller(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that cursors can be passed as query parameters."""
+    response = _UsersController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    response_body = json.loads(response.content)
+    assert response_body['object_list'] == [
+        {'username': 'a'},
+        {'username': 'b'},
+    ]
+
+    response = _UsersController.as_view()(
+        dmr_rf.get(
+            '/whatever/',
+            data={'cursor': response_body['next_cursor']},
+        ),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content)['object_list'] == [
+        {'username': 'c'},
+        {'username': 'd'},
+    ]
+
+    response = _UsersController.as_view()(
+        dmr_rf.get('/whatever/', data={'cursor': 'invalid'}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.BAD_REQUEST, response.content
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_cursor_pagination_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that async pagination works."""
+    await User.objects.abulk_create(
+        User(username=username) for username in _USERNAMES
+    )
+    paginator = CursorPaginator(
+        User.objects.all(),
+        per_page=3,
+        ordering=('-username', '-pk'),
+    )
+
+    first = await paginator.apage(None)
+    assert _usernames(first) == ['e', 'd', 'c']
+
+    second = await paginator.apage(first.next_cursor)
+    assert _usernames(second) == ['b', 'a']
+    assert second.next_cursor is None
+
+
+def test_cursor_pagination_schema() -> None:
+    """Ensures that cursor pages and queries are present in the schema."""
+    schema = build_schema(
+        Router('api/', [path('users/', _UsersController.as_view())]),
+    ).convert()
+
+    operation = schema['paths']['/api/users/']['get']
+    assert operation['parameters'][0]['name'] == 'cursor'
+    assert not operation['parameters'][0].get('required')
+    page_schema = next(
+        component
+        for name, component in schema['components']['schemas'].items()
+        if name.startswith('CursorPage')
+    )
+    assert set(page_schema['properties']) == {
+        'per_page',
+        'next_cursor',
+        'previous_cursor',
+        'object_list',
+    }
@@ -1,8 +1,23 @@
+from base64 import b64encode
+from http import HTTPStatus
+from typing import Any, Final, Self, final
+
 import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
 from inline_snapshot import snapshot
+from typing_extensions import override
 
+from dmr import Controller
+from dmr.endpoint import Endpoint
 from dmr.openapi.objects import SecurityScheme
+from dmr.plugins.pydantic import PydanticSerializer
 from dmr.security.http import HttpBasicAsyncAuth, HttpBasicSyncAuth
+from dmr.serializer import BaseSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_TTL: Final = 30
 
 
 @pytest.mark.parametrize('typ', [HttpBasicSyncAuth, HttpBasicAsyncAuth])
@@ -43,3 +58,210 @@ def test_custom_header_schema(
         ),
     })
     assert instance.security_requirement == snapshot({'http_basic': []})
+
+
+@final
+class _CountingSyncAuth(HttpBasicSyncAuth):
+    __slots__ = ('calls',)
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    @override
+    def authenticate(
+        self,
+        endpoint: Endpoint,
+        controller: Controller[BaseSerializer],
+        username: str,
+        password: str,
+    ) -> Self | None:
+        self.calls += 1
+        return self if password == 'pass' else None  # noqa: S105
+
+
+@final
+class _CountingAsyncAuth(HttpBasicAsyncAuth):
+    __slots__ = ('calls',)
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    @override
+    async def authenticate(
+        self,
+        endpoint: Endpoint,
+        controller: Controller[BaseSerializer],
+        username: str,
+        password: str,
+    ) -> Self | None:
+        self.calls += 1
+        return self if password == 'pass' else None  # noqa: S105
+
+
+def _headers(username: str, password: str) -> dict[str, str]:
+    encoded = b64encode(f'{username}:{password}'.encode()).decode()
+    return {'Authorization': f'Basic {encoded}'}
+
+
+def test_credentials_cache(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that verified credentials are cached."""
+    sync_auth = _CountingSyncAuth(credentials_cache_ttl=_TTL)
+
+    @final
+    class _CachedController(Controller[PydanticSerializer]):
+        auth = (sync_auth,)
+
+        def get(self) -> str:
+            return 'authed'
+
+    def request(username: str, password: str) -> int:
+        response = _CachedController.as_view()(
+            dmr_rf.get('/whatever/', headers=_headers(username, password)),
+        )
+        assert isinstance(response, HttpResponse)
+        return response.status_code
+
+    assert request('admin', 'pass') == HTTPStatus.OK
+    assert request('admin', 'pass') == HTTPStatus.OK
+    assert sync_auth.calls == 1
+
+    # Wrong passwords are never cached:
+    assert request('admin', 'wrong') == HTTPStatus.UNAUTHORIZED
+    assert request('admin', 'wrong') == HTTPStatus.UNAUTHORIZED
+    assert sync_auth.calls == 3
+
+    freezer.tick(_TTL)
+
+    assert request('admin', 'pass') == HTTPStatus.OK
+    assert sync_auth.calls == 4
+
+    sync_auth.invalidate_credentials('other')
+    assert request('admin', 'pass') == HTTPStatus.OK
+    assert sync_auth.calls == 4
+
+    sync_auth.invalidate_credentials('admin')
+    assert request('admin', 'pass') == HTTPStatus.OK
+    assert sync_auth.calls == 5
+
+    sync_auth.invalidate_credentials()
+    assert request('admin', 'pass') == HTTPStatus.OK
+    assert sync_auth.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_credentials_cache_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that verified credentials are cached by async auth."""
+    async_auth = _CountingAsyncAuth(credentials_cache_ttl=_TTL)
+
+    @final
+    class _AsyncCachedController(Controller[PydanticSerializer]):
+        auth = (async_auth,)
+
+        async def get(self) -> str:
+            return 'authed'
+
+    for _ in range(2):
+        response = await dmr_async_rf.wrap(
+            _AsyncCachedController.as_view()(
+                dmr_async_rf.get('/whatever/', headers=_headers('a', 'pass')),
+            ),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+
+    assert async_auth.calls == 1
+
+
+@final
+class _UserSyncAuth(HttpBasicSyncAuth):
+    __slots__ = ()
+
+    @override
+    def authenticate(
+        self,
+        endpoint: Endpoint,
+        controller: Controller[BaseSerializer],
+        username: str,
+        password: str,
+    ) -> Self | None:
+        controller.request.user = User(username=username)
+        return self
+
+
+def test_credentials_cache_request_user(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that cached credentials set ``request.user`` again."""
+    users: list[object] = []
+
+    @final
+    class _UserController(Controller[PydanticSerializer]):
+        auth = (_UserSyncAuth(credentials_cache_ttl=_TTL),)
+
+        def get(self) -> str:
+            users.append(self.request.user)
+            return self.request.user.get_username()
+
+    for _ in range(2):
+        response = _UserController.as_view()(
+            dmr_rf.get('/whatever/', headers=_headers('admin', 'pass')),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == b'"admin"'
+
+    # Every cached auth gets its own user instance:
+    assert users[0] is not users[1]
+
+
+@final
+class _UserAsyncAuth(HttpBasicAsyncAuth):
+    __slots__ = ()
+
+    @override
+    async def authenticate(
+        self,
+        endpoint: Endpoint,
+        controller: Controller[BaseSerializer],
+        username: str,
+        password: str,
+    ) -> Self | None:
+        controller.request.user = User(username=username)
+        return self
+
+
+@pytest.mark.asyncio
+async def test_credentials_cache_request_user_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that async cached credentials set ``request.user`` again."""
+
+    @final
+    class _AsyncUserController(Controller[PydanticSerializer]):
+        auth = (_UserAsyncAuth(credentials_cache_ttl=_TTL),)
+
+        async def get(self) -> str:
+            return self.request.user.get_username()
+
+    requests = [
+        dmr_async_rf.get('/whatever/', headers=_headers('a', 'pass'))
+        for _ in range(2)
+    ]
+    for request in requests:
+        response = await dmr_async_rf.wrap(
+            _AsyncUserController.as_view()(request),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == b'"a"'
+
+    # The cached auth sets `auser` too:
+    assert await requests[1].auser() is requests[1].user
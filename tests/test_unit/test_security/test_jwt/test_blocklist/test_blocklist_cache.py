@@ -0,0 +1,206 @@
+import datetime as dt
+import secrets
+from http import HTTPStatus
+from typing import Any, ClassVar, Final
+
+import pytest
+from django.conf import LazySettings
+from django.contrib.auth.models import User
+from django.db import DatabaseError, connection
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
+from pytest_django import DjangoAssertNumQueries
+
+from dmr import Controller, modify
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.security.jwt.auth import JWTAsyncAuth, JWTSyncAuth
+from dmr.security.jwt.blocklist.auth import (
+    JWTokenBlocklistAsyncMixin,
+    JWTokenBlocklistSyncMixin,
+)
+from dmr.security.jwt.blocklist.cache import BlocklistCache
+from dmr.security.jwt.blocklist.models import BlocklistedJWToken
+from dmr.security.jwt.token import JWToken
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_EXP: Final = dt.timedelta(minutes=5)
+
+
+def _build_token(admin_user: User, settings: LazySettings) -> str:
+    return JWToken(
+        sub=str(admin_user.pk),
+        exp=dt.datetime.now(dt.UTC) + _EXP,
+        jti=secrets.token_hex(),
+    ).encode(secret=settings.SECRET_KEY, algorithm='HS256')
+
+
+@pytest.mark.django_db
+def test_blocklist_cache_refresh(
+    admin_user: User,
+    freezer: FrozenDateTimeFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that the set is refreshed incrementally by interval."""
+    blocklist_cache = BlocklistCache(refresh_interval=10)
+    expires_at = dt.datetime.now(dt.UTC) + _EXP
+    BlocklistedJWToken.objects.create(
+        jti='first',
+        user=admin_user,
+        expires_at=expires_at,
+    )
+
+    with django_assert_num_queries(1):
+        assert blocklist_cache.may_contain(BlocklistedJWToken, 'first')
+        assert not blocklist_cache.may_contain(BlocklistedJWToken, 'second')
+
+    BlocklistedJWToken.objects.create(
+        jti='second',
+        user=admin_user,
+        expires_at=expires_at,
+    )
+
+    assert not blocklist_cache.may_contain(BlocklistedJWToken, 'second')
+
+    freezer.tick(dt.timedelta(seconds=10))
+
+    assert blocklist_cache.may_contain(BlocklistedJWToken, 'second')
+    assert blocklist_cache.may_contain(BlocklistedJWToken, 'first')
+
+    freezer.tick(_EXP)
+
+    assert not blocklist_cache.may_contain(BlocklistedJWToken, 'first')
+    assert not blocklist_cache.may_contain(BlocklistedJWToken, None)
+
+
+def _broken_database(*args: Any) -> Any:
+    raise DatabaseError('Database is down')
+
+
+@pytest.mark.django_db
+def test_blocklist_cache_not_loaded(
+    admin_user: User,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that the set is not trusted until it is loaded."""
+    blocklist_cache = BlocklistCache(refresh_interval=10)
+
+    with connection.execute_wrapper(_broken_database):
+        assert blocklist_cache.may_contain(BlocklistedJWToken, 'unknown')
+
+    assert not blocklist_cache.may_contain(BlocklistedJWToken, 'unknown')
+
+    freezer.tick(dt.timedelta(seconds=10))
+    BlocklistedJWToken.objects.create(
+        jti='first',
+        user=admin_user,
+        expires_at=dt.datetime.now(dt.UTC) + _EXP,
+    )
+
+    # Overdue set is not trusted, when its refresh fails:
+    with connection.execute_wrapper(_broken_database):
+        assert blocklist_cache.may_contain(BlocklistedJWToken, 'unknown')
+
+    assert blocklist_cache.may_contain(BlocklistedJWToken, 'first')
+    assert not blocklist_cache.may_contain(BlocklistedJWToken, 'unknown')
+
+
+@pytest.mark.django_db
+def test_blocklist_cache_refresh_running(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that tokens are not trusted while the first load runs."""
+    blocklist_cache = BlocklistCache(refresh_interval=10)
+    running_refresh = blocklist_cache._refresh_queryset(BlocklistedJWToken)
+
+    assert running_refresh is not None
+    with django_assert_num_queries(0):
+        assert blocklist_cache.may_contain(BlocklistedJWToken, 'unknown')
+
+
+class _CachedSyncAuth(JWTokenBlocklistSyncMixin, JWTSyncAuth):
+    blocklist_cache: ClassVar[BlocklistCache | None] = BlocklistCache(
+        refresh_interval=60,
+    )
+
+
+_sync_auth: Final = _CachedSyncAuth()
+
+
+class _SyncController(Controller[PydanticSerializer]):
+    @modify(auth=[_sync_auth])
+    def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.django_db
+def test_blocklist_cache_sync(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that the sync mixin skips the database for unknown tokens."""
+    encoded_token = _build_token(admin_user, settings)
+    request = dmr_rf.get(
+        '/whatever/',
+        headers={'Authorization': f'Bearer {encoded_token}'},
+    )
+    _SyncController.as_view()(request)
+
+    # Only the user is fetched:
+    with django_assert_num_queries(1):
+        response = _SyncController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    _sync_auth.blocklist(_sync_auth.decode_token(encoded_token))
+    response = _SyncController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED, response.content
+
+
+class _CachedAsyncAuth(JWTokenBlocklistAsyncMixin, JWTAsyncAuth):
+    blocklist_cache: ClassVar[BlocklistCache | None] = BlocklistCache(
+        refresh_interval=60,
+    )
+
+
+_async_auth: Final = _CachedAsyncAuth()
+
+
+class _AsyncController(Controller[PydanticSerializer]):
+    @modify(auth=[_async_auth])
+    async def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_blocklist_cache_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+) -> None:
+    """Ensures that the async mixin works with the blocklist cache."""
+    encoded_token = _build_token(admin_user, settings)
+
+    def request_factory() -> HttpResponse:
+        return _AsyncController.as_view()(  # type: ignore[return-value]
+            dmr_async_rf.get(
+                '/whatever/',
+                headers={'Authorization': f'Bearer {encoded_token}'},
+            ),
+        )
+
+    response = await dmr_async_rf.wrap(request_factory())
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    await _async_auth.blocklist(_async_auth.decode_token(encoded_token))
+    response = await dmr_async_rf.wrap(request_factory())
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED, response.content
@@ -0,0 +1,193 @@
+import datetime as dt
+from http import HTTPStatus
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from typing_extensions import override
+
+from dmr import Controller, modify
+from dmr.exceptions import NotAuthenticatedError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.security.jwt import JWToken, JWTSyncAuth
+from dmr.security.jwt.keys import JWTKey, JWTKeySet, prepare_key
+from dmr.security.jwt.views import (
+    VerifyTokenPayload,
+    VerifyTokenSyncController,
+)
+from dmr.test import DMRRequestFactory
+
+
+def _generate_pem() -> tuple[bytes, bytes]:
+    private_key = rsa.generate_private_key(
+        public_exponent=65537,  # noqa: WPS432
+        key_size=2048,  # noqa: WPS432
+    )
+    return (
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ),
+    )
+
+
+_OLD_PRIVATE, _OLD_PUBLIC = _generate_pem()
+_NEW_PRIVATE, _NEW_PUBLIC = _generate_pem()
+_PRIVATE_KEYS: Final = MappingProxyType({
+    'old': _OLD_PRIVATE,
+    'new': _NEW_PRIVATE,
+})
+_ALGORITHM: Final = 'RS256'
+
+
+def _build_token(
+    user: User,
+    private_key: JWTKey,
+    key_id: str | None = None,
+) -> str:
+    return JWToken(
+        sub=str(user.pk),
+        exp=dt.datetime.now(dt.UTC) + dt.timedelta(minutes=5),
+    ).encode(
+        secret=private_key,
+        algorithm=_ALGORITHM,
+        headers={'kid': key_id} if key_id else None,
+    )
+
+
+def test_prepare_key() -> None:
+    """Ensures that raw keys are parsed once, and key objects are kept."""
+    public_key = prepare_key(_OLD_PUBLIC, _ALGORITHM)
+
+    assert isinstance(public_key, rsa.RSAPublicKey)
+    assert prepare_key(_OLD_PUBLIC, _ALGORITHM) is public_key
+    assert prepare_key(public_key, _ALGORITHM) is public_key
+    assert prepare_key('secret', 'HS256') == b'secret'
+    assert prepare_key('secret', 'unknown') == 'secret'
+
+
+@pytest.mark.django_db
+def test_prepared_key_decode(admin_user: User) -> None:
+    """Ensures that tokens can be verified with key objects."""
+    auth = JWTSyncAuth(
+        algorithm=_ALGORITHM,
+        secret=prepare_key(_OLD_PUBLIC, _ALGORITHM),
+    )
+    encoded_token = _build_token(
+        admin_user,
+        prepare_key(_OLD_PRIVATE, _ALGORITHM),
+    )
+
+    assert auth.decode_token(encoded_token).sub == str(admin_user.pk)
+
+
+def test_key_set_from_files(tmp_path: Path) -> None:
+    """Ensures that key sets can be loaded from files."""
+    (tmp_path / 'old.pem').write_bytes(_OLD_PUBLIC)
+
+    key_set = JWTKeySet.from_files(
+        {'old': tmp_path / 'old.pem'},
+        algorithm=_ALGORITHM,
+    )
+
+    assert isinstance(key_set.keys['old'], rsa.RSAPublicKey)
+
+
+_key_set: Final = JWTKeySet({
+    'old': prepare_key(_OLD_PUBLIC, _ALGORITHM),
+    'new': prepare_key(_NEW_PUBLIC, _ALGORITHM),
+})
+
+
+class _RotationController(Controller[PydanticSerializer]):
+    @modify(auth=[JWTSyncAuth(algorithm=_ALGORITHM, secret=_key_set)])
+    def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('signed_by', 'key_id', 'status_code'),
+    [
+        ('old', 'old', HTTPStatus.OK),
+        ('new', 'new', HTTPStatus.OK),
+        ('new', 'old', HTTPStatus.UNAUTHORIZED),
+        ('new', 'unknown', HTTPStatus.UNAUTHORIZED),
+        ('new', None, HTTPStatus.UNAUTHORIZED),
+    ],
+)
+def test_key_set_rotation(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    *,
+    signed_by: str,
+    key_id: str | None,
+    status_code: HTTPStatus,
+) -> None:
+    """Ensures that keys are selected by the `kid` token header."""
+    encoded_token = _build_token(
+        admin_user,
+        _PRIVATE_KEYS[signed_by],
+        key_id,
+    )
+    request = dmr_rf.get(
+        '/whatever/',
+        headers={'Authorization': f'Bearer {encoded_token}'},
+    )
+
+    response = _RotationController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == status_code, response.content
+
+
+def test_key_set_malformed_token() -> None:
+    """Ensures that malformed tokens are rejected by key sets."""
+    with pytest.raises(NotAuthenticatedError):
+        _key_set.get_key('wrong')
+
+
+class _VerifyController(
+    VerifyTokenSyncController[PydanticSerializer, VerifyTokenPayload],
+):
+    jwt_algorithm = _ALGORITHM
+    jwt_secret = prepare_key(_NEW_PRIVATE, _ALGORITHM)
+    jwt_key_id = 'new'
+    jwt_verification_key = _key_set
+
+    @override
+    def convert_verify_payload(self, payload: VerifyTokenPayload) -> str:
+        return payload['access_token']
+
+
+@pytest.mark.django_db
+def test_views_key_rotation(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+) -> None:
+    """Ensures that views sign tokens with `kid` and verify with key sets."""
+    request = dmr_rf.post('/whatever/', data={})
+    request.user = admin_user
+    encoded_token = _VerifyController(request=request).create_jwt_token(
+        token_type='access',  # noqa: S106
+    )
+
+    assert jwt.get_unverified_header(encoded_token)['kid'] == 'new'
+
+    response = _VerifyController.as_view()(
+        dmr_rf.post('/whatever/', data={'access_token': encoded_token}),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.NO_CONTENT, response.content
@@ -0,0 +1,154 @@
+import datetime as dt
+import secrets
+from http import HTTPStatus
+from typing import Final
+from unittest.mock import MagicMock
+
+import pytest
+from django.conf import LazySettings
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
+
+from dmr import Controller, modify
+from dmr.exceptions import NotAuthenticatedError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.security.jwt import JWTAsyncAuth, JWToken, JWTSyncAuth
+from dmr.security.jwt.blocklist.auth import JWTokenBlocklistSyncMixin
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_EXP: Final = dt.timedelta(minutes=5)
+
+
+def _build_token(admin_user: User, settings: LazySettings) -> str:
+    return JWToken(
+        sub=str(admin_user.pk),
+        exp=dt.datetime.now(dt.UTC) + _EXP,
+        jti=secrets.token_hex(),
+    ).encode(secret=settings.SECRET_KEY, algorithm='HS256')
+
+
+def test_token_cache_until_expiry(
+    admin_user: User,
+    settings: LazySettings,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that verified tokens are cached until they expire."""
+    auth = JWTSyncAuth(token_cache_size=2, leeway=10)
+    token_decode = MagicMock(wraps=JWToken.decode)
+    monkeypatch.setattr(JWToken, 'decode', token_decode)
+    encoded_token = _build_token(admin_user, settings)
+
+    assert auth.decode_token(encoded_token) is auth.decode_token(encoded_token)
+    assert token_decode.call_count == 1
+
+    # Tokens are dropped from the cache `leeway` seconds before `exp`:
+    freezer.tick(_EXP - dt.timedelta(seconds=10))
+    auth.decode_token(encoded_token)
+
+    assert token_decode.call_count == 2
+
+
+def test_token_cache_size(
+    admin_user: User,
+    settings: LazySettings,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that the token cache is bounded."""
+    auth = JWTSyncAuth(token_cache_size=1)
+    token_decode = MagicMock(wraps=JWToken.decode)
+    monkeypatch.setattr(JWToken, 'decode', token_decode)
+    first_token = _build_token(admin_user, settings)
+    second_token = _build_token(admin_user, settings)
+
+    auth.decode_token(first_token)
+    auth.decode_token(second_token)
+    auth.decode_token(first_token)
+
+    assert token_decode.call_count == 3
+
+
+def test_token_cache_invalid_tokens(
+    admin_user: User,
+    settings: LazySettings,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that invalid and expired tokens are never cached."""
+    auth = JWTSyncAuth(token_cache_size=2)
+    expired_token = _build_token(admin_user, settings)
+    freezer.tick(_EXP)
+
+    for _ in range(2):
+        with pytest.raises(NotAuthenticatedError):
+            auth.decode_token(expired_token)
+        with pytest.raises(NotAuthenticatedError):
+            auth.decode_token('wrong')
+
+
+class _BlocklistSyncAuth(JWTokenBlocklistSyncMixin, JWTSyncAuth):
+    """Blocklist auth with cached tokens."""
+
+
+_blocklist_auth = _BlocklistSyncAuth(token_cache_size=2)
+
+
+class _BlocklistController(Controller[PydanticSerializer]):
+    @modify(auth=[_blocklist_auth])
+    def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.django_db
+def test_token_cache_blocklist(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+) -> None:
+    """Ensures that cached tokens are still checked in the blocklist."""
+    encoded_token = _build_token(admin_user, settings)
+    request = dmr_rf.get(
+        '/whatever/',
+        headers={'Authorization': f'Bearer {encoded_token}'},
+    )
+
+    response = _BlocklistController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    _blocklist_auth.blocklist(_blocklist_auth.decode_token(encoded_token))
+    response = _BlocklistController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED, response.content
+
+
+class _AsyncController(Controller[PydanticSerializer]):
+    @modify(auth=[JWTAsyncAuth(token_cache_size=2)])
+    async def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_token_cache_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+) -> None:
+    """Ensures that async auth works with cached tokens."""
+    encoded_token = _build_token(admin_user, settings)
+
+    for _ in range(2):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(
+                dmr_async_rf.get(
+                    '/whatever/',
+                    headers={'Authorization': f'Bearer {encoded_token}'},
+                ),
+            ),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
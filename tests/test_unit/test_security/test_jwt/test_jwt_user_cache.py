@@ -0,0 +1,253 @@
+import datetime as dt
+from http import HTTPStatus
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.conf import LazySettings
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.core.exceptions import SynchronousOnlyOperation
+from django.http import HttpResponse
+from pytest_django import DjangoAssertNumQueries
+
+from dmr import Controller, modify
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.security.jwt import JWTAsyncAuth, JWToken, JWTSyncAuth
+from dmr.security.user_cache import UserCache
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+
+def _build_token(admin_user: User, settings: LazySettings) -> str:
+    return JWToken(
+        sub=str(admin_user.pk),
+        exp=dt.datetime.now(dt.UTC) + dt.timedelta(minutes=5),
+    ).encode(secret=settings.SECRET_KEY, algorithm='HS256')
+
+
+_user_cache = UserCache(ttl=60)
+
+
+class _CachedController(Controller[PydanticSerializer]):
+    @modify(auth=[JWTSyncAuth(user_cache=_user_cache)])
+    def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.django_db
+def test_user_cache_sync(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that users are cached and dropped on changes."""
+    request = dmr_rf.get(
+        '/whatever/',
+        headers={
+            'Authorization': f'Bearer {_build_token(admin_user, settings)}',
+        },
+    )
+
+    response = _CachedController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    with django_assert_num_queries(0):
+        response = _CachedController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    admin_user.is_active = False
+    admin_user.save(update_fields=['is_active'])
+    response = _CachedController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED, response.content
+
+
+@pytest.mark.django_db
+def test_user_cache_django_cache(admin_user: User) -> None:
+    """Ensures that users can be stored in a shared Django cache."""
+    user_cache = UserCache(ttl=60, cache_name='default')
+    user_cache.add_lookup_field('pk')
+
+    user_cache.set('pk', str(admin_user.pk), admin_user)
+
+    assert cache.get(f'dmr::user::pk::{admin_user.pk}') == admin_user
+    assert user_cache.get('pk', str(admin_user.pk)) == admin_user
+
+    admin_user.delete()
+
+    assert user_cache.get('pk', str(admin_user.pk)) is None
+
+
+@pytest.mark.django_db
+def test_user_cache_copies(admin_user: User) -> None:
+    """Ensures that in-process caches return a copy of the user."""
+    user_cache = UserCache(ttl=60)
+    user_cache.set('pk', str(admin_user.pk), admin_user)
+    admin_user.first_name = 'changed'
+
+    first = user_cache.get('pk', str(admin_user.pk))
+    assert first is not None
+    first.is_active = False
+    second = cast(User, user_cache.get('pk', str(admin_user.pk)))
+
+    assert second is not first
+    assert second == admin_user
+    assert second.is_active
+    assert second.first_name != 'changed'
+
+
+@pytest.mark.django_db
+def test_user_cache_other_models(
+    admin_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that only changes of users invalidate the cache."""
+    invalidate = MagicMock()
+    monkeypatch.setattr(UserCache, 'invalidate', invalidate)
+    user_cache = UserCache(ttl=60)
+    user_cache.set('pk', str(admin_user.pk), admin_user)
+
+    Group.objects.create(name='other')
+
+    invalidate.assert_not_called()
+
+    admin_user.save()
+
+    invalidate.assert_called_with(admin_user)
+
+
+class _LazyController(Controller[PydanticSerializer]):
+    @modify(auth=[JWTSyncAuth(lazy_user=True)])
+    def get(self) -> str:
+        return 'authed'
+
+    @modify(auth=[JWTSyncAuth(lazy_user=True)])
+    def post(self) -> str:
+        return str(self.request.user.pk)
+
+
+@pytest.mark.django_db
+def test_lazy_user(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that lazy users are only fetched on access."""
+    headers = {'Authorization': f'Bearer {_build_token(admin_user, settings)}'}
+
+    with django_assert_num_queries(0):
+        response = _LazyController.as_view()(
+            dmr_rf.get('/whatever/', headers=headers),
+        )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+
+    with django_assert_num_queries(1):
+        response = _LazyController.as_view()(
+            dmr_rf.post('/whatever/', headers=headers),
+        )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert response.content == f'"{admin_user.pk}"'.encode()
+
+
+_async_user_cache = UserCache(ttl=60)
+
+
+class _AsyncController(Controller[PydanticSerializer]):
+    @modify(auth=[JWTAsyncAuth(user_cache=_async_user_cache)])
+    async def get(self) -> str:
+        return 'authed'
+
+    @modify(auth=[JWTAsyncAuth(lazy_user=True)])
+    async def post(self) -> str:
+        user = await self.request.auser()
+        return str(user.pk)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_user_cache_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    admin_user: User,
+    settings: LazySettings,
+) -> None:
+    """Ensures that async auth works with cached and lazy users."""
+    headers = {'Authorization': f'Bearer {_build_token(admin_user, settings)}'}
+
+    for _ in range(2):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(
+                dmr_async_rf.get('/whatever/', headers=headers),
+            ),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+
+    assert _async_user_cache.get('pk', str(admin_user.pk)) == admin_user
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(
+            dmr_async_rf.post('/whatever/', headers=headers),
+        ),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.CREATED, response.content
+    assert response.content == f'"{admin_user.pk}"'.encode()
+
+
+def _lazy_token() -> JWToken:
+    expires = dt.datetime.now(dt.UTC) + dt.timedelta(days=1)
+    return JWToken(sub='1', exp=expires)
+
+
+@pytest.mark.asyncio
+async def test_lazy_user_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that async lazy users are fetched once and only when awaited."""
+    user = User(pk=1, username='lazy')
+    get_user = AsyncMock(return_value=user)
+    monkeypatch.setattr(JWTAsyncAuth, 'get_user', get_user)
+    token = _lazy_token()
+    request = dmr_async_rf.get('/whatever/')
+
+    await JWTAsyncAuth(lazy_user=True).authenticate(request, token)
+
+    assert get_user.await_count == 0
+    with pytest.raises(SynchronousOnlyOperation, match='auser'):
+        str(request.user.pk)
+
+    assert await request.auser() is user
+    assert await request.auser() is user
+    assert request.user.pk == user.pk
+    assert get_user.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lazy_user_async_sync_thread(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that async lazy users can be fetched from sync threads."""
+    user = User(pk=1, username='lazy')
+    monkeypatch.setattr(JWTAsyncAuth, 'get_user', AsyncMock(return_value=user))
+    token = _lazy_token()
+    request = dmr_async_rf.get('/whatever/')
+
+    await JWTAsyncAuth(lazy_user=True).authenticate(request, token)
+
+    assert await sync_to_async(lambda: request.user.pk)() == user.pk
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+from typing import Any, ClassVar, Final, final
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpRequest, HttpResponse
+from typing_extensions import override
+
+from dmr.exceptions import TooManyRequestsError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.security import login_executor as login_executor_module
+from dmr.security.jwt.views import (
+    ObtainTokensAsyncController,
+    ObtainTokensPayload,
+    ObtainTokensResponse,
+)
+from dmr.security.login_executor import LoginExecutor, LoginExecutorStats
+from dmr.test import DMRAsyncRequestFactory
+
+_TIMEOUT: Final = 5
+
+
+@pytest.fixture
+def release_login(monkeypatch: pytest.MonkeyPatch) -> threading.Event:
+    """Makes all logins wait for the returned event."""
+    release = threading.Event()
+
+    def blocking_authenticate(
+        request: HttpRequest,
+        **credentials: Any,
+    ) -> None:
+        release.wait(_TIMEOUT)
+
+    monkeypatch.setattr(
+        login_executor_module,
+        'authenticate',
+        blocking_authenticate,
+    )
+    return release
+
+
+@pytest.mark.asyncio
+async def test_login_executor_overload(release_login: threading.Event) -> None:
+    """Ensures that logins over the executor limits are rejected."""
+    executor = LoginExecutor(max_workers=1, max_queue=1, retry_after=2)
+
+    logins = [
+        asyncio.create_task(executor.aauthenticate(HttpRequest()))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await executor.aauthenticate(HttpRequest())
+
+    stats = executor.stats()
+    assert exc_info.value.headers == {'Retry-After': '2'}
+    assert stats.running + stats.queued == 2
+    assert stats.running <= 1
+    assert stats.rejected == 1
+
+    release_login.set()
+
+    assert await asyncio.gather(*logins) == [None, None]
+    assert executor.stats() == LoginExecutorStats(
+        running=0,
+        queued=0,
+        rejected=1,
+    )
+
+
+@final
+class _ObtainTokensController(
+    ObtainTokensAsyncController[
+        PydanticSerializer,
+        ObtainTokensPayload,
+        ObtainTokensResponse,
+    ],
+):
+    login_executor: ClassVar[LoginExecutor | None] = LoginExecutor()
+
+    @override
+    async def convert_auth_payload(
+        self,
+        payload: ObtainTokensPayload,
+    ) -> ObtainTokensPayload:
+        return payload
+
+    @override
+    async def make_api_response(self) -> ObtainTokensResponse:
+        return {
+            'access_token': str(self.request.user.pk),
+            'refresh_token': '',
+        }
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_login_executor_controller(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    admin_user: User,
+) -> None:
+    """Ensures that async login controllers use the login executor."""
+    request = dmr_async_rf.post(
+        '/whatever/',
+        data={'username': admin_user.username, 'password': 'password'},
+    )
+
+    response = await dmr_async_rf.wrap(
+        _ObtainTokensController.as_view()(request),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content)['access_token'] == str(admin_user.pk)
+
+
+def test_login_executor_response_specs() -> None:
+    """Ensures that rejected logins are present in the metadata."""
+    metadata = _ObtainTokensController.api_endpoints['POST'].metadata
+
+    response_spec = metadata.responses[HTTPStatus.TOO_MANY_REQUESTS]
+    assert set(response_spec.headers or {}) == {'Retry-After'}
+
+
+@final
+class _OverloadedController(
+    ObtainTokensAsyncController[
+        PydanticSerializer,
+        ObtainTokensPayload,
+        ObtainTokensResponse,
+    ],
+):
+    login_executor: ClassVar[LoginExecutor | None] = LoginExecutor(
+        max_workers=1,
+        max_queue=0,
+        retry_after=3,
+    )
+
+    @override
+    async def convert_auth_payload(
+        self,
+        payload: ObtainTokensPayload,
+    ) -> ObtainTokensPayload:
+        return payload
+
+    @override
+    async def make_api_response(self) -> ObtainTokensResponse:
+        raise NotImplementedError
+
+
+@pytest.mark.asyncio
+async def test_login_executor_controller_overload(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    release_login: threading.Event,
+) -> None:
+    """Ensures that async login controllers return 429 when overloaded."""
+    assert _OverloadedController.login_executor
+    login = asyncio.create_task(
+        _OverloadedController.login_executor.aauthenticate(HttpRequest()),
+    )
+    await asyncio.sleep(0)
+
+    request = dmr_async_rf.post(
+        '/whatever/',
+        data={'username': 'user', 'password': 'password'},
+    )
+    response = await dmr_async_rf.wrap(
+        _OverloadedController.as_view()(request),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+        response.content
+    )
+    assert response.headers['Retry-After'] == '3'
+
+    release_login.set()
+    assert await login is None
@@ -0,0 +1,266 @@
+import datetime as dt
+import time
+from http import HTTPStatus
+from typing import Final, final
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
+from pytest_django import DjangoAssertNumQueries
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticFastSerializer
+from dmr.security.token import HeaderTokenAsyncAuth, HeaderTokenSyncAuth
+from dmr.security.token.app.models import Token
+from dmr.security.token.cache import TokenCache
+from dmr.security.token.last_used import LastUsedBatch, _updated_fields
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_INTERVAL: Final = dt.timedelta(minutes=5)
+_BACKGROUND_INTERVAL: Final = 0.01
+_POLL_INTERVAL: Final = 0.05
+_LONG_TIME: Final = 3600
+
+
+@final
+class _DebouncedController(Controller[PydanticFastSerializer]):
+    auth = (
+        HeaderTokenSyncAuth(
+            update_last_used=True,
+            last_used_interval=_INTERVAL,
+        ),
+    )
+
+    def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.django_db
+def test_last_used_interval(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    freezer: FrozenDateTimeFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that recently used tokens are not written again."""
+    token, raw_token = Token.issue(user=admin_user, name='debounced')
+    request = dmr_rf.get('/whatever/', headers={'X-API-Token': raw_token})
+
+    # Select and update:
+    with django_assert_num_queries(2):
+        response = _DebouncedController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+
+    token.refresh_from_db()
+    first_used_at = token.last_used_at
+    freezer.tick(_INTERVAL - dt.timedelta(seconds=1))
+
+    with django_assert_num_queries(1):
+        _DebouncedController.as_view()(request)
+
+    freezer.tick(dt.timedelta(seconds=1))
+
+    with django_assert_num_queries(2):
+        _DebouncedController.as_view()(request)
+
+    token.refresh_from_db()
+    assert first_used_at is not None
+    assert token.last_used_at == first_used_at + _INTERVAL
+
+
+@pytest.mark.django_db
+def test_last_used_batch(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that used tokens are written in bulk."""
+    last_used_batch = LastUsedBatch(flush_interval=60, flush_size=3)
+
+    @final
+    class _BatchController(Controller[PydanticFastSerializer]):
+        auth = (
+            HeaderTokenSyncAuth(
+                update_last_used=True,
+                last_used_batch=last_used_batch,
+            ),
+        )
+
+        def get(self) -> str:
+            return 'authed'
+
+    tokens = [
+        Token.issue(user=admin_user, name=f'batch-{index}')
+        for index in range(3)
+    ]
+    for _, raw_token in tokens[:2]:
+        response = _BatchController.as_view()(
+            dmr_rf.get('/whatever/', headers={'X-API-Token': raw_token}),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+
+    assert not Token.objects.filter(last_used_at__isnull=False).exists()
+
+    # Size limit is reached:
+    _BatchController.as_view()(
+        dmr_rf.get('/whatever/', headers={'X-API-Token': tokens[2][1]}),
+    )
+
+    assert Token.objects.filter(last_used_at__isnull=False).count() == 3
+
+    Token.objects.update(last_used_at=None)
+    _BatchController.as_view()(
+        dmr_rf.get('/whatever/', headers={'X-API-Token': tokens[0][1]}),
+    )
+
+    assert not Token.objects.filter(last_used_at__isnull=False).exists()
+
+    # Time limit is reached:
+    freezer.tick(dt.timedelta(seconds=60))
+    _BatchController.as_view()(
+        dmr_rf.get('/whatever/', headers={'X-API-Token': tokens[1][1]}),
+    )
+
+    assert Token.objects.filter(last_used_at__isnull=False).count() == 2
+
+
+@pytest.mark.django_db
+def test_last_used_batch_cached(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    freezer: FrozenDateTimeFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that cached tokens know about their batched uses."""
+    last_used_batch = LastUsedBatch(flush_interval=_LONG_TIME)
+
+    @final
+    class _CachedBatchController(Controller[PydanticFastSerializer]):
+        auth = (
+            HeaderTokenSyncAuth(
+                update_last_used=True,
+                last_used_interval=_INTERVAL,
+                last_used_batch=last_used_batch,
+                token_cache=TokenCache(ttl=_LONG_TIME),
+            ),
+        )
+
+        def get(self) -> str:
+            return 'authed'
+
+    token, raw_token = Token.issue(user=admin_user, name='cached')
+    request = dmr_rf.get('/whatever/', headers={'X-API-Token': raw_token})
+    first_used_at = dt.datetime.now(dt.UTC)
+    _CachedBatchController.as_view()(request)
+    freezer.tick(_INTERVAL - dt.timedelta(seconds=1))
+
+    with django_assert_num_queries(0):
+        assert (
+            _CachedBatchController.as_view()(request).status_code
+            == HTTPStatus.OK
+        )
+
+    last_used_batch.flush()
+
+    token.refresh_from_db()
+    assert token.last_used_at == first_used_at
+
+    freezer.tick(dt.timedelta(seconds=1))
+    _CachedBatchController.as_view()(request)
+    last_used_batch.flush()
+
+    token.refresh_from_db()
+    assert token.last_used_at == first_used_at + _INTERVAL
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_last_used_batch_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    admin_user: User,
+) -> None:
+    """Ensures that used tokens are written in bulk by async auth."""
+    last_used_batch = LastUsedBatch()
+
+    @final
+    class _AsyncBatchController(Controller[PydanticFastSerializer]):
+        auth = (
+            HeaderTokenAsyncAuth(
+                update_last_used=True,
+                last_used_batch=last_used_batch,
+            ),
+        )
+
+        async def get(self) -> str:
+            return 'authed'
+
+    token, raw_token = await Token.aissue(user=admin_user, name='async')
+    response = await dmr_async_rf.wrap(
+        _AsyncBatchController.as_view()(
+            dmr_async_rf.get('/whatever/', headers={'X-API-Token': raw_token}),
+        ),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+
+    await token.arefresh_from_db()
+    assert token.last_used_at is None
+
+    await last_used_batch.aflush()
+
+    await token.arefresh_from_db()
+    assert isinstance(token.last_used_at, dt.datetime)
+
+
+@pytest.mark.django_db
+def test_last_used_batch_time_of_use(
+    admin_user: User,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that each token gets the time of its last use."""
+    last_used_batch = LastUsedBatch(flush_interval=60)
+    first_token, _ = Token.issue(user=admin_user, name='first')
+    second_token, _ = Token.issue(user=admin_user, name='second')
+
+    last_used_batch.add(first_token)
+    first_used_at = dt.datetime.now(dt.UTC)
+    freezer.tick(dt.timedelta(seconds=10))
+    last_used_batch.add(second_token)
+    last_used_batch.flush()
+
+    first_token.refresh_from_db()
+    second_token.refresh_from_db()
+    assert first_token.last_used_at == first_used_at
+    assert second_token.last_used_at == first_used_at + dt.timedelta(
+        seconds=10,
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_last_used_batch_background_flush(admin_user: User) -> None:
+    """Ensures that used tokens are written when no requests come."""
+    last_used_batch = LastUsedBatch(flush_interval=_BACKGROUND_INTERVAL)
+    token, _ = Token.issue(user=admin_user, name='background')
+
+    last_used_batch.add(token)
+
+    for _ in range(100):
+        token.refresh_from_db()
+        if token.last_used_at is not None:
+            break
+        time.sleep(_POLL_INTERVAL)
+    assert isinstance(token.last_used_at, dt.datetime)
+
+
+def test_last_used_custom_model() -> None:
+    """Ensures that missing ``updated_at`` field is not written."""
+    # Any model without `updated_at` field:
+    updated_fields = _updated_fields(Group, {})
+
+    assert list(updated_fields) == ['last_used_at']
@@ -0,0 +1,224 @@
+import datetime as dt
+from http import HTTPStatus
+from typing import Final, cast, final
+
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from pytest_django import DjangoAssertNumQueries
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticFastSerializer
+from dmr.security.token import HeaderTokenAsyncAuth, HeaderTokenSyncAuth
+from dmr.security.token.app.models import Token
+from dmr.security.token.cache import TokenCache
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_token_cache: Final = TokenCache(ttl=60)
+
+
+@final
+class _CachedController(Controller[PydanticFastSerializer]):
+    auth = (HeaderTokenSyncAuth(token_cache=_token_cache),)
+
+    def get(self) -> str:
+        return 'authed'
+
+
+def _request(dmr_rf: DMRRequestFactory, raw_token: str) -> HttpResponse:
+    response = _CachedController.as_view()(
+        dmr_rf.get('/whatever/', headers={'X-API-Token': raw_token}),
+    )
+    assert isinstance(response, HttpResponse)
+    return response
+
+
+@pytest.mark.django_db
+def test_token_cache_revoke(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that tokens are cached until they are revoked."""
+    token, raw_token = Token.issue(user=admin_user, name='cached')
+
+    with django_assert_num_queries(1):
+        assert _request(dmr_rf, raw_token).status_code == HTTPStatus.OK
+    with django_assert_num_queries(0):
+        assert _request(dmr_rf, raw_token).status_code == HTTPStatus.OK
+
+    token.revoke()
+
+    response = _request(dmr_rf, raw_token)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_token_cache_user_deactivated(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+) -> None:
+    """Ensures that tokens are dropped when their users change."""
+    _, raw_token = Token.issue(user=admin_user, name='cached')
+
+    assert _request(dmr_rf, raw_token).status_code == HTTPStatus.OK
+
+    admin_user.is_active = False
+    admin_user.save(update_fields=['is_active'])
+
+    response = _request(dmr_rf, raw_token)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_token_cache_last_used(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that ``last_used_at`` updates keep tokens in the cache."""
+
+    @final
+    class _LastUsedController(Controller[PydanticFastSerializer]):
+        auth = (
+            HeaderTokenSyncAuth(
+                token_cache=TokenCache(ttl=60),
+                update_last_used=True,
+            ),
+        )
+
+        def get(self) -> str:
+            return 'authed'
+
+    _, raw_token = Token.issue(user=admin_user, name='cached')
+    request = dmr_rf.get('/whatever/', headers={'X-API-Token': raw_token})
+    _LastUsedController.as_view()(request)
+
+    # Only the update:
+    with django_assert_num_queries(1):
+        response = _LastUsedController.as_view()(request)
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_token_cache_snapshots(admin_user: User) -> None:
+    """Ensures that every cache hit gets its own token and user instances."""
+    token_cache = TokenCache(ttl=60)
+    token, _ = Token.issue(user=admin_user, name='cached')
+    token_cache.set('hash', token, user=admin_user)
+
+    first = token_cache.get('hash', Token)
+    second = token_cache.get('hash', Token)
+
+    assert first is not None
+    assert second is not None
+    assert first is not second
+    assert first.pk == second.pk == token.pk
+    assert first.get_user() is not second.get_user()
+    assert first.get_user() == admin_user
+
+    first.mark_used()
+    cached = token_cache.get('hash', Token)
+
+    assert cached is not None
+    assert cached.last_used_at == first.last_used_at
+    assert second.last_used_at is None
+
+
+@pytest.mark.django_db
+def test_token_cache_user_fields(
+    admin_user: User,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that only some user fields are cached."""
+    token_cache = TokenCache(ttl=60, user_fields=('is_active', 'email'))
+    token, _ = Token.issue(user=admin_user, name='cached')
+    token_cache.set('hash', token, user=admin_user)
+
+    cached = token_cache.get('hash', Token)
+
+    assert cached is not None
+    with django_assert_num_queries(0):
+        user = cast(User, cached.get_user())
+        assert user.pk == admin_user.pk
+        assert user.get_username() == admin_user.username
+        assert user.email == admin_user.email
+        assert user.is_active
+    assert user.get_deferred_fields() >= {'password', 'last_login'}
+    with django_assert_num_queries(1):
+        assert user.password == admin_user.password
+
+
+@pytest.mark.django_db
+def test_token_cache_unrelated_changes(
+    dmr_rf: DMRRequestFactory,
+    admin_user: User,
+    django_user_model: type[User],
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Ensures that changes of other users and tokens keep the cache."""
+    _, raw_token = Token.issue(user=admin_user, name='cached')
+    other_user = django_user_model.objects.create(username='other')
+    other_token, _ = Token.issue(user=other_user, name='other')
+
+    assert _request(dmr_rf, raw_token).status_code == HTTPStatus.OK
+
+    other_user.save()
+    other_token.revoke()
+
+    with django_assert_num_queries(0):
+        assert _request(dmr_rf, raw_token).status_code == HTTPStatus.OK
+
+
+@final
+class _AsyncCachedController(Controller[PydanticFastSerializer]):
+    auth = (HeaderTokenAsyncAuth(token_cache=TokenCache(ttl=60)),)
+
+    async def get(self) -> str:
+        return 'authed'
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_token_cache_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    admin_user: User,
+) -> None:
+    """Ensures that async auth works with cached tokens."""
+    token, raw_token = await Token.aissue(user=admin_user, name='async')
+
+    for _ in range(2):
+        response = await dmr_async_rf.wrap(
+            _AsyncCachedController.as_view()(
+                dmr_async_rf.get(
+                    '/whatever/',
+                    headers={'X-API-Token': raw_token},
+                ),
+            ),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK
+
+    await token.arevoke()
+    response = await dmr_async_rf.wrap(
+        _AsyncCachedController.as_view()(
+            dmr_async_rf.get('/whatever/', headers={'X-API-Token': raw_token}),
+        ),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_token_cache_touch_missing() -> None:
+    """Ensures that touching tokens that are not cached does nothing."""
+    token_cache = TokenCache(ttl=60)
+
+    token_cache.touch('hash', dt.datetime.now(dt.UTC))
+
+    assert token_cache.get('hash', Token) is None
@@ -0,0 +1,130 @@
+from collections.abc import AsyncIterator
+from typing import Any, Final, cast
+
+import pytest
+from typing_extensions import override
+
+from dmr.exceptions import ValidationError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.streaming import StreamingResponse
+from dmr.streaming.broadcast import Broadcast, SlowConsumerPolicy
+from dmr.streaming.jsonl import JsonLinesController
+from dmr.streaming.renderer import StreamingRenderer
+from dmr.streaming.sse import SSEController, SSEvent
+from dmr.test import DMRAsyncRequestFactory
+from tests.infra.streaming import get_streaming_content
+
+_prices: Final = Broadcast[SSEvent[int]]()
+
+
+class _PricesSSE(SSEController[PydanticSerializer]):
+    async def get(self) -> AsyncIterator[SSEvent[int]]:
+        return _prices.subscribe(self)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shared_events(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that events are rendered once for all subscribers."""
+    responses = [
+        await dmr_async_rf.wrap(
+            _PricesSSE.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+        for _ in range(2)
+    ]
+    streams: list[AsyncIterator[bytes]] = [
+        aiter(response)  # type: ignore[arg-type]
+        for response in responses
+    ]
+
+    assert _prices.subscriber_count == 2
+
+    _prices.publish(SSEvent(1))
+    chunks = [await anext(stream) for stream in streams]
+
+    assert chunks[0] == b'data: 1\r\n\r\n'
+    assert chunks[0] is chunks[1]
+
+    _prices.close()
+
+    assert _prices.subscriber_count == 0
+    for stream in streams:
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('slow_consumer', 'expected'),
+    [
+        (SlowConsumerPolicy.drop, b'1\n2\n'),
+        (SlowConsumerPolicy.coalesce, b'3\n'),
+        (SlowConsumerPolicy.disconnect, b''),
+    ],
+)
+async def test_broadcast_slow_consumer(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    *,
+    slow_consumer: SlowConsumerPolicy,
+    expected: bytes,
+) -> None:
+    """Ensures that slow consumer policies are respected."""
+    broadcast = Broadcast[int](max_queue=2, slow_consumer=slow_consumer)
+
+    class _NumbersJsonLines(JsonLinesController[PydanticSerializer]):
+        async def get(self) -> AsyncIterator[int]:
+            return broadcast.subscribe(self)
+
+    response = await dmr_async_rf.wrap(
+        _NumbersJsonLines.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+
+    assert isinstance(response, StreamingResponse)
+
+    for number in (1, 2, 3):
+        broadcast.publish(number)
+    broadcast.close()
+
+    assert await get_streaming_content(response) == expected
+    assert broadcast.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_groups_by_endpoint(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that every endpoint validates events with its own settings."""
+    broadcast = Broadcast[Any]()
+
+    class _AnyJsonLines(JsonLinesController[PydanticSerializer]):
+        validate_events = False
+
+        async def get(self) -> AsyncIterator[int]:
+            return broadcast.subscribe(self)
+
+    class _IntJsonLines(JsonLinesController[PydanticSerializer]):
+        @override
+        @classmethod
+        def streaming_renderers(
+            cls,
+            serializer: type[PydanticSerializer],
+        ) -> list[StreamingRenderer]:
+            # The same renderer instance is shared by both controllers:
+            return [cast(StreamingRenderer, _AnyJsonLines.renderers[0])]
+
+        async def get(self) -> AsyncIterator[int]:
+            return broadcast.subscribe(self)
+
+    for controller in (_AnyJsonLines, _IntJsonLines):
+        await dmr_async_rf.wrap(
+            controller.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+
+    with pytest.raises(ValidationError):
+        broadcast.publish('not an int')
+
+    broadcast.close()
+
+    # Groups without subscribers do not validate events anymore:
+    broadcast.publish('not an int')
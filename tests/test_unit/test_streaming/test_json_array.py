@@ -0,0 +1,199 @@
+import gzip
+import json
+from collections.abc import AsyncIterator, Iterator
+from http import HTTPStatus
+from typing import Final
+
+import pydantic
+import pytest
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+
+from dmr import Controller, ResponseSpec, validate
+from dmr.compression import Compression, GzipEncoder
+from dmr.exceptions import ValidationError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.renderers import JsonRenderer
+from dmr.streaming.json_array import JsonArrayResponse
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+
+_CHUNK_SIZE: Final = 32
+
+
+class _ItemModel(pydantic.BaseModel):
+    number: int
+
+
+def _numbers(count: int) -> Iterator[dict[str, int]]:
+    for number in range(count):
+        yield {'number': number}
+
+
+async def _async_numbers(count: int) -> AsyncIterator[_ItemModel]:
+    for number in range(count):
+        yield _ItemModel(number=number)
+
+
+class _SyncController(Controller[PydanticSerializer]):
+    @validate(ResponseSpec(list[_ItemModel], status_code=HTTPStatus.OK))
+    def get(self) -> JsonArrayResponse:
+        count = int(self.request.GET['count'])
+        return JsonArrayResponse(_numbers(count), self, chunk_size=_CHUNK_SIZE)
+
+
+@pytest.mark.parametrize('count', [0, 1, 2, 50])
+def test_json_array_sync(
+    dmr_rf: DMRRequestFactory,
+    *,
+    count: int,
+) -> None:
+    """Ensures that sync iterators are streamed as json arrays."""
+    response = _SyncController.as_view()(
+        dmr_rf.get('/whatever/', data={'count': count}),
+    )
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers == {'Content-Type': 'application/json'}
+    chunks = list(response)
+    assert json.loads(b''.join(chunks)) == list(_numbers(count))
+    # Chunks are flushed as soon as they reach `chunk_size`:
+    assert max(map(len, chunks)) < _CHUNK_SIZE * 2
+
+
+@pytest.mark.asyncio
+async def test_json_array_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that async iterators are streamed as json arrays."""
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        @validate(ResponseSpec(list[_ItemModel], status_code=HTTPStatus.OK))
+        async def get(self) -> JsonArrayResponse:
+            return JsonArrayResponse(_async_numbers(3), self)
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    body = b''.join([chunk async for chunk in response])
+    assert json.loads(body) == list(_numbers(3))
+
+
+def test_json_array_head(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that ``HEAD`` requests use the ``GET`` endpoint metadata."""
+    controller = _SyncController()
+    controller.setup(dmr_rf.head('/whatever/'))
+
+    response = JsonArrayResponse(iter([{'other': 2}]), controller)
+
+    with pytest.raises(ValidationError):
+        list(response)
+
+
+def test_json_array_unknown_method(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that methods without an endpoint do not validate items."""
+    controller = _SyncController()
+    controller.setup(dmr_rf.delete('/whatever/'))
+
+    response = JsonArrayResponse(iter([{'other': 2}]), controller)
+
+    assert json.loads(b''.join(response)) == [{'other': 2}]
+
+
+def test_json_array_renderer_content_type(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that ``Content-Type`` is taken from the renderer."""
+    controller = _SyncController()
+    controller.setup(dmr_rf.get('/whatever/'))
+
+    response = JsonArrayResponse(
+        _numbers(1),
+        controller,
+        renderer=JsonRenderer('application/problem+json'),
+    )
+
+    assert response.headers == {'Content-Type': 'application/problem+json'}
+    assert json.loads(b''.join(response)) == list(_numbers(1))
+
+
+def test_json_array_item_validation(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that items are validated while streaming."""
+
+    class _InvalidController(Controller[PydanticSerializer]):
+        @validate(ResponseSpec(list[_ItemModel], status_code=HTTPStatus.OK))
+        def get(self) -> JsonArrayResponse:
+            return JsonArrayResponse(iter([{'number': 1}, {'other': 2}]), self)
+
+    response = _InvalidController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    with pytest.raises(ValidationError):
+        list(response)
+
+
+def test_json_array_no_validation(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that items validation can be turned off."""
+
+    class _NoValidationController(Controller[PydanticSerializer]):
+        @validate(ResponseSpec(list[_ItemModel], status_code=HTTPStatus.OK))
+        def get(self) -> JsonArrayResponse:
+            return JsonArrayResponse(
+                iter([{'other': 2}]),
+                self,
+                validate_items=False,
+            )
+
+    response = _NoValidationController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert json.loads(b''.join(response)) == [{'other': 2}]
+
+
+@pytest.mark.django_db
+def test_json_array_queryset(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that queryset iterators can be streamed."""
+    User.objects.bulk_create([
+        User(username='first'),
+        User(username='second'),
+    ])
+
+    class _QuerySetController(Controller[PydanticSerializer]):
+        @validate(ResponseSpec(list[dict[str, str]], status_code=HTTPStatus.OK))
+        def get(self) -> JsonArrayResponse:
+            return JsonArrayResponse(
+                User.objects
+                .order_by('username')
+                .values('username')
+                .iterator(chunk_size=1),
+                self,
+            )
+
+    response = _QuerySetController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert json.loads(b''.join(response)) == [
+        {'username': 'first'},
+        {'username': 'second'},
+    ]
+
+
+def test_json_array_compression(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that json arrays are compressed chunk by chunk."""
+
+    class _CompressedController(Controller[PydanticSerializer]):
+        compression = Compression(encoders=[GzipEncoder()])
+
+        @validate(ResponseSpec(list[_ItemModel], status_code=HTTPStatus.OK))
+        def get(self) -> JsonArrayResponse:
+            return JsonArrayResponse(_numbers(10), self, chunk_size=_CHUNK_SIZE)
+
+    response = _CompressedController.as_view()(
+        dmr_rf.get('/whatever/', headers={'Accept-Encoding': 'gzip'}),
+    )
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    body = gzip.decompress(b''.join(response))
+    assert json.loads(body) == list(_numbers(10))
@@ -0,0 +1,124 @@
+import asyncio
+import contextlib
+import itertools
+from collections.abc import AsyncIterator
+from typing import Final
+
+import pytest
+
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.streaming import StreamingResponse
+from dmr.streaming.jsonl import JsonLinesController
+from dmr.streaming.read_ahead import ReadAheadStats
+from dmr.test import DMRAsyncRequestFactory
+from tests.infra.streaming import get_streaming_content
+
+_SEND_TIMEOUT: Final = 0.05
+
+
+class _ReadAheadJsonLines(JsonLinesController[PydanticSerializer]):
+    streaming_read_ahead = 2
+
+    async def get(self) -> AsyncIterator[int]:
+        return self._numbers()
+
+    async def _numbers(self) -> AsyncIterator[int]:
+        for number in range(5):
+            yield number
+
+
+async def _stream(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    controller: type[JsonLinesController[PydanticSerializer]],
+) -> StreamingResponse:
+    response = await dmr_async_rf.wrap(
+        controller.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+    assert isinstance(response, StreamingResponse)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_read_ahead(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that events are prepared while the client is busy."""
+    response = await _stream(dmr_async_rf, _ReadAheadJsonLines)
+    stream: AsyncIterator[bytes] = aiter(response)  # type: ignore[arg-type]
+
+    assert await anext(stream) == b'0\n'
+
+    # Client is busy sending the first event:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert response.read_ahead_buffer is not None
+    assert response.read_ahead_buffer.stats() == ReadAheadStats(
+        queued_events=2,
+        queued_bytes=4,
+        peak_events=2,
+        peak_bytes=4,
+    )
+    assert [chunk async for chunk in stream] == [b'1\n', b'2\n', b'3\n', b'4\n']
+
+
+@pytest.mark.asyncio
+async def test_read_ahead_send_timeout(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that clients are disconnected when a send never completes."""
+    events_closed = asyncio.Event()
+
+    class _EndlessJsonLines(JsonLinesController[PydanticSerializer]):
+        streaming_send_timeout = _SEND_TIMEOUT
+
+        async def get(self) -> AsyncIterator[int]:
+            return self._numbers()
+
+        async def _numbers(self) -> AsyncIterator[int]:
+            try:  # noqa: WPS501
+                for number in itertools.count():
+                    yield number
+            finally:
+                events_closed.set()
+
+    response = await _stream(dmr_async_rf, _EndlessJsonLines)
+    stream: AsyncIterator[bytes] = aiter(response)  # type: ignore[arg-type]
+    sent: list[bytes] = []
+
+    async def _stalled_client() -> None:
+        # Just like the ASGI handler sends streaming responses:
+        async with contextlib.aclosing(stream):  # type: ignore[type-var]
+            async for chunk in stream:
+                sent.append(chunk)
+                # Client stopped reading, send never completes:
+                await asyncio.Event().wait()
+
+    sending = asyncio.create_task(_stalled_client())
+    await asyncio.wait({sending}, timeout=_SEND_TIMEOUT * 10)
+
+    assert sending.cancelled()
+    assert sent == [b'0\n']
+    assert events_closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_read_ahead_producer_error(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that producer errors are raised to the server."""
+
+    class _BrokenJsonLines(JsonLinesController[PydanticSerializer]):
+        streaming_read_ahead = 2
+
+        async def get(self) -> AsyncIterator[int]:
+            return self._numbers()
+
+        async def _numbers(self) -> AsyncIterator[int]:
+            yield 1
+            raise ZeroDivisionError
+
+    response = await _stream(dmr_async_rf, _BrokenJsonLines)
+
+    with pytest.raises(ZeroDivisionError):
+        await get_streaming_content(response)
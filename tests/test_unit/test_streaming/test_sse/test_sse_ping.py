@@ -1,7 +1,7 @@
 import asyncio
 from collections.abc import AsyncIterator
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Final
 
 import pydantic
 import pytest
@@ -14,6 +14,8 @@ from dmr.streaming.sse import SSEController, SSEvent
 from dmr.test import DMRAsyncRequestFactory
 from tests.infra.streaming import get_streaming_content
 
+_EVENT_DELAY: Final = 0.2
+
 
 class _BodyModel(pydantic.BaseModel):
     produce_last: bool = False
@@ -124,3 +126,31 @@ async def test_sse_ping_with_last(
         b'data: 3\r\n'
         b'\r\n'
     )
+
+
+class _FastSSE(SSEController[PydanticSerializer]):
+    streaming_ping_seconds = 0.5
+
+    async def get(self) -> AsyncIterator[SSEvent[int]]:
+        return self._valid_events()
+
+    async def _valid_events(self) -> AsyncIterator[SSEvent[int]]:
+        for number in range(3):
+            # Each event moves the ping deadline:
+            await asyncio.sleep(_EVENT_DELAY)
+            yield SSEvent(number)
+
+
+@pytest.mark.asyncio
+async def test_sse_ping_deadline_moved(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that events sent in time postpone the ping."""
+    request = dmr_async_rf.get('/whatever/')
+
+    response = await dmr_async_rf.wrap(_FastSSE.as_view()(request))
+
+    assert isinstance(response, StreamingResponse)
+    assert await get_streaming_content(response) == (
+        b'data: 0\r\n\r\ndata: 1\r\n\r\ndata: 2\r\n\r\n'
+    )
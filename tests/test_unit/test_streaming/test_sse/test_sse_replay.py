@@ -0,0 +1,88 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+import pytest
+from typing_extensions import override
+
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.streaming import StreamingResponse
+from dmr.streaming.sse import SSEController, SSEvent
+from dmr.streaming.sse.replay import ReplayBuffer
+from dmr.test import DMRAsyncRequestFactory
+from tests.infra.streaming import get_streaming_content
+
+
+async def _live_events(
+    numbers: Sequence[int],
+) -> AsyncIterator[SSEvent[int | str]]:
+    for number in numbers:
+        yield SSEvent(number, id=number)
+
+
+def _rendered(*numbers: int) -> bytes:
+    return b''.join(
+        f'id: {number}\r\ndata: {number}\r\n\r\n'.encode() for number in numbers
+    )
+
+
+async def _stream(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    controller: type[SSEController[PydanticSerializer]],
+    headers: dict[str, str] | None = None,
+) -> bytes:
+    response = await dmr_async_rf.wrap(
+        controller.as_view()(dmr_async_rf.get('/whatever/', headers=headers)),
+    )
+    assert isinstance(response, StreamingResponse)
+    return await get_streaming_content(response)
+
+
+@pytest.mark.asyncio
+async def test_sse_replay(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that reconnecting clients only get missed events."""
+    replay_buffer = ReplayBuffer(maxlen=2)
+    live_numbers = [1, 2, 3]
+
+    class _ReplaySSE(SSEController[PydanticSerializer]):
+        async def get(self) -> AsyncIterator[SSEvent[int | str]]:
+            return self.replay_events(
+                _live_events(live_numbers),
+                replay_buffer,
+            )
+
+    assert await _stream(dmr_async_rf, _ReplaySSE) == _rendered(1, 2, 3)
+    assert len(replay_buffer) == 2
+
+    live_numbers.clear()
+    live_numbers.extend((3, 4))
+
+    assert await _stream(
+        dmr_async_rf,
+        _ReplaySSE,
+        headers={'Last-Event-ID': '2'},
+    ) == _rendered(3, 4)
+    assert replay_buffer.since('3') == [('4', _rendered(4))]
+
+
+@pytest.mark.asyncio
+async def test_sse_replay_miss(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that evicted ids are handled by the fallback hook."""
+    replay_buffer = ReplayBuffer(maxlen=1)
+
+    class _SnapshotSSE(SSEController[PydanticSerializer]):
+        async def get(self) -> AsyncIterator[SSEvent[int | str]]:
+            return self.replay_events(_live_events([5]), replay_buffer)
+
+        @override
+        async def handle_replay_miss(self, last_event_id: str) -> list[Any]:
+            return [SSEvent('snapshot', id=last_event_id)]
+
+    assert await _stream(
+        dmr_async_rf,
+        _SnapshotSSE,
+        headers={'Last-Event-ID': '1'},
+    ) == (b'id: 1\r\ndata: "snapshot"\r\n\r\nid: 5\r\ndata: 5\r\n\r\n')
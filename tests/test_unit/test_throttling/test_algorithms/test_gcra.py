@@ -0,0 +1,121 @@
+import json
+from http import HTTPStatus
+from typing import Final
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticFastSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+from dmr.throttling import AsyncThrottle, SyncThrottle, ThrottlingReport
+from dmr.throttling.algorithms import GenericCellRate
+
+_ATTEMPTS: Final = 2
+_RATE: Final = 10
+
+
+class _SyncController(Controller[PydanticFastSerializer]):
+    throttling = [
+        SyncThrottle(_ATTEMPTS, _RATE, algorithm=GenericCellRate()),
+    ]
+
+    def get(self) -> dict[str, str]:
+        return ThrottlingReport(self).report()
+
+
+def test_gcra_burst_and_reject(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that a burst of ``max_requests`` is allowed."""
+    for remaining, reset in (('1', '5'), ('0', '5')):
+        response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+        report = json.loads(response.content)
+        assert report['X-RateLimit-Remaining'] == remaining
+        assert report['X-RateLimit-Reset'] == reset
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Remaining'] == '0'
+    assert response.headers['Retry-After'] == str(_RATE // _ATTEMPTS)
+
+
+def test_gcra_smooth_emission(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that requests are allowed again after the emission interval."""
+    for _ in range(_ATTEMPTS):
+        response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+        assert response.status_code == HTTPStatus.OK
+
+    freezer.tick(delta=_RATE // _ATTEMPTS - 1)
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['Retry-After'] == '1'
+
+    freezer.tick(delta=1)
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert json.loads(response.content)['X-RateLimit-Remaining'] == '0'
+
+
+def test_gcra_state_size(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that only the theoretical arrival time is stored."""
+    cache_set = MagicMock(wraps=cache.set)
+    monkeypatch.setattr(cache, 'set', cache_set)
+
+    class _StateController(Controller[PydanticFastSerializer]):
+        throttling = [
+            SyncThrottle(_ATTEMPTS, _RATE, algorithm=GenericCellRate()),
+        ]
+
+        def get(self) -> dict[str, str]:
+            return ThrottlingReport(self).report()
+
+    response = _StateController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert cache_set.call_count == 1
+    # Version byte and the theoretical arrival time only:
+    assert len(cache_set.call_args.args[1]) == 9
+
+
+@pytest.mark.asyncio
+async def test_gcra_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that async throttles work with GCRA."""
+
+    class _AsyncController(Controller[PydanticFastSerializer]):
+        throttling = [
+            AsyncThrottle(1, _RATE, algorithm=GenericCellRate()),
+        ]
+
+        async def get(self) -> str:
+            return 'inside'
+
+    for status_code in (HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == status_code
@@ -0,0 +1,245 @@
+import datetime as dt
+import json
+from http import HTTPStatus
+from typing import Final
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
+
+from dmr import Controller
+from dmr.exceptions import EndpointMetadataError, InternalServerError
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+from dmr.throttling import AsyncThrottle, Rate, SyncThrottle, ThrottlingReport
+from dmr.throttling.algorithms import LeakyBucket
+from dmr.throttling.backends import AsyncDjangoCache, SyncDjangoCache
+from dmr.throttling.cache_keys import RemoteAddr
+from dmr.throttling.headers import RateLimitIETFDraft
+
+# 50 seconds before the end of the minute window:
+_NOW: Final = dt.datetime(2020, 1, 1, 0, 0, 10, tzinfo=dt.UTC)  # noqa: WPS432
+_WINDOW_LEFT: Final = 50
+_WINDOW_START: Final = dt.datetime(2020, 1, 1, tzinfo=dt.UTC)  # noqa: WPS432
+
+
+class _SyncController(Controller[PydanticSerializer]):
+    throttling = [
+        SyncThrottle(2, Rate.minute, backend=SyncDjangoCache(atomic=True)),
+    ]
+
+    def get(self) -> dict[str, str]:
+        return ThrottlingReport(self).report()
+
+
+def test_atomic_sync(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that atomic counters limit requests in clock windows."""
+    freezer.move_to(_NOW)
+
+    for remaining in ('1', '0'):
+        response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+        report = json.loads(response.content)
+        assert report['X-RateLimit-Remaining'] == remaining
+        assert report['X-RateLimit-Reset'] == str(_WINDOW_LEFT)
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Remaining'] == '0'
+    assert response.headers['X-RateLimit-Reset'] == str(_WINDOW_LEFT)
+    assert response.headers['Retry-After'] == str(_WINDOW_LEFT)
+
+    freezer.tick(delta=_WINDOW_LEFT)
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content)['X-RateLimit-Reset'] == '60'
+
+
+@pytest.mark.asyncio
+async def test_atomic_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensures that async atomic counters limit requests in clock windows."""
+    freezer.move_to(_NOW)
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        throttling = [
+            AsyncThrottle(
+                1,
+                Rate.minute,
+                backend=AsyncDjangoCache(atomic=True),
+            ),
+        ]
+
+        async def get(self) -> dict[str, str]:
+            return await ThrottlingReport(self).areport()
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content)['X-RateLimit-Remaining'] == '0'
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['Retry-After'] == str(_WINDOW_LEFT)
+
+
+def test_atomic_counter_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensures that counters expired between `add` and `incr` are re-added."""
+    backend = SyncDjangoCache(atomic=True)
+    monkeypatch.setattr(
+        backend._cache,
+        'add',
+        MagicMock(side_effect=[False, True]),
+    )
+    monkeypatch.setattr(
+        backend._cache,
+        'incr',
+        MagicMock(side_effect=ValueError),
+    )
+
+    assert backend._incr_counter('key', 1) == 1
+
+
+@pytest.mark.asyncio
+async def test_atomic_async_counter_expired(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that async expired counters are re-added."""
+    backend = AsyncDjangoCache(atomic=True)
+    monkeypatch.setattr(
+        backend._cache,
+        'aadd',
+        AsyncMock(side_effect=[False, True]),
+    )
+    monkeypatch.setattr(
+        backend._cache,
+        'aincr',
+        AsyncMock(side_effect=ValueError),
+    )
+
+    assert await backend._incr_counter('key', 1) == 1
+
+
+def test_atomic_counter_keeps_expiring(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that counters are not retried forever."""
+    backend = SyncDjangoCache(atomic=True)
+    add = MagicMock(return_value=False)
+    monkeypatch.setattr(backend._cache, 'add', add)
+    monkeypatch.setattr(
+        backend._cache,
+        'incr',
+        MagicMock(side_effect=ValueError),
+    )
+
+    with pytest.raises(InternalServerError, match='3 times'):
+        backend._incr_counter('key', 1)
+
+    assert add.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_atomic_async_counter_keeps_expiring(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that async counters are not retried forever."""
+    backend = AsyncDjangoCache(atomic=True)
+    monkeypatch.setattr(
+        backend._cache,
+        'aadd',
+        AsyncMock(return_value=False),
+    )
+    monkeypatch.setattr(
+        backend._cache,
+        'aincr',
+        AsyncMock(side_effect=ValueError),
+    )
+
+    with pytest.raises(InternalServerError, match='3 times'):
+        await backend._incr_counter('key', 1)
+
+
+@pytest.mark.parametrize(
+    'throttle_type',
+    [SyncThrottle, AsyncThrottle],
+)
+def test_atomic_unsupported_algorithm(
+    throttle_type: type[SyncThrottle] | type[AsyncThrottle],
+) -> None:
+    """Ensures that atomic counters require fixed windows."""
+    backend = (
+        SyncDjangoCache(atomic=True)
+        if throttle_type is SyncThrottle
+        else AsyncDjangoCache(atomic=True)
+    )
+
+    with pytest.raises(EndpointMetadataError, match='fixed windows'):
+        throttle_type(
+            1,
+            Rate.second,
+            backend=backend,  # type: ignore[arg-type]
+            algorithm=LeakyBucket(),
+        )
+
+
+@pytest.mark.parametrize('atomic', [True, False])
+def test_atomic_reports_all_throttles(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+    *,
+    atomic: bool,
+) -> None:
+    """Ensures that atomic counters report all throttles on ``429``."""
+    # Both kinds of windows end at the same time:
+    freezer.move_to(_WINDOW_START)
+
+    class _MultipleController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(
+                1,
+                Rate.minute,
+                backend=SyncDjangoCache(atomic=atomic),
+                response_headers=[RateLimitIETFDraft()],
+                cache_key=RemoteAddr(name='one'),
+            ),
+            SyncThrottle(
+                5,
+                Rate.minute,
+                backend=SyncDjangoCache(atomic=atomic),
+                response_headers=[RateLimitIETFDraft()],
+                cache_key=RemoteAddr(name='two'),
+            ),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    _MultipleController.as_view()(dmr_rf.get('/whatever/'))
+    response = _MultipleController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['RateLimit-Policy'] == (
+        '1;w=60;name="one", 5;w=60;name="two"'
+    )
+    assert response.headers['RateLimit'] == '"one";r=0;t=60'
@@ -0,0 +1,65 @@
+import json
+import sys
+import time
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from freezegun.api import FrozenDateTimeFactory
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRRequestFactory
+from dmr.throttling import Rate, SyncThrottle, ThrottlingReport
+from dmr.throttling.backends import CachedRateLimit, SyncDjangoCache
+
+
+@pytest.mark.parametrize(
+    'cache_object',
+    [
+        CachedRateLimit(time=1, history=[]),
+        CachedRateLimit(time=1, history=[5]),
+        CachedRateLimit(time=-1, history=[0, sys.maxsize]),
+    ],
+)
+def test_binary_state_roundtrip(cache_object: CachedRateLimit) -> None:
+    """Ensures that the binary state is read back as it was written."""
+    backend = SyncDjangoCache()
+    stored_cache = backend._dump_cache(cache_object)
+
+    assert stored_cache[:1] == b'\x01'
+    assert backend._load_cache(None, stored_cache) == cache_object  # type: ignore[arg-type]
+
+
+def test_legacy_json_state(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that the JSON state from older versions is still read."""
+    cache_set = MagicMock(wraps=cache.set)
+    monkeypatch.setattr(cache, 'set', cache_set)
+
+    class _Controller(Controller[PydanticSerializer]):
+        throttling = [SyncThrottle(3, Rate.minute)]
+
+        def get(self) -> dict[str, str]:
+            return ThrottlingReport(self).report()
+
+    response = _Controller.as_view()(dmr_rf.get('/whatever/'))
+
+    assert response.status_code == HTTPStatus.OK
+    cache_key = cache_set.call_args.args[0]
+    legacy_state = {'time': int(time.time()) + 10, 'history': [2]}
+    cache.set(cache_key, json.dumps(legacy_state).encode())
+
+    response = _Controller.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    report = json.loads(response.content)
+    assert report['X-RateLimit-Remaining'] == '0'
+    assert report['X-RateLimit-Reset'] == '10'
+    assert cache.get(cache_key)[:1] == b'\x01'
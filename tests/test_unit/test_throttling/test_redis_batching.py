@@ -0,0 +1,105 @@
+import asyncio
+import time
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from django.http import HttpResponse
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRAsyncRequestFactory
+from dmr.throttling import AsyncThrottle, Rate
+from dmr.throttling.backends.redis import AsyncRedis, _ScriptBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_batched(
+    dmr_async_rf: DMRAsyncRequestFactory,
+) -> None:
+    """Ensures that concurrent checks are sent with a single pipeline."""
+    expire_at = int(time.time()) + 60
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(
+        return_value=[
+            (1, 1, expire_at, 1),
+            (1, 1, expire_at, 1),
+            (0, 1, expire_at, 0),
+        ],
+    )
+    client = MagicMock()
+    client.pipeline.return_value = pipeline
+    script = AsyncMock()
+    client.register_script.return_value = script
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        throttling = [
+            AsyncThrottle(
+                1,
+                Rate.minute,
+                backend=AsyncRedis(client, batch_delay=0),
+            ),
+        ]
+
+        async def get(self) -> str:
+            return 'inside'
+
+    responses = await asyncio.gather(*[
+        dmr_async_rf.wrap(
+            _AsyncController.as_view()(
+                dmr_async_rf.get('/whatever/', REMOTE_ADDR=remote_addr),
+            ),
+        )
+        for remote_addr in ('127.0.0.1', '127.0.0.2', '127.0.0.1')
+    ])
+
+    assert [
+        response.status_code
+        for response in responses
+        if isinstance(response, HttpResponse)
+    ] == [HTTPStatus.OK, HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS]
+    assert pipeline.execute.await_count == 1
+    assert script.await_count == 3
+    assert script.await_args is not None
+    assert script.await_args.kwargs['client'] is pipeline
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_propagated() -> None:
+    """Ensures that pipeline errors are raised for all waiters."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(side_effect=ConnectionError)
+    client = MagicMock()
+    client.pipeline.return_value = pipeline
+    batcher = _ScriptBatcher(client, 0.001)  # noqa: WPS432
+
+    script_results = await asyncio.gather(
+        batcher(AsyncMock(), keys=['first'], args=[1]),
+        batcher(AsyncMock(), keys=['second'], args=[1]),
+        return_exceptions=True,
+    )
+
+    assert [type(script_result) for script_result in script_results] == [
+        ConnectionError,
+        ConnectionError,
+    ]
+    assert pipeline.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_script_errors() -> None:
+    """Ensures that script errors are raised only for their waiters."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(return_value=[ValueError(), (1, 1, 1, 1)])
+    client = MagicMock()
+    client.pipeline.return_value = pipeline
+    batcher = _ScriptBatcher(client, 0)
+
+    script_results = await asyncio.gather(
+        batcher(AsyncMock(), keys=['first'], args=[1]),
+        batcher(AsyncMock(), keys=['second'], args=[1]),
+        return_exceptions=True,
+    )
+
+    assert isinstance(script_results[0], ValueError)
+    assert script_results[1] == (1, 1, 1, 1)
@@ -0,0 +1,129 @@
+import time
+from http import HTTPStatus
+from typing import Final
+from unittest.mock import MagicMock
+
+import pytest
+from django.http import HttpResponse
+
+from dmr import Controller
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.test import DMRRequestFactory
+from dmr.throttling import Rate, SyncThrottle
+from dmr.throttling.backends.redis import SyncRedis, _Lease, _LocalLeases
+
+_MAX_REQUESTS: Final = 5
+
+
+def test_leases_used_locally(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that leased requests do not call Redis."""
+    expire_at = int(time.time()) + 60
+    script = MagicMock(
+        side_effect=[
+            (1, 3, expire_at, 3, 60),
+            (1, 5, expire_at, 2, 60),
+            (0, 5, expire_at, 0, 60),
+        ],
+    )
+    client = MagicMock()
+    client.register_script.return_value = script
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(
+                _MAX_REQUESTS,
+                Rate.minute,
+                backend=SyncRedis(client, lease_size=3),
+            ),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    for _ in range(_MAX_REQUESTS):
+        response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Remaining'] == '0'
+    assert script.call_count == 3
+    assert script.call_args.kwargs['args'] == [_MAX_REQUESTS, 60, 0, 3]
+
+
+def test_leases_expired() -> None:
+    """Ensures that expired leases are not used."""
+    leases = _LocalLeases()
+    leases.store(
+        'key',
+        _Lease(units=2, current=3, expire_at=0, deadline=time.monotonic()),
+    )
+
+    assert leases.take('key') is None
+    assert leases.unused('key') == 2
+
+
+def test_leases_pruned(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensures that the number of stored leases is bounded."""
+    monkeypatch.setattr('dmr.throttling.backends.redis._MAX_LEASES', 2)
+    deadline = time.monotonic() + 60
+    leases = _LocalLeases()
+    leases.store(
+        'expired',
+        _Lease(units=1, current=1, expire_at=0, deadline=time.monotonic()),
+    )
+    for cache_key in ('oldest', 'new', 'newest'):
+        leases.store(
+            cache_key,
+            _Lease(units=1, current=1, expire_at=0, deadline=deadline),
+        )
+
+    assert leases.unused('expired') == 0
+    assert leases.unused('oldest') == 0
+    assert leases.take('new') is not None
+    assert leases.take('newest') is not None
+
+
+def test_leases_server_clock_skew(
+    dmr_rf: DMRRequestFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that leases expire by the local clock, not the Redis one."""
+    # Redis server clock is far behind the local one:
+    script = MagicMock(return_value=(1, 3, 0, 3, 60))
+    client = MagicMock()
+    client.register_script.return_value = script
+    monotonic = time.monotonic()
+    monkeypatch.setattr(time, 'monotonic', lambda: monotonic)
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(
+                _MAX_REQUESTS,
+                Rate.minute,
+                backend=SyncRedis(client, lease_size=3),
+            ),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    for _ in range(2):
+        response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == HTTPStatus.OK, response.content
+
+    assert script.call_count == 1
+
+    # The last leased request is not used after the window ends:
+    monotonic += 60
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert script.call_count == 2
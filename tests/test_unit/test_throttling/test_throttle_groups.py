@@ -0,0 +1,201 @@
+import time
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from redis.cluster import RedisCluster
+from typing_extensions import override
+
+from dmr import Controller
+from dmr.controller import Controller as BaseController
+from dmr.endpoint import Endpoint
+from dmr.plugins.pydantic import PydanticSerializer
+from dmr.serializer import BaseSerializer
+from dmr.test import DMRAsyncRequestFactory, DMRRequestFactory
+from dmr.throttling import AsyncThrottle, Rate, SyncThrottle
+from dmr.throttling.algorithms import LeakyBucket
+from dmr.throttling.backends import SyncDjangoCache
+from dmr.throttling.backends.redis import SyncRedis, _in_one_slot
+from dmr.throttling.cache_keys import UserPk
+
+
+class _CustomThrottle(SyncThrottle):
+    __slots__ = ()
+
+    @override
+    def __call__(
+        self,
+        endpoint: Endpoint,
+        controller: BaseController[BaseSerializer],
+        lock: Any,
+    ) -> None:
+        raise NotImplementedError
+
+
+def test_throttle_groups_built() -> None:
+    """Ensures that only consecutive compatible throttles are grouped."""
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(1, Rate.second),
+            SyncThrottle(5, Rate.minute),
+            SyncThrottle(5, Rate.minute, algorithm=LeakyBucket()),
+            SyncThrottle(5, Rate.minute, backend=SyncDjangoCache(atomic=True)),
+            _CustomThrottle(1, Rate.hour),
+            _CustomThrottle(1, Rate.day),
+            SyncThrottle(1, Rate.hour, cache_key=UserPk()),
+        ]
+
+        def get(self) -> str:
+            raise NotImplementedError
+
+    metadata = _SyncController.api_endpoints['GET'].metadata
+
+    assert metadata.throttle_groups_before_auth is not None
+    assert [
+        len(group.throttles) for group in metadata.throttle_groups_before_auth
+    ] == [2, 1, 1, 1, 1]
+    assert metadata.throttle_groups_after_auth is not None
+    assert len(metadata.throttle_groups_after_auth) == 1
+
+
+def test_django_cache_group_sync(
+    dmr_rf: DMRRequestFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that grouped throttles use one cache read and write."""
+    get_many = MagicMock(wraps=cache.get_many)
+    set_many = MagicMock(wraps=cache.set_many)
+    monkeypatch.setattr(cache, 'get_many', get_many)
+    monkeypatch.setattr(cache, 'set_many', set_many)
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(2, Rate.minute),
+            SyncThrottle(1, Rate.minute),
+            SyncThrottle(3, Rate.hour),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert get_many.call_count == 1
+    # One write for each distinct ttl:
+    assert set_many.call_count == 2
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Limit'] == '1'
+    assert get_many.call_count == 2
+    # Only the first allowed throttle is saved, the third one is not checked:
+    assert set_many.call_count == 3
+    assert len(set_many.call_args.args[0]) == 1
+
+
+@pytest.mark.asyncio
+async def test_django_cache_group_async(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that grouped async throttles use one cache read and write."""
+    get_many = AsyncMock(wraps=cache.aget_many)
+    monkeypatch.setattr(cache, 'aget_many', get_many)
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        throttling = [
+            AsyncThrottle(2, Rate.minute),
+            AsyncThrottle(1, Rate.minute),
+        ]
+
+        async def get(self) -> str:
+            return 'inside'
+
+    for status_code in (HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS):
+        response = await dmr_async_rf.wrap(
+            _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+        )
+
+        assert isinstance(response, HttpResponse)
+        assert response.status_code == status_code, response.content
+
+    assert get_many.await_count == 2
+
+
+def test_redis_group_sync(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that grouped throttles use one Redis script call."""
+    expire_at = int(time.time()) + 60
+    script = MagicMock(
+        return_value=[(1, 1, expire_at, 1), (0, 1, expire_at, 0)],
+    )
+    client = MagicMock()
+    client.register_script.return_value = script
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(2, Rate.minute, backend=SyncRedis(client)),
+            SyncThrottle(1, Rate.minute, backend=SyncRedis(client)),
+            SyncThrottle(1, Rate.hour, backend=SyncRedis(client)),
+        ]
+
+        def get(self) -> str:
+            raise NotImplementedError
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers['X-RateLimit-Limit'] == '1'
+    assert script.call_count == 1
+    assert len(script.call_args.kwargs['keys']) == 3
+    assert script.call_args.kwargs['args'] == [
+        2,
+        60,
+        0,
+        1,
+        1,
+        60,
+        0,
+        1,
+        1,
+        3600,
+        0,
+        1,
+    ]
+
+
+def test_redis_cluster_group_sync(dmr_rf: DMRRequestFactory) -> None:
+    """Ensures that cluster keys from different slots are checked one by one."""
+    expire_at = int(time.time()) + 60
+    script = MagicMock(return_value=(1, 1, expire_at, 1))
+    client = MagicMock(spec=RedisCluster)
+    client.register_script.return_value = script
+
+    class _SyncController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(2, Rate.minute, backend=SyncRedis(client)),
+            SyncThrottle(1, Rate.hour, backend=SyncRedis(client)),
+        ]
+
+        def get(self) -> str:
+            return 'inside'
+
+    response = _SyncController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK
+    assert script.call_count == 2
+    assert [
+        len(script_call.kwargs['keys']) for script_call in script.call_args_list
+    ] == [1, 1]
+    # Keys with a common hash tag can be checked together:
+    assert _in_one_slot(client, ['{user-1}::minute', '{user-1}::hour'])
+    assert not _in_one_slot(client, ['user-1::minute', 'user-1::hour'])
@@ -2,9 +2,11 @@ import json
 from collections.abc import Mapping
 from http import HTTPStatus
 from typing import Annotated, Any, Final
+from unittest.mock import AsyncMock, MagicMock
 
 import pydantic
 import pytest
+from django.core.cache import cache
 from django.http import HttpResponse
 from freezegun.api import FrozenDateTimeFactory
 from inline_snapshot import snapshot
@@ -437,3 +439,67 @@ async def test_leaky_bucket_async(
         'Content-Type': 'application/json',
     }
     assert json.loads(response.content) == 'inside'
+
+
+def test_report_reuses_checked_usage(
+    dmr_rf: DMRRequestFactory,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that reports reuse the state from throttle checks."""
+    cache_get = MagicMock(wraps=cache.get)
+    monkeypatch.setattr(cache, 'get', cache_get)
+
+    class _CheckedController(Controller[PydanticSerializer]):
+        throttling = [
+            SyncThrottle(1, Rate.second),
+            SyncThrottle(5, Rate.minute),
+        ]
+
+        def get(self) -> dict[str, str]:
+            return ThrottlingReport(self).report()
+
+    response = _CheckedController.as_view()(dmr_rf.get('/whatever/'))
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == {
+        'X-RateLimit-Limit': '1, 5',
+        'X-RateLimit-Remaining': '0, 4',
+        'X-RateLimit-Reset': '1, 60',
+        'Retry-After': '1, 60',
+    }
+    # Only `get_many` of the check reads the cache, once per throttle:
+    assert cache_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_report_reuses_checked_usage(
+    dmr_async_rf: DMRAsyncRequestFactory,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensures that async reports reuse the state from throttle checks."""
+    cache_get = AsyncMock(wraps=cache.aget)
+    monkeypatch.setattr(cache, 'aget', cache_get)
+
+    class _AsyncController(Controller[PydanticSerializer]):
+        throttling = [AsyncThrottle(2, Rate.minute, algorithm=LeakyBucket())]
+
+        async def get(self) -> dict[str, str]:
+            return await ThrottlingReport(self).areport()
+
+    response = await dmr_async_rf.wrap(
+        _AsyncController.as_view()(dmr_async_rf.get('/whatever/')),
+    )
+
+    assert isinstance(response, HttpResponse)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert json.loads(response.content) == {
+        'X-RateLimit-Limit': '2',
+        'X-RateLimit-Remaining': '1',
+        'X-RateLimit-Reset': '30',
+        'Retry-After': '30',
+    }
+    # Only the check itself reads the cache:
+    assert cache_get.await_count == 1